@@ -8,23 +8,40 @@ porous materials.
 
 """
 
-from . import _skgraph
-from . import utils
-from . import core
-from . import models
-from . import topotools
-from . import network
-from . import phase
-from . import algorithms
-from . import solvers
-from . import integrators
-from . import io
-from . import contrib
-from . import visualization
+import importlib as _importlib
+import numpy as _np
 
+from . import utils
 from .utils import Workspace, Project
 
-import numpy as _np
+# The remaining subpackages are only imported when first accessed (PEP 562)
+# since they pull in heavy dependencies like numba, pandas and matplotlib
+_submodules = [
+    '_skgraph',
+    'core',
+    'models',
+    'topotools',
+    'network',
+    'phase',
+    'algorithms',
+    'solvers',
+    'integrators',
+    'io',
+    'contrib',
+    'visualization',
+]
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return _importlib.import_module('.' + name, __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals().keys()) + _submodules)
+
+
 _np.seterr(divide='ignore', invalid='ignore')
 
 __version__ = utils._get_version()
@@ -57,7 +57,15 @@ from . import operations
 from . import queries
 from . import simulations
 from . import tools
-from . import visualization
+
+
+def __getattr__(name):
+    # Plotting functions are only loaded when needed since matplotlib is slow
+    # to import
+    if name == 'visualization':
+        from . import visualization
+        return visualization
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def info(network):
@@ -1,7 +1,85 @@
+import os
 import numpy as np
 
 
-def cubic(shape, spacing=1, connectivity=6, node_prefix='node', edge_prefix='edge'):
+def _cubic_joints(connectivity=6):
+    r"""
+    Returns the pairs of slices that select the tail and head nodes of
+    each family of edges in a cubic lattice
+
+    Parameters
+    ----------
+    connectivity : int
+        The number of neighbors of each node. Options are 6, 14, 18, 20 and
+        26.
+
+    Returns
+    -------
+    joints : list of tuples
+        Each tuple contains the slices which, when applied to an array of
+        the same shape as the lattice, return the tail and head nodes of
+        one family of edges. The edges of the lattice are numbered by
+        concatenating the flattened families in this order.
+
+    """
+    s = np.s_
+    face_joints = [(s[:, :, :-1], s[:, :, 1:]),
+                   (s[:, :-1], s[:, 1:]),
+                   (s[:-1], s[1:])]
+
+    corner_joints = [(s[:-1, :-1, :-1], s[1:, 1:, 1:]),
+                     (s[:-1, :-1, 1:], s[1:, 1:, :-1]),
+                     (s[:-1, 1:, :-1], s[1:, :-1, 1:]),
+                     (s[1:, :-1, :-1], s[:-1, 1:, 1:])]
+
+    edge_joints = [(s[:, :-1, :-1], s[:, 1:, 1:]),
+                   (s[:, :-1, 1:], s[:, 1:, :-1]),
+                   (s[:-1, :, :-1], s[1:, :, 1:]),
+                   (s[1:, :, :-1], s[:-1, :, 1:]),
+                   (s[1:, 1:, :], s[:-1, :-1, :]),
+                   (s[1:, :-1, :], s[:-1, 1:, :])]
+
+    if connectivity == 6:
+        joints = face_joints
+    elif connectivity == 6 + 8:
+        joints = face_joints + corner_joints
+    elif connectivity == 6 + 12:
+        joints = face_joints + edge_joints
+    elif connectivity == 12 + 8:
+        joints = edge_joints + corner_joints
+    elif connectivity == 6 + 8 + 12:
+        joints = face_joints + corner_joints + edge_joints
+    else:
+        raise Exception("Invalid connectivity. Must be 6, 14, 18, 20 or 26.")
+    return joints
+
+
+def _joint_indices(shape, T, rows=slice(None)):
+    r"""
+    Returns the node indices selected by the slice ``T`` of a lattice with
+    the given shape, without creating the full array of indices. ``rows``
+    further selects a range along the first axis of the result.
+    """
+    T = np.index_exp[T] + (slice(None),)*(3 - len(np.index_exp[T]))
+    r = [np.arange(n)[t] for n, t in zip(shape, T)]
+    r[0] = r[0][rows]
+    return (r[0][:, None, None]*shape[1]*shape[2]
+            + r[1][None, :, None]*shape[2]
+            + r[2][None, None, :])
+
+
+def _empty(shape, dtype, filename=None):
+    r"""
+    Returns an empty array, which is memory-mapped to the given file if any
+    """
+    if filename is None:
+        return np.empty(shape, dtype=dtype)
+    return np.lib.format.open_memmap(filename, mode='w+', dtype=dtype,
+                                     shape=shape)
+
+
+def cubic(shape, spacing=1, connectivity=6, node_prefix='node',
+          edge_prefix='edge', memmap_dir=None):
     r"""
     Generate a simple cubic lattice
 
@@ -13,6 +91,14 @@ def cubic(shape, spacing=1, connectivity=6, node_prefix='node', edge_prefix='edg
     spacing : array_like or float
         The size of a unit cell in each direction. If an scalar is given it is
         applied in all 3 directions.
+    connectivity : int
+        The number of neighbors of each node. Options are 6 (default), 14,
+        18, 20 and 26.
+    memmap_dir : str, optional
+        If given, the coordinates and connections are written into
+        memory-mapped ``.npy`` files in this directory (as
+        ``<prefix>.coords.npy`` and ``<prefix>.conns.npy``), so that
+        lattices too large to fit in memory can be generated.
 
     Returns
     -------
@@ -20,63 +106,54 @@ def cubic(shape, spacing=1, connectivity=6, node_prefix='node', edge_prefix='edg
         A dictionary containing ``coords`` and ``conns`` of a cubic network with the
         specified spacing and connectivity.
 
+    Notes
+    -----
+    The arrays are filled in chunks of planes along the first axis, so
+    only one chunk is held in memory at a time.
+
     """
     # Take care of 1D/2D networks
     shape = np.array(shape, ndmin=1)
     shape = np.concatenate((shape, [1] * (3 - shape.size))).astype(int)
-    arr = np.atleast_3d(np.empty(shape))
     spacing = np.float64(spacing)
     if spacing.size == 2:
         spacing = np.concatenate((spacing, [1]))
     spacing = np.ones(3, dtype=float) * np.array(spacing, ndmin=1)
+    joints = _cubic_joints(connectivity)
+    files = {'coords': None, 'conns': None}
+    if memmap_dir is not None:
+        files['coords'] = os.path.join(memmap_dir, f"{node_prefix}.coords.npy")
+        files['conns'] = os.path.join(memmap_dir, f"{edge_prefix}.conns.npy")
+    # Number of planes along the first axis to process at once
+    step = max(1, 2**20 // int(shape[1] * shape[2]))
 
-    z = np.tile(np.arange(shape[2]), shape[0] * shape[1])
-    y = np.tile(np.repeat(np.arange(shape[1]), shape[2]), shape[0])
-    x = np.repeat(np.arange(shape[0]), shape[1] * shape[2])
-    points = (np.vstack([x, y, z]).T).astype(float) + 0.5
-
-    idx = np.arange(arr.size).reshape(arr.shape)
-
-    face_joints = [(idx[:, :, :-1], idx[:, :, 1:]),
-                   (idx[:, :-1], idx[:, 1:]),
-                   (idx[:-1], idx[1:])]
-
-    corner_joints = [(idx[:-1, :-1, :-1], idx[1:, 1:, 1:]),
-                     (idx[:-1, :-1, 1:], idx[1:, 1:, :-1]),
-                     (idx[:-1, 1:, :-1], idx[1:, :-1, 1:]),
-                     (idx[1:, :-1, :-1], idx[:-1, 1:, 1:])]
-
-    edge_joints = [(idx[:, :-1, :-1], idx[:, 1:, 1:]),
-                   (idx[:, :-1, 1:], idx[:, 1:, :-1]),
-                   (idx[:-1, :, :-1], idx[1:, :, 1:]),
-                   (idx[1:, :, :-1], idx[:-1, :, 1:]),
-                   (idx[1:, 1:, :], idx[:-1, :-1, :]),
-                   (idx[1:, :-1, :], idx[:-1, 1:, :])]
-
-    if connectivity == 6:
-        joints = face_joints
-    elif connectivity == 6 + 8:
-        joints = face_joints + corner_joints
-    elif connectivity == 6 + 12:
-        joints = face_joints + edge_joints
-    elif connectivity == 12 + 8:
-        joints = edge_joints + corner_joints
-    elif connectivity == 6 + 8 + 12:
-        joints = face_joints + corner_joints + edge_joints
-    else:
-        raise Exception("Invalid connectivity. Must be 6, 14, 18, 20 or 26.")
+    Nn = int(np.prod(shape))
+    points = _empty((Nn, 3), float, files['coords'])
+    for i in range(0, shape[0], step):
+        ind = _joint_indices(shape, np.s_[i:i+step]).reshape(-1)
+        x, yz = np.divmod(ind, shape[1] * shape[2])
+        y, z = np.divmod(yz, shape[2])
+        points[ind[0]:ind[-1]+1] = (np.vstack([x, y, z]).T + 0.5) * spacing
 
-    tails, heads = np.array([], dtype=int), np.array([], dtype=int)
-    for T, H in joints:
-        tails = np.concatenate((tails, T.flatten()))
-        heads = np.concatenate((heads, H.flatten()))
-    pairs = np.vstack([tails, heads]).T
-    # NOTE: pairs is already sorted for connectivity = 6
-    if connectivity != 6:
-        pairs = np.sort(pairs, axis=1)
+    sizes = [_joint_indices(shape, T).size for T, H in joints]
+    pairs = _empty((sum(sizes), 2), int, files['conns'])
+    start = 0
+    for (T, H), size in zip(joints, sizes):
+        nrows = len(range(shape[0])[np.index_exp[T][0]])
+        for i in range(0, nrows, step):
+            rows = slice(i, i + step)
+            tails = _joint_indices(shape, T, rows).reshape(-1)
+            heads = _joint_indices(shape, H, rows).reshape(-1)
+            stop = start + tails.size
+            pairs[start:stop, 0] = tails
+            pairs[start:stop, 1] = heads
+            # NOTE: pairs is already sorted for connectivity = 6
+            if connectivity != 6:
+                pairs[start:stop] = np.sort(pairs[start:stop], axis=1)
+            start = stop
 
     d = {}
-    d[f"{node_prefix}.coords"] = points * spacing
+    d[f"{node_prefix}.coords"] = points
     d[f"{edge_prefix}.conns"] = pairs
 
     return d
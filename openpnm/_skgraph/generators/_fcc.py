@@ -1,12 +1,10 @@
 import numpy as np
 import scipy.spatial as sptl
 import scipy.sparse as sprs
-from numba import njit
 from openpnm._skgraph.generators import cubic
 from openpnm._skgraph.tools import tri_to_am
 
 
-@njit
 def len_lil(lil):
     indptr = [len(i) for i in lil]
     return indptr
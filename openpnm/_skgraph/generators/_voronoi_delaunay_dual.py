@@ -1,13 +1,14 @@
 import scipy.spatial as sptl
-import scipy.sparse as sprs
 import numpy as np
 from openpnm._skgraph.generators import tools
 from openpnm._skgraph.operations import trim_nodes
 from openpnm._skgraph.tools import isoutside, conns_to_am
+from openpnm._skgraph.tools._funcs import _ridge_rings
 from openpnm._skgraph.queries import find_neighbor_nodes
 
 
 def voronoi_delaunay_dual(points, shape, trim=True, reflect=True, relaxation=0,
+                          tiles=None, processes=None,
                           node_prefix='node', edge_prefix='edge'):
     r"""
     Generate a dual Voronoi-Delaunay network from given base points
@@ -34,15 +35,35 @@ def voronoi_delaunay_dual(points, shape, trim=True, reflect=True, relaxation=0,
         To use the rigorous method, call the ``lloyd_relaxation`` function manually
         to obtain relaxed points, then pass the points directly to this funcion.
         The results are quite stable after only a few iterations.
+    tiles : int, optional
+        If given, the points are split into this many overlapping slabs along
+        the longest axis of the domain, which are triangulated separately
+        (in parallel) then stitched together. This is useful for very large
+        numbers of points. The default is ``None``, which tessellates all the
+        points at once.
+    processes : int, optional
+        The number of processes to use when ``tiles`` is given. The default
+        is ``None``, which uses all the available cores.
 
     Returns
     -------
     network : dict
         A dictionary containing '<node_prefix>.coords' and '<edge_prefix>.conns'
     vor : Voronoi object
-        The Voronoi tessellation object produced by ``scipy.spatial.Voronoi``
+        The Voronoi tessellation object produced by ``scipy.spatial.Voronoi``,
+        or ``None`` if ``tiles`` was given
     tri : Delaunay object
-        The Delaunay triangulation object produced ``scipy.spatial.Delaunay``
+        The Delaunay triangulation object produced ``scipy.spatial.Delaunay``,
+        or ``None`` if ``tiles`` was given
+
+    Notes
+    -----
+    When ``tiles`` is given the Voronoi vertices are found as the
+    circumcenters of the Delaunay simplices, so they may be numbered
+    differently than in the untiled network. The two networks are otherwise
+    the same when ``reflect`` is ``True``. Without reflection, the untiled
+    network also connects the Voronoi vertices at either end of each
+    unbounded ridge, which is not the case when tiled.
 
     """
     # Generate a set of base points if scalar was given
@@ -50,41 +71,38 @@ def voronoi_delaunay_dual(points, shape, trim=True, reflect=True, relaxation=0,
     # Generate mask to remove any dims with all 0's
     mask = ~np.all(points == 0, axis=0)
 
-    # Perform tessellations
-    vor = sptl.Voronoi(points=points[:, mask])
-    for _ in range(relaxation):
-        points = tools.lloyd_relaxation(vor, mode='fast')
+    if tiles is None:
+        # Perform tessellations
         vor = sptl.Voronoi(points=points[:, mask])
-    tri = sptl.Delaunay(points=points[:, mask])
+        for _ in range(relaxation):
+            points = tools.lloyd_relaxation(vor, mode='fast')
+            vor = sptl.Voronoi(points=points[:, mask])
+        tri = sptl.Delaunay(points=points[:, mask])
 
-    # Combine points
-    pts_all = np.vstack((vor.points, vor.vertices))
-    Nall = np.shape(pts_all)[0]
+        # Combine points
+        pts_all = np.vstack((vor.points, vor.vertices))
+        npoints = vor.npoints
 
-    # Create adjacency matrix in lil format for quick construction
-    am = sprs.lil_matrix((Nall, Nall))
-    for ridge in vor.ridge_dict.keys():
         # Make Delaunay-to-Delaunay connections
-        for i in ridge:
-            am.rows[i].extend([ridge[0], ridge[1]])
-        # Get Voronoi vertices for current ridge
-        row = vor.ridge_dict[ridge].copy()
-        # Index Voronoi vertex numbers by number of Delaunay points
-        row = [i + vor.npoints for i in row if i > -1]
+        DD = vor.ridge_points
+        # Get Voronoi vertices for each ridge, indexed by number of Delaunay
+        # points
+        verts, ridges, VV = _ridge_rings(vor.ridge_vertices, drop_negs=True)
         # Make Voronoi-to-Delaunay connections
-        for i in ridge:
-            am.rows[i].extend(row)
+        VD = np.vstack((np.tile(verts + npoints, 2),
+                        vor.ridge_points[ridges].T.flatten())).T
         # Make Voronoi-to-Voronoi connections
-        row.append(row[0])
-        for i in range(len(row)-1):
-            am.rows[row[i]].append(row[i+1])
-
-    # Finalize adjacency matrix by assigning data values
-    am.data = am.rows  # Values don't matter, only shape, so use 'rows'
-    # Convert to COO format for direct acces to row and col
-    am = am.tocoo()
-    # Extract rows and cols
-    conns = np.vstack((am.row, am.col)).T
+        conns = np.vstack((DD, VD, VV + npoints))
+    else:
+        vor, tri = None, None
+        pts = points[:, mask]
+        simplices = _tiled_delaunay(pts, tiles, processes)
+        for _ in range(relaxation):
+            pts = _relax_points(pts, simplices)
+            simplices = _tiled_delaunay(pts, tiles, processes)
+        verts, conns = _delaunay_to_dual(pts, simplices)
+        pts_all = np.vstack((pts, verts))
+        npoints = pts.shape[0]
 
     # Convert to sanitized adjacency matrix
     am = conns_to_am(conns)
@@ -110,16 +128,16 @@ def voronoi_delaunay_dual(points, shape, trim=True, reflect=True, relaxation=0,
 
     # Label all pores and throats by type
     network[node_prefix+'.delaunay'] = np.zeros(n_nodes, dtype=bool)
-    network[node_prefix+'.delaunay'][0:vor.npoints] = True
+    network[node_prefix+'.delaunay'][0:npoints] = True
     network[node_prefix+'.voronoi'] = np.zeros(n_nodes, dtype=bool)
-    network[node_prefix+'.voronoi'][vor.npoints:] = True
+    network[node_prefix+'.voronoi'][npoints:] = True
     # Label throats between Delaunay pores
     network[edge_prefix+'.delaunay'] = np.zeros(n_edges, dtype=bool)
-    Ts = np.all(network[edge_prefix+'.conns'] < vor.npoints, axis=1)
+    Ts = np.all(network[edge_prefix+'.conns'] < npoints, axis=1)
     network[edge_prefix+'.delaunay'][Ts] = True
     # Label throats between Voronoi pores
     network[edge_prefix+'.voronoi'] = np.zeros(n_edges, dtype=bool)
-    Ts = np.all(network[edge_prefix+'.conns'] >= vor.npoints, axis=1)
+    Ts = np.all(network[edge_prefix+'.conns'] >= npoints, axis=1)
     network[edge_prefix+'.voronoi'][Ts] = True
     # Label throats connecting a Delaunay and a Voronoi pore
     Ts = np.sum(network[node_prefix+'.delaunay'][conns].astype(int), axis=1) == 1
@@ -143,3 +161,275 @@ def voronoi_delaunay_dual(points, shape, trim=True, reflect=True, relaxation=0,
             network = trim_nodes(network=network, inds=inds)
 
     return network, vor, tri
+
+
+def _sort_rows(arr):
+    r"""
+    Sorts the values in each row of an integer array with 2 or 3 columns,
+    which is much faster than ``np.sort`` for such short rows
+    """
+    lo, hi = arr.min(axis=1), arr.max(axis=1)
+    if arr.shape[1] == 2:
+        return np.vstack((lo, hi)).T
+    return np.vstack((lo, arr.sum(axis=1) - lo - hi, hi)).T
+
+
+def _unique_rows(arr):
+    r"""
+    Returns the unique rows of an array sorted lexicographically, which is
+    faster than ``np.unique`` with ``axis=0``
+    """
+    arr = arr[np.lexsort(arr.T[::-1])]
+    keep = np.r_[True, np.any(arr[1:] != arr[:-1], axis=1)]
+    return arr[keep]
+
+
+def _circumspheres(points, simplices):
+    r"""
+    Finds the center and radius of the circumsphere of each simplex, as well
+    as which simplices are flat so their circumsphere is not defined
+    """
+    p0 = points[simplices[:, 0]]
+    A = points[simplices[:, 1:]] - p0[:, None, :]
+    b = (A**2).sum(axis=2)
+    # Solve A @ c = b/2 by Cramer's rule, relative to the first corner
+    if A.shape[1] == 2:
+        u, v = A[:, 0], A[:, 1]
+        det = u[:, 0]*v[:, 1] - u[:, 1]*v[:, 0]
+        c = np.vstack((v[:, 1]*b[:, 0] - u[:, 1]*b[:, 1],
+                       u[:, 0]*b[:, 1] - v[:, 0]*b[:, 0])).T
+    else:
+        u, v, w = A[:, 0], A[:, 1], A[:, 2]
+        vw, wu, uv = np.cross(v, w), np.cross(w, u), np.cross(u, v)
+        det = (u*vw).sum(axis=1)
+        c = b[:, 0:1]*vw + b[:, 1:2]*wu + b[:, 2:3]*uv
+    scale = np.abs(A).max(axis=(1, 2))
+    flat = np.abs(det) <= 1e-10*scale**A.shape[1]
+    c[~flat] = c[~flat]/(2*det[~flat, None])
+    c[flat] = (np.linalg.pinv(A[flat]) @ b[flat, :, None])[..., 0]/2
+    return c + p0, np.linalg.norm(c, axis=1), flat
+
+
+def _sorted_facets(simplices):
+    r"""
+    Returns the facets of all simplices sorted so that shared facets are
+    adjacent, along with the simplex each belongs to and a mask indicating
+    which facets are the same as the next one
+    """
+    n = simplices.shape[1]
+    facets = np.vstack([np.delete(simplices, i, axis=1) for i in range(n)])
+    facets = _sort_rows(facets)
+    owners = np.tile(np.arange(simplices.shape[0]), n)
+    N = facets.max() + 1
+    if N**(n - 1) < 2**62:  # Sort by a single key if it does not overflow
+        order = np.argsort(facets @ N**np.arange(n - 1), kind='stable')
+    else:
+        order = np.lexsort(facets.T)
+    facets, owners = facets[order], owners[order]
+    same = np.all(facets[1:] == facets[:-1], axis=1)
+    return facets, owners, same
+
+
+def _voronoi_vertices(points, simplices):
+    r"""
+    Finds the Voronoi vertices as the circumcenters of the Delaunay simplices,
+    merging neighboring simplices that share a circumsphere into a single
+    vertex as ``scipy.spatial.Voronoi`` does
+
+    Returns
+    -------
+    labels : ndarray
+        The Voronoi vertex of each simplex
+    verts : ndarray
+        The coordinates of the Voronoi vertices
+
+    """
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components
+    centers, radii, flat = _circumspheres(points, simplices)
+    _, owners, same = _sorted_facets(simplices)
+    a, b = owners[:-1][same], owners[1:][same]
+    # Merge neighbors whose circumcenters coincide
+    d = np.linalg.norm(centers[a] - centers[b], axis=1)
+    merge = ~flat[a] & ~flat[b] & (d <= 1e-8*radii[a])
+    # Flat simplices only arise between two such merged groups, which are
+    # neighbors in the Voronoi diagram, so join them to either group
+    a, b = np.where(flat[a], a, b), np.where(flat[a], b, a)
+    hits = np.where(flat[a] & ~flat[b])[0]
+    hits = hits[np.unique(a[hits], return_index=True)[1]]
+    merge[hits] = True
+    M = simplices.shape[0]
+    am = coo_matrix((np.ones(merge.sum()), (a[merge], b[merge])), shape=(M, M))
+    _, labels = connected_components(am, directed=False)
+    # Place each vertex at the average of the well defined circumcenters
+    w = ~flat + 1e-12
+    verts = np.vstack([np.bincount(labels, weights=w*centers[:, i])
+                       for i in range(points.shape[1])]).T
+    verts = verts/np.bincount(labels, weights=w)[:, None]
+    return labels, verts
+
+
+def _delaunay_to_dual(points, simplices):
+    r"""
+    Creates the Voronoi vertices and the connections of the dual network
+    from the Delaunay simplices, with the vertices numbered after the points
+    """
+    Np, n = points.shape[0], simplices.shape[1]
+    labels, verts = _voronoi_vertices(points, simplices)
+    # Make Voronoi-to-Delaunay connections to the corners of each simplex
+    VD = np.vstack((np.repeat(labels, n), simplices.flatten())).T
+    VD = _unique_rows(VD)
+    # Make Delaunay-to-Delaunay connections along the edges of the simplices,
+    # skipping those between points that only share a single merged vertex
+    i, j = np.triu_indices(n, k=1)
+    DD = _sort_rows(np.vstack((simplices[:, i].flatten(),
+                               simplices[:, j].flatten())).T)
+    DDV = _unique_rows(np.c_[DD, np.repeat(labels, i.size)])
+    new = np.r_[True, np.any(DDV[1:, :2] != DDV[:-1, :2], axis=1)]
+    DD, counts = DDV[new, :2], np.diff(np.r_[np.where(new)[0], len(DDV)])
+    hull = sptl.ConvexHull(points).simplices
+    k, m = np.triu_indices(hull.shape[1], k=1)
+    HH = _sort_rows(np.vstack((hull[:, k].flatten(), hull[:, m].flatten())).T)
+    on_hull = np.isin(DD[:, 0]*Np + DD[:, 1], HH[:, 0]*Np + HH[:, 1])
+    DD = DD[on_hull | (counts >= n - 1)]
+    # Make Voronoi-to-Voronoi connections between simplices sharing a facet
+    _, owners, same = _sorted_facets(simplices)
+    VV = np.vstack((labels[owners[:-1][same]], labels[owners[1:][same]])).T
+    conns = np.vstack((DD, VD + [Np, 0], VV + Np))
+    return verts, conns
+
+
+def _delaunay_tile(points, core, extent, axis, bounds):
+    r"""
+    Triangulates the points in one tile, and returns the simplices which
+    lie in the core of the tile, along with their circumspheres and whether
+    these lie within the tile, in which case they are certainly also
+    simplices of the full triangulation
+    """
+    simplices = sptl.Delaunay(points).simplices
+    centers, radii, flat = _circumspheres(points, simplices)
+    # Flat simplices have no circumsphere so are located by their centroid
+    x = np.where(flat, points[simplices, axis].mean(axis=1), centers[:, axis])
+    keep = (x >= core[0]) & (x < core[1])
+    simplices, centers, radii, flat, x = \
+        simplices[keep], centers[keep], radii[keep], flat[keep], x[keep]
+    # Only the part of each circumsphere inside the bounding box of all the
+    # points matters, which is thin for the large spheres on the hull
+    gap = np.clip(centers, bounds[0], bounds[1]) - centers
+    gap[:, axis] = 0
+    h = np.sqrt(np.clip(radii**2 - (gap**2).sum(axis=1), 0, None))
+    inside = flat | ((x - h >= extent[0]) & (x + h <= extent[1]))
+    return simplices, centers, radii, inside
+
+
+def _tiled_delaunay(points, tiles, processes=None):
+    r"""
+    Performs a Delaunay triangulation by triangulating overlapping slabs of
+    the points in parallel and stitching the results together
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    span = np.ptp(points, axis=0)
+    sample = np.linspace(0, points.shape[0] - 1, 1000).astype(int)
+    spacing = sptl.KDTree(points).query(points[sample], k=2)[0][:, 1].mean()
+    # Break ties between cospherical points, which are common when points are
+    # reflected, the same way in every tile so the tiles can be stitched
+    rng = np.random.default_rng(0)
+    points = points + rng.uniform(-1, 1, points.shape)*1e-6*spacing
+    tree = sptl.KDTree(points)
+    axis = np.argmax(span)
+    x = points[:, axis]
+    edges = np.quantile(x, np.linspace(0, 1, tiles + 1))
+    edges[0], edges[-1] = -np.inf, np.inf
+    bounds = (points.min(axis=0), points.max(axis=0))
+    hull = _sort_rows(sptl.ConvexHull(points).simplices)
+    hull = hull[np.lexsort(hull.T)]
+    margin = 4*spacing
+    while margin < span[axis]:
+        inds, args = [], []
+        for k in range(tiles):
+            lo = edges[k] - margin if k > 0 else -np.inf
+            hi = edges[k+1] + margin if k < tiles - 1 else np.inf
+            hits = np.where((x >= lo) & (x <= hi))[0]
+            inds.append(hits)
+            args.append((points[hits], edges[k:k+2], (lo, hi), axis, bounds))
+        if processes == 1:
+            results = [_delaunay_tile(*a) for a in args]
+        else:
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                results = list(pool.map(_delaunay_tile, *zip(*args)))
+        simplices = np.vstack([i[r[0]] for i, r in zip(inds, results)])
+        centers, radii, inside = [np.concatenate([r[i] for r in results])
+                                  for i in range(1, 4)]
+        # Circumspheres reaching beyond their tile may contain other points
+        keep = inside.copy()
+        keep[~inside] = _is_empty(tree, simplices[~inside], centers[~inside],
+                                  radii[~inside], 1e-9*spacing)
+        simplices = simplices[keep]
+        for _ in range(2):
+            # The stitched simplices form a complete triangulation if each
+            # facet is shared by two simplices, except those on the hull
+            facets, _, same = _sorted_facets(simplices)
+            single = ~(np.r_[same, False] | np.r_[False, same])
+            if np.any(same[1:] & same[:-1]):
+                break
+            if np.array_equal(facets[single], hull):
+                return simplices
+            # Simplices much longer than the margin, such as slivers on the
+            # hull, are missed by every tile, so the holes they leave are
+            # filled by triangulating the points around them
+            simplices = _fill_holes(points, simplices, facets[single], hull,
+                                    tree, 1e-9*spacing)
+        margin = 2*margin
+    # The tiles have grown to cover the whole domain
+    return sptl.Delaunay(points).simplices
+
+
+def _is_empty(tree, simplices, centers, radii, tol):
+    r"""
+    Checks that no points other than the vertices of each simplex lie
+    inside its circumsphere, to within the given tolerance
+    """
+    n = simplices.shape[1]
+    d, i = tree.query(centers, k=n + 1)
+    own = (i[:, :, None] == simplices[:, None, :]).any(axis=2)
+    d[own] = np.inf
+    return d.min(axis=1) >= radii - tol
+
+
+def _fill_holes(points, simplices, facets, hull, tree, tol):
+    r"""
+    Adds the missing simplices of a partial Delaunay triangulation, given
+    the facets which are not shared by two of its simplices
+    """
+    n = simplices.shape[1]
+    rows = np.vstack((facets, hull))
+    rows, counts = np.unique(rows, axis=0, return_counts=True)
+    # The vertices of the holes are on their boundaries unless no simplex
+    # touches them at all
+    Ps = np.union1d(rows[counts == 1].flatten(),
+                    np.setdiff1d(np.arange(points.shape[0]), simplices))
+    if Ps.size <= n:
+        return simplices
+    new = Ps[sptl.Delaunay(points[Ps]).simplices]
+    centers, radii, flat = _circumspheres(points, new)
+    new = new[~flat & _is_empty(tree, new, centers, radii, tol)]
+    return _unique_rows(np.sort(np.vstack((simplices, new)), axis=1))
+
+
+def _relax_points(points, simplices):
+    r"""
+    Moves each point to the average of its Voronoi vertices, except those
+    on the convex hull whose Voronoi cells are unbounded
+    """
+    labels, verts = _voronoi_vertices(points, simplices)
+    n = simplices.shape[1]
+    pairs = _unique_rows(np.vstack((simplices.flatten(),
+                                    np.repeat(labels, n))).T).T
+    counts = np.bincount(pairs[0], minlength=points.shape[0])
+    pts = np.vstack([np.bincount(pairs[0], weights=verts[pairs[1], i],
+                                 minlength=points.shape[0])
+                     for i in range(points.shape[1])]).T
+    pts = pts/np.maximum(counts, 1)[:, None]
+    hull = sptl.ConvexHull(points).vertices
+    pts[hull] = points[hull]
+    return pts
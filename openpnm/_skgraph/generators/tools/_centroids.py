@@ -0,0 +1,75 @@
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def cell_moments(points, vertices, ridge_points, verts, starts, counts):
+    r"""
+    Computes the volume and first moment of each Voronoi cell
+
+    Each cell is split into triangles (2D) or tetrahedra (3D) formed by its
+    base point and the fan triangulation of each of its ridges, which is
+    exact since the cells are convex and contain their base point.
+
+    Parameters
+    ----------
+    points : ndarray
+        The base points of the tessellation
+    vertices : ndarray
+        The Voronoi vertices
+    ridge_points : ndarray
+        The pair of base points on either side of each ridge
+    verts, starts, counts : ndarray
+        The flattened vertices of all ridges, and the location and number
+        of the vertices belonging to each ridge. The vertices of each ridge
+        must be ordered around its perimeter.
+
+    Returns
+    -------
+    vol : ndarray
+        The volume (or area in 2D) of each cell
+    mom : ndarray
+        The first moment of each cell, so that ``mom/vol`` is its centroid
+
+    Notes
+    -----
+    Ridges touching a vertex at infinity (-1) are skipped, so the results
+    are only meaningful for bounded cells.
+
+    """
+    Np, nd = points.shape
+    vol = np.zeros(Np)
+    mom = np.zeros((Np, nd))
+    for r in range(ridge_points.shape[0]):
+        n = counts[r]
+        s = starts[r]
+        skip = False
+        for k in range(n):
+            if verts[s + k] < 0:
+                skip = True
+        if skip or (n < nd):
+            continue
+        for side in range(2):
+            p = ridge_points[r, side]
+            a = points[p]
+            b = vertices[verts[s]]
+            if nd == 2:
+                c = vertices[verts[s + 1]]
+                v = abs((b[0] - a[0])*(c[1] - a[1])
+                        - (b[1] - a[1])*(c[0] - a[0]))/2
+                vol[p] += v
+                for i in range(nd):
+                    mom[p, i] += v*(a[i] + b[i] + c[i])/3
+                continue
+            for k in range(1, n - 1):
+                c = vertices[verts[s + k]]
+                d = vertices[verts[s + k + 1]]
+                ux, uy, uz = b[0] - a[0], b[1] - a[1], b[2] - a[2]
+                vx, vy, vz = c[0] - a[0], c[1] - a[1], c[2] - a[2]
+                wx, wy, wz = d[0] - a[0], d[1] - a[1], d[2] - a[2]
+                v = abs(ux*(vy*wz - vz*wy) - uy*(vx*wz - vz*wx)
+                        + uz*(vx*wy - vy*wx))/6
+                vol[p] += v
+                for i in range(nd):
+                    mom[p, i] += v*(a[i] + b[i] + c[i] + d[i])/4
+    return vol, mom
@@ -5,6 +5,7 @@ Tools
 """
 import numpy as np
 from openpnm._skgraph import tools
+from openpnm._skgraph.tools._funcs import _ridge_rings
 import scipy.spatial as sptl
 
 
@@ -43,12 +44,38 @@ def lloyd_relaxation(vor, mode='rigorous'):
                     approximation and is *much* faster.
         =========== ================================================================
 
+    Returns
+    -------
+    points : ndarray
+        The base points with those lying in bounded regions moved to the
+        center of mass of their region
+
+    Notes
+    -----
+    In 'rigorous' mode the regions are decomposed into simplices using the
+    ridges of the tessellation, so no additional tessellations are needed.
+
     """
-    pts = vor.points
-    for i, r in enumerate(vor.point_region):
-        if np.all(np.array(vor.regions[r]) > 0):
-            pts[i, :pts.shape[1]] = \
-                get_centroid(vor.vertices[vor.regions[r]], mode=mode)
+    pts = np.array(vor.points, dtype=float)
+    # Only bounded regions are relaxed
+    verts, regions, _ = _ridge_rings(vor.regions)
+    counts = np.bincount(regions, minlength=len(vor.regions))
+    bounded = np.bincount(regions, weights=verts <= 0,
+                          minlength=len(vor.regions)) == 0
+    hits = (bounded & (counts > 0))[vor.point_region]
+    if mode == 'rigorous':
+        from ._centroids import cell_moments
+        rverts, rridges, _ = _ridge_rings(vor.ridge_vertices)
+        rcounts = np.bincount(rridges, minlength=len(vor.ridge_vertices))
+        vol, mom = cell_moments(pts, vor.vertices, vor.ridge_points, rverts,
+                                np.cumsum(rcounts) - rcounts, rcounts)
+        pts[hits] = mom[hits]/vol[hits][:, None]
+    elif mode == 'fast':
+        sums = [np.bincount(regions, weights=vor.vertices[verts, i],
+                            minlength=len(vor.regions))
+                for i in range(pts.shape[1])]
+        CoM = np.vstack(sums).T/np.maximum(counts, 1)[:, None]
+        pts[hits] = CoM[vor.point_region[hits]]
     if pts.shape[1] == 2:
         pts = np.c_[pts, np.zeros_like(pts[:, 0])]
     return pts
@@ -1,2 +1,26 @@
 from ._funcs import *
-from ._qupc import *
+
+
+_qupc_funcs = [
+    'qupc_initialize',
+    'qupc_update',
+    'qupc_compress',
+    'qupc_reduce',
+]
+
+
+_segment_funcs = [
+    'segment_reduce',
+]
+
+
+def __getattr__(name):
+    # The union-find and segment helpers are compiled with numba, which is
+    # slow to import, so they are only loaded when first requested
+    if name in _qupc_funcs:
+        from . import _qupc
+        return getattr(_qupc, name)
+    if name in _segment_funcs:
+        from . import _segments
+        return getattr(_segments, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,7 @@
 import numpy as np
 import scipy.sparse as sprs
 from scipy.sparse import csgraph
-from openpnm._skgraph.tools import conns_to_am, dict_to_am, dict_to_im
+from openpnm._skgraph.tools import conns_to_am, dict_to_am
 from openpnm._skgraph.tools import istriu, isgtriu
 from openpnm._skgraph.tools import get_node_prefix, get_edge_prefix
 
@@ -12,6 +12,7 @@ __all__ = [
     'find_connecting_edges',
     'find_neighbor_nodes',
     'find_neighbor_edges',
+    'neighbors_from_csr',
     'find_connected_nodes',
     'find_complementary_nodes',
     'find_complementary_edges',
@@ -224,67 +225,19 @@ def find_neighbor_edges(network, inds, flatten=True, logic='or'):
     if global sites are considered.
 
     """
-    if flatten == False:
-        im = dict_to_im(network)
-        am = None
-    else:
-        am = dict_to_am(network)
-        im = None
-    if im is not None:
-        if im.format != 'lil':
-            im = im.tolil(copy=False)
-        rows = [im.rows[i] for i in np.array(inds, ndmin=1, dtype=np.int64)]
-        if len(rows) == 0:
-            return []
-        neighbors = np.hstack(rows).astype(np.int64)
-        n_bonds = int(im.nnz / 2)
-        if logic in ['or', 'union', 'any']:
-            neighbors = np.unique(neighbors)
-        elif logic in ['xor', 'exclusive_or']:
-            neighbors = np.unique(np.where(np.bincount(neighbors) == 1)[0])
-        elif logic in ['xnor', 'shared']:
-            neighbors = np.unique(np.where(np.bincount(neighbors) > 1)[0])
-        elif logic in ['and', 'all', 'intersection']:
-            neighbors = set(neighbors)
-            [neighbors.intersection_update(i) for i in rows]
-            neighbors = np.array(list(neighbors), dtype=int, ndmin=1)
-        else:
-            raise Exception('Specified logic is not implemented')
-        if (flatten is False):
-            if (neighbors.size > 0):
-                mask = np.zeros(shape=n_bonds, dtype=bool)
-                mask[neighbors] = True
-                for i in range(len(rows)):
-                    vals = np.array(rows[i], dtype=np.int64)
-                    rows[i] = vals[mask[vals]]
-                neighbors = rows
-            else:
-                neighbors = [np.array([], dtype=np.int64) for i in range(len(inds))]
-        return neighbors
-    elif am is not None:
-        if am.format != 'coo':
-            am = am.tocoo(copy=False)
-        if flatten is False:
-            raise Exception('flatten cannot be used with an adjacency matrix')
-        if isgtriu(network):
-            am = sprs.triu(am, k=1)
-        Ps = np.zeros(am.shape[0], dtype=bool)
-        Ps[inds] = True
-        conns = np.vstack((am.row, am.col)).T
-        if logic in ['or', 'union', 'any']:
-            neighbors = np.any(Ps[conns], axis=1)
-        elif logic in ['xor', 'exclusive_or']:
-            neighbors = np.sum(Ps[conns], axis=1) == 1
-        elif logic in ['xnor', 'shared']:
-            neighbors = np.all(Ps[conns], axis=1)
-        elif logic in ['and', 'all', 'intersection']:
-            raise Exception('Specified logic is not implemented')
-        else:
-            raise Exception('Specified logic is not implemented')
-        neighbors = np.where(neighbors)[0]
-        return neighbors
-    else:
-        raise Exception('Either the incidence or the adjacency matrix must be specified')
+    inds = np.array(inds, ndmin=1, dtype=np.int64)
+    if len(inds) == 0:
+        return []
+    # The incidence matrix is built from the conns directly since, unlike
+    # dict_to_im, the edges of each node do not depend on their direction
+    conns = network[get_edge_prefix(network)+'.conns']
+    Nn = network[get_node_prefix(network)+'.coords'].shape[0]
+    Ne = conns.shape[0]
+    im = sprs.csr_matrix((np.ones(2*Ne, dtype=int),
+                          (conns.flatten(order='F'), np.tile(np.arange(Ne), 2))),
+                         shape=(Nn, Ne))
+    return neighbors_from_csr(im.indptr, im.indices, inds, logic=logic,
+                              flatten=flatten)
 
 
 def find_neighbor_nodes(network, inds, flatten=True, include_input=False,
@@ -343,47 +296,102 @@ def find_neighbor_nodes(network, inds, flatten=True, include_input=False,
     This is because the list of global nodes might be very large.
 
     """
-    g = network
-    nodes = np.array(inds, ndmin=1)
+    nodes = np.array(inds, ndmin=1, dtype=np.int64)
     # Short-circuit the function if the input list is already empty
     if len(nodes) == 0:
         return []
-    am_coo = dict_to_am(g)
-    am = am_coo.tolil(copy=False)
-    rows = am.rows[nodes].tolist()
-    if len(rows) == 0:
-        return []
-    n_nodes = am.shape[0]
-    neighbors = am_coo.col[np.in1d(am_coo.row, nodes)]
+    am = dict_to_am(network).tocsr()
+    exclude = None if include_input else nodes
+    return neighbors_from_csr(am.indptr, am.indices, nodes, logic=logic,
+                              flatten=flatten, exclude=exclude)
+
+
+def neighbors_from_csr(indptr, indices, inds, logic='or', flatten=True,
+                       exclude=None):
+    r"""
+    Finds the neighbors of the given nodes from a neighbor list stored in
+    compressed sparse row (CSR) form
+
+    Parameters
+    ----------
+    indptr, indices : ndarray
+        The neighbor list, such that the neighbors of node ``i`` are
+        ``indices[indptr[i]:indptr[i+1]]``. These may be neighboring nodes
+        or edges, as obtained from the ``indptr`` and ``indices`` of an
+        adjacency or incidence matrix in CSR format, respectively. Each
+        neighbor should appear only once per node.
+    inds : array_like
+        The nodes whose neighbors are sought
+    logic : str
+        Specifies logic to filter the resulting list. Options are 'or',
+        'xor', 'xnor' and 'and', as described in ``find_neighbor_nodes``.
+    flatten : bool
+        If ``True`` (default) a single array of the neighbors is returned,
+        otherwise a list containing an array of the neighbors of each
+        input node, in the order they are stored
+    exclude : array_like, optional
+        Neighbors to remove from the result, such as the input nodes
+        themselves
+
+    Returns
+    -------
+    neighbors : ndarray or list of ndarrays
+        The neighbors filtered by the given logic
+
+    Notes
+    -----
+    The neighbors of all the inputs are gathered and counted in a single
+    vectorized step, so the cost scales with the number of neighbors of
+    the inputs rather than with the size of the network.
+
+    """
+    inds = np.array(inds, ndmin=1, dtype=np.int64)
+    neighbors, lengths = _gather_csr(indptr, indices, inds)
+    # Count each neighbor once per unique input node
+    unique = np.unique(inds)
+    if unique.size < inds.size:
+        counts = np.bincount(_gather_csr(indptr, indices, unique)[0])
+    else:
+        counts = np.bincount(neighbors)
+    keep = _apply_logic(counts, logic, unique.size)
+    if exclude is not None:
+        exclude = np.array(exclude, ndmin=1, dtype=np.int64)
+        keep[exclude[exclude < keep.size]] = False
+    if flatten:
+        return np.where(keep)[0]
+    hits = keep[neighbors]
+    row = np.repeat(np.arange(inds.size), lengths)
+    counts = np.bincount(row[hits], minlength=inds.size)
+    return np.split(neighbors[hits], np.cumsum(counts)[:-1])
+
+
+def _gather_csr(indptr, indices, inds):
+    r"""
+    Returns the concatenated rows of a CSR neighbor list and their lengths
+    """
+    starts = indptr[inds]
+    lengths = indptr[inds + 1] - starts
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    pos = offsets + np.arange(offsets.size)
+    return indices[pos].astype(np.int64), lengths
+
+
+def _apply_logic(counts, logic, n):
+    r"""
+    Converts the number of inputs that each neighbor is connected to into a
+    mask according to the given logic, with ``n`` being the number of inputs
+    """
     if logic in ['or', 'union', 'any']:
-        neighbors = np.unique(neighbors)
+        keep = counts > 0
     elif logic in ['xor', 'exclusive_or']:
-        neighbors = np.unique(np.where(np.bincount(neighbors) == 1)[0])
-    elif logic in ['xnor', 'nxor']:
-        neighbors = np.unique(np.where(np.bincount(neighbors) > 1)[0])
+        keep = counts == 1
+    elif logic in ['xnor', 'nxor', 'shared']:
+        keep = counts > 1
     elif logic in ['and', 'all', 'intersection']:
-        neighbors = set(neighbors)
-        [neighbors.intersection_update(i) for i in rows]
-        neighbors = np.array(list(neighbors), dtype=np.int64, ndmin=1)
+        keep = counts == n
     else:
         raise Exception('Specified logic is not implemented')
-    # Deal with removing inputs or not
-    mask = np.zeros(shape=n_nodes, dtype=bool)
-    mask[neighbors] = True
-    if not include_input:
-        mask[nodes] = False
-    # Finally flatten or not
-    if flatten:
-        neighbors = np.where(mask)[0]
-    else:
-        if neighbors.size > 0:
-            for i in range(len(rows)):
-                vals = np.array(rows[i], dtype=np.int64)
-                rows[i] = vals[mask[vals]]
-            neighbors = rows
-        else:
-            neighbors = [np.array([], dtype=int) for i in range(len(nodes))]
-    return neighbors
+    return keep
 
 
 def find_connecting_edges(inds, network=None, am=None):
@@ -1,6 +1,5 @@
 import numpy as np
 from numba import njit
-from scipy.stats import rankdata
 
 
 __all__ = [
@@ -11,12 +10,12 @@ __all__ = [
 ]
 
 
-@njit
+@njit(cache=True)
 def qupc_initialize(size):
     return np.arange(size, dtype=np.int_)
 
 
-@njit
+@njit(cache=True)
 def qupc_update(arr, ind, val):
     if ind == val:
         arr[ind] = val
@@ -30,13 +29,12 @@ def qupc_update(arr, ind, val):
 
 
 def qupc_compress(arr):
-    temp = rankdata(arr, method='dense')
-    arr[:] = temp
-    arr -= 1
+    # Same as scipy.stats.rankdata(arr, method='dense') - 1
+    arr[:] = np.unique(arr, return_inverse=True)[1]
     return arr
 
 
-@njit
+@njit(cache=True)
 def qupc_reduce(arr):
     for i in range(len(arr)-1, 0, -1):
         arr[i] = arr[arr[i]]
@@ -0,0 +1,75 @@
+import numpy as np
+from numba import njit
+
+
+__all__ = [
+    'segment_reduce',
+]
+
+
+@njit(cache=True)
+def _segment_reduce(indptr, values, op, ignore_nans):
+    n = indptr.size - 1
+    out = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        if op == 0:
+            acc = np.inf
+        elif op == 1:
+            acc = -np.inf
+        else:
+            acc = 0.0
+        count = 0
+        for j in range(indptr[i], indptr[i+1]):
+            v = values[j]
+            if np.isnan(v):
+                if ignore_nans:
+                    continue
+                acc = np.nan
+                count += 1
+                continue
+            if op == 0:
+                if v < acc:
+                    acc = v
+            elif op == 1:
+                if v > acc:
+                    acc = v
+            else:
+                acc += v
+            count += 1
+        if op == 3:
+            acc = acc/count if count > 0 else np.nan
+        out[i] = acc
+    return out
+
+
+def segment_reduce(indptr, values, mode='min', ignore_nans=True):
+    r"""
+    Reduces the values in each segment of a compressed sparse row (CSR)
+    structure to a single value, in one pass without temporary arrays
+
+    Parameters
+    ----------
+    indptr : ndarray
+        The CSR index pointer, so that segment ``i`` contains
+        ``values[indptr[i]:indptr[i+1]]``
+    values : ndarray
+        The values of all the segments, in order
+    mode : str
+        The reduction to apply. Options are 'min', 'max', 'sum' and 'mean'.
+    ignore_nans : bool
+        If ``True`` (default) ``nans`` are skipped, otherwise any ``nan``
+        in a segment makes its result ``nan``
+
+    Returns
+    -------
+    result : ndarray
+        The reduced value of each segment. Empty segments give ``inf`` for
+        'min', ``-inf`` for 'max', 0 for 'sum' and ``nan`` for 'mean'.
+
+    """
+    ops = {'min': 0, 'max': 1, 'sum': 2, 'mean': 3}
+    if mode not in ops:
+        raise Exception(f'Unrecognized mode: {mode}')
+    indptr = np.asarray(indptr, dtype=np.int64)
+    values = np.asarray(values, dtype=np.float64)
+    return _segment_reduce(indptr, values, ops[mode], ignore_nans)
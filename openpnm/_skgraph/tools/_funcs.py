@@ -1,3 +1,4 @@
+from itertools import chain
 import numpy as np
 import scipy.sparse as sprs
 from scipy.spatial import KDTree, distance_matrix
@@ -660,6 +661,49 @@ def tri_to_am(tri):
     return am
 
 
+def _ridge_rings(ridge_vertices, drop_negs=False):
+    r"""
+    Converts the ragged list of vertices on each Voronoi ridge into flat
+    arrays, along with the pairs of consecutive vertices around each ridge
+
+    Parameters
+    ----------
+    ridge_vertices : list of lists
+        The vertices on each ridge, as given by the ``ridge_vertices``
+        attribute of ``scipy.spatial.Voronoi``
+    drop_negs : bool
+        If ``True`` the vertices at infinity (-1) are removed before the
+        rings are formed, so the ring is closed across the gap they leave.
+
+    Returns
+    -------
+    verts : ndarray
+        The vertices of all ridges concatenated into a single array
+    ridges : ndarray
+        The ridge to which each entry in ``verts`` belongs
+    pairs : ndarray
+        An array the same length as ``verts`` containing each vertex and
+        the one following it on the same ridge, with the last vertex on each
+        ridge paired with the first.
+
+    """
+    counts = np.fromiter(map(len, ridge_vertices), dtype=int,
+                         count=len(ridge_vertices))
+    verts = np.fromiter(chain.from_iterable(ridge_vertices), dtype=int,
+                        count=counts.sum())
+    ridges = np.repeat(np.arange(counts.size), counts)
+    if drop_negs:
+        keep = verts >= 0
+        verts, ridges = verts[keep], ridges[keep]
+        counts = np.bincount(ridges, minlength=counts.size)
+    starts = np.cumsum(counts) - counts
+    nxt = np.arange(1, verts.size + 1)
+    hits = counts > 0
+    nxt[(starts + counts - 1)[hits]] = starts[hits]
+    pairs = np.vstack((verts, verts[nxt])).T
+    return verts, ridges, pairs
+
+
 def vor_to_am(vor):
     r"""
     Given a Voronoi tessellation object from Scipy's ``spatial`` module,
@@ -677,17 +721,8 @@ def vor_to_am(vor):
     weights are set to 1.
 
     """
-    # Create adjacency matrix in lil format for quick matrix construction
-    N = vor.vertices.shape[0]
-    rc = [[], []]
-    for ij in vor.ridge_dict.keys():
-        row = vor.ridge_dict[ij].copy()
-        # Make sure voronoi cell closes upon itself
-        row.append(row[0])
-        # Add connections to rc list
-        rc[0].extend(row[:-1])
-        rc[1].extend(row[1:])
-    rc = np.vstack(rc).T
+    # Connect consecutive vertices around each ridge, closing each ring
+    _, _, rc = _ridge_rings(vor.ridge_vertices)
     # Make adj mat upper triangular
     rc = np.sort(rc, axis=1)
     # Remove any pairs with ends at infinity (-1)
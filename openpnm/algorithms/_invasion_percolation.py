@@ -187,41 +187,63 @@ class InvasionPercolation(Algorithm):
         """
         self.set_BC(pores=pores, bcvalues=True, bctype='outlet', mode=mode)
 
-    def run(self):
+    def run(self, n_steps=None):
         r"""
         Performs the algorithm for the given number of steps
 
+        Parameters
+        ----------
+        n_steps : int, optional
+            The number of throats to invade. If not given the invasion
+            proceeds until all accessible throats are invaded.
+
+        Notes
+        -----
+        If the algorithm already contains a partial invasion, such as from
+        a previous call with ``n_steps`` or a project restored from a
+        checkpoint, the invasion is continued from the current front. Use
+        ``reset`` to start over.
+
         """
         # Setup arrays and info
-        # TODO: This should be called conditionally so that it doesn't
-        # overwrite existing data when doing a few steps at a time
         self._run_setup()
-        n_steps = np.inf
+        n_steps = np.inf if n_steps is None else n_steps
 
         # Create incidence matrix for use in _run_accelerated which is jit
         im = self.network.create_incidence_matrix(fmt='csr')
 
-        # Perform initial analysis on input pores
-        Ts = self.project.network.find_neighbor_throats(pores=self['pore.bc.inlet'])
+        # Start from the uninvaded throats on the current invasion front,
+        # which are the throats connected to the inlets on the first call
+        t_inv = self['throat.invasion_sequence']
+        p_inv = self['pore.invasion_sequence']
+        Ts = self.project.network.find_neighbor_throats(pores=p_inv >= 0)
+        Ts = Ts[t_inv[Ts] < 0]
+        if Ts.size == 0:
+            return
+        start = max(t_inv.max(), 0) + 1
         t_start = self['throat.order'][Ts]
         t_inv, p_inv, p_inv_t = \
             _run_accelerated(
                 t_start=t_start,
                 t_sorted=self['throat.sorted'],
                 t_order=self['throat.order'],
-                t_inv=self['throat.invasion_sequence'],
-                p_inv=self['pore.invasion_sequence'],
-                p_inv_t=np.zeros_like(self['pore.invasion_sequence']),
+                t_inv=t_inv,
+                p_inv=p_inv,
+                p_inv_t=np.zeros_like(p_inv),
                 conns=self.project.network['throat.conns'],
                 idx=im.indices,
                 indptr=im.indptr,
+                start=start,
                 n_steps=n_steps)
 
         # Transfer results onto algorithm object
         self['throat.invasion_sequence'] = t_inv
         self['pore.invasion_sequence'] = p_inv
         self['throat.invasion_pressure'] = self['throat.entry_pressure']
-        self['pore.invasion_pressure'] = self['throat.entry_pressure'][p_inv_t]
+        Pc = self['throat.entry_pressure'][p_inv_t]
+        if start > 1:  # Keep pressures of pores invaded by previous calls
+            Pc = np.where(p_inv >= start, Pc, self['pore.invasion_pressure'])
+        self['pore.invasion_pressure'] = Pc
         # Set invasion pressure of inlets to 0
         self['pore.invasion_pressure'][self['pore.invasion_sequence'] == 0] = 0.0
         # Set invasion sequence and pressure of any residual pores/throats to 0
@@ -354,7 +376,7 @@ class InvasionPercolation(Algorithm):
         # self['throat.trapped'][self['throat.residual']] = False
 
 
-@jit
+@jit(cache=True)
 def _find_trapped_pores(inv_seq, indices, indptr, outlets):  # pragma: no cover
     Np = len(inv_seq)
     sorted_seq = np.vstack((inv_seq.astype(np.int_), np.arange(Np, dtype=np.int_))).T
@@ -414,9 +436,9 @@ def _find_trapped_pores(inv_seq, indices, indptr, outlets):  # pragma: no cover
     return trapped_pores
 
 
-@njit
+@njit(cache=True)
 def _run_accelerated(t_start, t_sorted, t_order, t_inv, p_inv, p_inv_t,
-                     conns, idx, indptr, n_steps):  # pragma: no cover
+                     conns, idx, indptr, start, n_steps):  # pragma: no cover
     r"""
     Numba-jitted run method for InvasionPercolation class.
 
@@ -431,14 +453,17 @@ def _run_accelerated(t_start, t_sorted, t_order, t_inv, p_inv, p_inv_t,
     Nested wrapper is for performance issues (reduced OpenPNM import)
     time due to local numba import
 
+    ``start`` is the invasion sequence number given to the first throat
+    invaded, which is greater than 1 when continuing a previous invasion.
+
     """
     # TODO: The following line is supposed to be numba's new list, but the
     # heap does not work with this
     # queue = List(t_start)
     queue = list(t_start)
     hq.heapify(queue)
-    count = 1
-    while count < (n_steps + 1):
+    count = start
+    while count < (n_steps + start):
         # Find throat at the top of the queue
         t = hq.heappop(queue)
         # Extract actual throat number
@@ -28,6 +28,15 @@ class UnsteadySolution(Solution):
         obj._x = np.asarray(x).view(cls)
         return obj
 
+    def __reduce__(self):
+        # ndarray subclasses do not pickle their attributes by default
+        state = super().__reduce__()
+        return (state[0], state[1], state[2] + (np.asarray(self._x), ))
+
+    def __setstate__(self, state):
+        self._x = np.asarray(state[-1]).view(self.__class__)
+        super().__setstate__(state[:-1])
+
     def _create_interpolant(self):
         self._interpolant = interp1d(self._x, self, bounds_error=True)
 
@@ -1,9 +1,10 @@
 import logging
 import numpy as np
+from scipy.sparse.linalg import LinearOperator
 from openpnm.algorithms import ReactiveTransport
 from openpnm.utils import Docorator
 from openpnm.integrators import ScipyRK45
-from openpnm.algorithms._solution import SolutionContainer
+from openpnm.algorithms._solution import SolutionContainer, TransientSolution
 
 
 __all__ = ['TransientReactiveTransport']
@@ -48,7 +49,7 @@ class TransientReactiveTransport(ReactiveTransport):
         self.settings['phase'] = phase.name
         self["pore.ic"] = np.nan
 
-    def run(self, x0, tspan, saveat=None, integrator=None):
+    def run(self, x0, tspan, saveat=None, integrator=None, checkpoint=None):
         """
         Runs the transient algorithm and returns the solution.
 
@@ -65,6 +66,14 @@ class TransientReactiveTransport(ReactiveTransport):
         integrator : Integrator, optional
             Integrator object which will be used to to the time stepping.
             Can be instantiated using openpnm.integrators module.
+        checkpoint : str or Path, optional
+            A folder in which a checkpoint of the project is saved (using
+            ``Project.checkpoint``) each time the solution is stored at one
+            of the ``saveat`` points, which must be given. If the algorithm
+            holds a partial solution from an interrupted checkpointed run,
+            such as in a project restored with
+            ``Workspace.load_checkpoint``, the integration resumes from the
+            last stored time instead of starting over.
 
         Returns
         -------
@@ -82,6 +91,8 @@ class TransientReactiveTransport(ReactiveTransport):
         # didn't want to?
         if (saveat is not None) and (tspan[1] not in saveat):
             saveat = np.hstack((saveat, [tspan[1]]))
+        if (checkpoint is not None) and (saveat is None):
+            raise Exception('saveat must be given to use checkpoints')
         integrator = ScipyRK45() if integrator is None else integrator
         # Perform pre-solve validations
         self._validate_settings()
@@ -93,11 +104,56 @@ class TransientReactiveTransport(ReactiveTransport):
         # Build RHS (dx/dt = RHS), then integrate the system of ODEs
         rhs = self._build_rhs()
         # Integrate RHS using the given solver
-        soln = integrator.solve(rhs, x0, tspan, saveat)
+        if checkpoint is None:
+            soln = integrator.solve(rhs, x0, tspan, saveat)
+        else:
+            soln = self._run_checkpointed(integrator, rhs, x0, tspan, saveat,
+                                          checkpoint)
         # Return solution as dictionary
         self.soln = SolutionContainer()
         self.soln[self.settings['quantity']] = soln
 
+    def _run_checkpointed(self, integrator, rhs, x0, tspan, saveat, path):
+        r"""
+        Integrates between consecutive ``saveat`` points, saving a checkpoint
+        of the project after each one.
+
+        Notes
+        -----
+        The integrator is restarted at each ``saveat`` point, so the result
+        can differ from an uninterrupted run within the integrator's
+        tolerances.
+        """
+        quantity = self.settings['quantity']
+        saveat = np.array(saveat, dtype=float)
+        t, y = [], []
+        # Resume from a partial solution if one is found
+        try:
+            prev = self.soln[quantity]
+            n = prev.t.size
+            if (n < saveat.size) and np.allclose(prev.t, saveat[:n]):
+                t, y = list(prev.t), list(np.asarray(prev).T)
+                logger.info(f'Resuming integration from t = {t[-1]}')
+        except (AttributeError, KeyError, TypeError):
+            pass
+        if len(t) == 0:
+            t0 = tspan[0]
+            if np.isclose(saveat[0], t0):
+                t, y = [saveat[0]], [x0]
+        else:
+            t0 = t[-1]
+        for t1 in saveat[len(t):]:
+            x = y[-1] if len(y) else x0
+            seg = integrator.solve(rhs, x, (t0, t1), [t1])
+            t.append(t1)
+            y.append(np.asarray(seg)[:, -1])
+            self[quantity] = y[-1]
+            self.soln = SolutionContainer()
+            self.soln[quantity] = TransientSolution(t, np.vstack(y).T)
+            self.project.checkpoint(path)
+            t0 = t1
+        return TransientSolution(t, np.vstack(y).T)
+
     def _run_special(self, x0):
         pass
 
@@ -115,7 +171,8 @@ class TransientReactiveTransport(ReactiveTransport):
             # TODO: add a cache mechanism
             self.x = y
             self._update_A_and_b()
-            A = self.A.tocsc()
+            A = self.A
+            A = A if isinstance(A, LinearOperator) else A.tocsc()
             b = self.b
             V = self.network[self.settings["pore_volume"]]
             return (-A.dot(y) + b) / V  # much faster than A*y
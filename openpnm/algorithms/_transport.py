@@ -1,6 +1,5 @@
 import logging
 import numpy as np
-import scipy.sparse.csgraph as spgr
 from openpnm.topotools import is_fully_connected
 from openpnm.algorithms import Algorithm
 from openpnm.utils import Docorator, TypedSet, Workspace
@@ -40,12 +39,18 @@ class TransportSettings:
         and should be updated by the algorithm on each iteration. Note that
         any properties which already depend on ``'quantity'`` will
         automatically be updated.
+    matrix_free : bool
+        If ``True`` and the network is a cubic lattice (see
+        ``Network.lattice``) then ``A`` is applied as a stencil instead of
+        being assembled as a sparse matrix. This is only beneficial with
+        solvers that accept a ``LinearOperator``, such as ``ScipyCG``.
 
     """
     phase = ''
     quantity = ''
     conductance = ''
     cache = True
+    matrix_free = False
     variable_props = TypedSet()
 
 
@@ -110,8 +115,16 @@ class Transport(Algorithm):
         if self._pure_A is None:
             phase = self.project[self.settings.phase]
             g = phase[gvals]
-            am = self.network.create_adjacency_matrix(weights=g, fmt='coo')
-            self._pure_A = spgr.laplacian(am).astype(float)
+            lattice = self.network.lattice
+            matrix_free = self.settings['matrix_free']
+            if matrix_free and ((lattice is None) or (g.ndim > 1)):
+                logger.warning('A matrix-free A requires an unaltered cubic'
+                               + ' lattice and symmetric conductances')
+                matrix_free = False
+            if matrix_free:
+                self._pure_A = solvers.StencilLaplacian(g, **lattice)
+            else:
+                self._pure_A = self.network._create_laplacian(weights=g)
         self.A = self._pure_A.copy()
 
     def _build_b(self):
@@ -159,14 +172,17 @@ class Transport(Algorithm):
             self.b[~ind] -= (self.A * x_BC)[~ind]
             # Update A
             P_bc = self.to_indices(ind)
-            mask = np.isin(self.A.row, P_bc) | np.isin(self.A.col, P_bc)
-            # Remove entries from A for all BC rows/cols
-            self.A.data[mask] = 0
-            # Add diagonal entries back into A
-            datadiag = self.A.diagonal()
-            datadiag[P_bc] = np.ones_like(P_bc, dtype=float) * f
-            self.A.setdiag(datadiag)
-            self.A.eliminate_zeros()
+            if isinstance(self.A, solvers.StencilLaplacian):
+                self.A.set_fixed_rows(P_bc, f)
+            else:
+                mask = np.isin(self.A.row, P_bc) | np.isin(self.A.col, P_bc)
+                # Remove entries from A for all BC rows/cols
+                self.A.data[mask] = 0
+                # Add diagonal entries back into A
+                datadiag = self.A.diagonal()
+                datadiag[P_bc] = np.ones_like(P_bc, dtype=float) * f
+                self.A.setdiag(datadiag)
+                self.A.eliminate_zeros()
 
     def run(self, solver=None, x0=None, verbose=False):
         """
@@ -62,6 +62,7 @@ class MultiPhase(Phase):
     """
 
     def __init__(self, phases=[], name='mphase_?', **kwargs):
+        self._K_state = None
         super().__init__(name=name, **kwargs)
         self.settings._update(MultiPhaseSettings())
 
@@ -98,6 +99,7 @@ class MultiPhase(Phase):
     @K.setter
     def K(self, value):
         self._K = value
+        self._K_state = None
 
     def add_phases(self, phases):
         """
@@ -144,8 +146,10 @@ class MultiPhase(Phase):
 
         if pores.size:
             self[f'pore.occupancy.{phase.name}'][pores] = values
+            self._touch(f'pore.occupancy.{phase.name}')
         if throats.size:
             self[f'throat.occupancy.{phase.name}'][throats] = values
+            self._touch(f'throat.occupancy.{phase.name}')
 
         if self.settings["throat_occupancy"] == "automatic":
             self.regenerate_models(propnames=f"throat.occupancy.{phase.name}")
@@ -234,8 +238,11 @@ class MultiPhase(Phase):
         assert ":" in formatted_propname
         return formatted_propname.split(".")[-1].split(":")
 
-    def _get_interface_throats(self, phase1, phase2):
+    def _get_interface_throats(self, phase1, phase2, throats=None):
+        """Finds the interface throats, as indices into ``throats`` if given"""
         conns = self.network.conns
+        if throats is not None:
+            conns = conns[throats]
         occ1 = self[f"pore.occupancy.{phase1}"][conns]
         occ2 = self[f"pore.occupancy.{phase2}"][conns]
         idx12, = np.where((occ1[:, 0] == 1) & (occ2[:, 1] == 1))
@@ -245,28 +252,84 @@ class MultiPhase(Phase):
     def _build_K(self):
         """Updates the global partition coefficient array"""
         prefix = self.settings["partition_coef_prefix"]
-        self._K = np.ones(self.Nt, dtype=float)
         # Find all binary partition coefficient models
         models = [k for k in self.models.keys() if k.startswith(prefix)]
-        # Modify the global partition coefficient for each phase pair
-        for model in models:
-            K12 = self[model]
-            phase1, phase2 = self._get_phase_labels(model)
-            idx12, idx21 = self._get_interface_throats(phase1, phase2)
-            self._K[idx12] = K12[idx12]
-            self._K[idx21] = 1 / K12[idx21]
+        labels = [self._get_phase_labels(model) for model in models]
+        occ = {}
+        for name in set(sum(labels, [])):
+            occ[name] = self[f"pore.occupancy.{name}"]
+        K12s = {model: self[model] for model in models}
+        # Only throats next to pores whose occupancy has changed, or whose
+        # partition coefficient has changed, need to be updated. The inputs
+        # and the result are compared to copies of those last used, so
+        # in-place writes are also found.
+        sig = (self.Np, self.Nt, tuple(models))
+        state = self._K_state
+        throats = None
+        if (state is not None) and (state[0] == sig) \
+                and np.array_equal(self._K, state[3]):
+            changed = np.zeros(self.Np, dtype=bool)
+            for name, vals in occ.items():
+                changed |= vals != state[1][name]
+            Ts = np.zeros(self.Nt, dtype=bool)
+            for model, vals in K12s.items():
+                Ts |= vals != state[2][model]
+            Ps = np.where(changed)[0]
+            Ts[self.network.find_neighbor_throats(pores=Ps)] = True
+            throats = np.where(Ts)[0]
+        if (throats is None) or throats.size:
+            N = self.Nt if throats is None else throats.size
+            K = np.ones(N, dtype=float)
+            # Modify the global partition coefficient for each phase pair
+            for model, (phase1, phase2) in zip(models, labels):
+                K12 = K12s[model] if throats is None else K12s[model][throats]
+                idx12, idx21 = self._get_interface_throats(phase1, phase2,
+                                                           throats)
+                K[idx12] = K12[idx12]
+                K[idx21] = 1 / K12[idx21]
+            if throats is None:
+                self._K = K
+            else:
+                self._K[throats] = K
+            self._K_state = (sig,
+                             {k: v.copy() for k, v in occ.items()},
+                             {k: v.copy() for k, v in K12s.items()},
+                             self._K.copy())
         # Store a reference in self as a propname for convenience
         self[f"{prefix}.global"][:] = self._K
+        self._touch(f"{prefix}.global")
 
     def _interleave_data(self, prop):
         """Gathers property values from component phases to build a single array."""
         element = self._parse_element(prop)[0]
+        phases = list(self.phases.values())
+        # Several models may need the same property while the models are
+        # being regenerated, so the result is shared for the duration of the
+        # pass
+        cache = self._model_cache
+        if cache is not None:
+            sig = self._get_interleave_signature(element, prop, phases)
+            hit = cache.get(('interleave', prop), None)
+            if (hit is not None) and (sig is not None) and (hit[0] == sig):
+                return hit[1].copy()
         vals = np.zeros(self._count(element=element), dtype=float)
         # Retrieve property from constituent phases (weight = occupancy)
-        for phase in self.phases.values():
+        for phase in phases:
             vals += phase[prop] * self[f"{element}.occupancy.{phase.name}"]
+        if cache is not None:
+            cache[('interleave', prop)] = (sig, vals.copy())
         return vals
 
+    def _get_interleave_signature(self, element, prop, phases):
+        # The write versions of the occupancy and of the property on each
+        # phase, or None if any is not an array stored on the phase
+        sig = [self._get_version(f"{element}.occupancy.{p.name}") for p in phases]
+        for phase in phases:
+            if not dict.__contains__(phase, prop):
+                return None
+            sig.append(phase._get_version(prop))
+        return sig
+
     def _set_automatic_throat_occupancy(self, mode="mean"):
         """
         Automatically interpolates throat occupancy based on that in
@@ -1,6 +1,9 @@
+import os
 import numpy as np
 import logging
 import uuid
+import weakref
+from itertools import count
 from copy import deepcopy
 from openpnm.core import (
     LabelMixin,
@@ -21,6 +24,9 @@ from openpnm.utils import (
 docstr = Docorator()
 logger = logging.getLogger(__name__)
 ws = Workspace()
+# A single counter shared by all objects so that every write receives a
+# unique, increasing version number
+_write_counter = count(1)
 
 
 __all__ = [
@@ -62,6 +68,16 @@ class Base2(dict):
         # use it before calling super.__init__()
         instance.settings = SettingsAttr()
         instance.settings['uuid'] = str(uuid.uuid4())
+        # Also needed before __init__ since unpickling calls __setitem__
+        instance._versions = {}
+        instance._memmap_dir = None
+        instance._memmap_files = {}
+        instance._counts = {}
+        instance._ranges = {}
+        instance._keys_version = 0
+        instance._label_queries = {}
+        instance._model_cache = None
+        instance._correlation_cache = {}
         return instance
 
     def __init__(self, network=None, project=None, name='obj_?'):
@@ -134,9 +150,19 @@ class Base2(dict):
         if self._count(element) is None:
             self.update({key: value})  # If length not defined, do it
         elif value.shape[0] == 1:  # If value is scalar
-            value = np.ones((self._count(element), ), dtype=value.dtype)*value
+            if self._memmap_dir is None:
+                value = np.ones((self._count(element), ), dtype=value.dtype)*value
+            else:
+                temp = self._empty(key, (self._count(element), ), value.dtype)
+                temp.fill(value[0])
+                value = temp
             self.update({key: value})
         elif np.shape(value)[0] == self._count(element):
+            if (self._memmap_dir is not None) \
+                    and not isinstance(value, np.memmap):
+                temp = self._empty(key, value.shape, value.dtype)
+                temp[...] = value
+                value = temp
             self.update({key: value})
         else:
             raise Exception('Provided array is wrong length for ' + key)
@@ -184,7 +210,76 @@ class Base2(dict):
                 else:
                     raise KeyError(key)
 
+    def update(self, *args, **kwargs):
+        r"""
+        An overloaded version of ``update`` that also records the write
+        version of each key that is written
+        """
+        d = dict(*args, **kwargs)
+        for k, v in d.items():
+            # Note when the set of keys, or which of them are labels, changes
+            old = dict.get(self, k, None)
+            if (old is None) or \
+                    (np.asarray(old).dtype == bool) != (np.asarray(v).dtype == bool):
+                self._keys_version = next(_write_counter)
+                break
+        super().update(d)
+        counts = self._counts
+        for k, v in d.items():
+            self._versions[k] = next(_write_counter)
+            # Forget the cached count if the array defining it may have
+            # changed length
+            element = k.split('.', 1)[0]
+            if (element in counts) and (np.shape(v)[:1] != (counts[element], )):
+                del counts[element]
+
+    def _get_version(self, key):
+        r"""
+        Returns the write version of the given key, which changes each time
+        the key is written to.
+
+        Notes
+        -----
+        Writing into an existing array in-place, such as
+        ``obj['pore.foo'][0] = 1.0``, does not change its version since
+        this cannot be detected.
+        """
+        return self._versions.get(key, 0)
+
+    def _touch(self, key):
+        r"""
+        Gives the given key a new write version, for use after writing into
+        its array in-place
+        """
+        self._versions[key] = next(_write_counter)
+
+    def _empty(self, key, shape, dtype):
+        r"""
+        Returns an uninitialized array to be stored under the given key
+
+        If ``_memmap_dir`` is set then the array is memory-mapped to a new
+        ``.npy`` file in that directory, and the file previously written
+        for the same key, if any, is deleted. This allows objects to hold
+        more data than fits in memory.
+        """
+        if self._memmap_dir is None:
+            return np.empty(shape, dtype=dtype)
+        fname = os.path.join(
+            self._memmap_dir,
+            f"{self.settings['uuid']}.{key}.{next(_write_counter)}.npy")
+        old = self._memmap_files.pop(key, None)
+        if old is not None:
+            try:  # Open mappings of the old file remain valid on posix
+                os.remove(old)
+            except OSError:
+                pass
+        self._memmap_files[key] = fname
+        return np.lib.format.open_memmap(fname, mode='w+', dtype=dtype,
+                                         shape=shape)
+
     def __delitem__(self, key):
+        self._counts.clear()
+        self._keys_version = next(_write_counter)
         try:
             super().__delitem__(key)
         except KeyError:
@@ -193,6 +288,8 @@ class Base2(dict):
                 super().__delitem__(f'{key}.{item}')
 
     def pop(self, *args):
+        self._counts.clear()
+        self._keys_version = next(_write_counter)
         v = super().pop(*args)
         if v is None:
             try:
@@ -206,6 +303,8 @@ class Base2(dict):
         return v
 
     def clear(self, mode=None):
+        self._counts.clear()
+        self._keys_version = next(_write_counter)
         if mode is None:
             super().clear()
         else:
@@ -278,6 +377,7 @@ class Base2(dict):
             return
         name = self.project._generate_name(name)
         self._name = name
+        self.project._rename(self, old_name)
 
     def _get_name(self):
         try:
@@ -287,9 +387,22 @@ class Base2(dict):
 
     name = property(_get_name, _set_name)
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_project', None)  # Restored by the project on unpickling
+        return state
+
     def _get_project(self):
+        # The project sets a weak reference to itself when the object is
+        # appended, so the workspace only needs to be searched if that
+        # project has since been closed
+        ref = self.__dict__.get('_project', None)
+        proj = ref() if ref is not None else None
+        if (proj is not None) and (ws.get(proj.name, None) is proj):
+            return proj
         for proj in ws.values():
             if self in proj:
+                self._project = weakref.ref(proj)
                 return proj
 
     project = property(fget=_get_project)
@@ -317,19 +430,40 @@ class Base2(dict):
 
     def _count(self, element):
         if element == 'pore':
-            try:
-                return self['pore.coords'].shape[0]
-            except KeyError:
-                for k, v in self.items():
-                    if k.startswith('pore.'):
-                        return v.shape[0]
+            key = 'pore.coords'
         elif element == 'throat':
-            try:
-                return self['throat.conns'].shape[0]
-            except KeyError:
-                for k, v in self.items():
-                    if k.startswith('throat.'):
-                        return v.shape[0]
+            key = 'throat.conns'
+        else:
+            return None
+        # Networks store the array defining the count so read it directly
+        arr = dict.get(self, key, None)
+        if arr is not None:
+            return arr.shape[0]
+        # Otherwise use the length of the object's own arrays, which is
+        # cached until an array of a different length is written
+        N = self._counts.get(element, None)
+        if N is not None:
+            return N
+        for k, v in self.items():
+            if k.startswith(element + '.'):
+                self._counts[element] = v.shape[0]
+                return v.shape[0]
+        try:  # Objects without arrays (e.g. new phases) use the network's
+            return self[key].shape[0]
+        except KeyError:
+            return None
+
+    def _range(self, element):
+        r"""
+        Returns a cached, read-only array of all indices of the given element
+        """
+        N = self._count(element)
+        r = self._ranges.get(element, None)
+        if (r is None) or (r.size != N):
+            r = np.arange(N)
+            r.setflags(write=False)
+            self._ranges[element] = r
+        return r
 
     @property
     def Nt(self):
@@ -341,11 +475,11 @@ class Base2(dict):
 
     @property
     def Ts(self):
-        return np.arange(self._count('throat'))
+        return self._range('throat')
 
     @property
     def Ps(self):
-        return np.arange(self._count('pore'))
+        return self._range('pore')
 
     def _tomask(self, element, indices):
         return self.to_mask(**{element+'s': indices})
@@ -470,7 +604,7 @@ class Base2(dict):
             values = from_neighbor_throats(self, prop='throat.'+prop, mode=mode)
         return values
 
-    def get_conduit_data(self, propname):
+    def get_conduit_data(self, propname, out=None):
         r"""
         Fetches an Nt-by-3 array of the requested property
 
@@ -478,6 +612,10 @@ class Base2(dict):
         ----------
         propname : str
             The dictionary key of the property to fetch.
+        out : ndarray, optional
+            An Nt-by-3 array into which the data is written, such as the
+            array returned by a previous call. Reusing the same array on
+            repeated calls avoids allocating a new one each time.
 
         Returns
         -------
@@ -485,23 +623,52 @@ class Base2(dict):
             An Nt-by-3 array with each column containing the requrested data
             for pore1, throat, and pore2 respectively.
 
+        Notes
+        -----
+        The returned array is the transpose of a 3-by-Nt array, so
+        ``P1, T, P2 = data.T`` unpacks it into three contiguous views
+        without copying.
+
         """
         poreprop = 'pore.' + propname.split('.', 1)[-1]
         throatprop = 'throat.' + propname.split('.', 1)[-1]
-        conns = self.network.conns
         try:
             T = self[throatprop]
             if T.ndim > 1:
                 raise Exception(f'{throatprop} must be a single column wide')
         except KeyError:
-            T = np.ones([self.Nt, ], dtype=float)*np.nan
+            T = None
         try:
-            P1, P2 = self[poreprop][conns.T]
+            P = self[poreprop]
         except KeyError:
-            P1 = np.ones([self.Nt, ], dtype=float)*np.nan
-            P2 = np.ones([self.Nt, ], dtype=float)*np.nan
-        vals = np.vstack((P1, T, P2)).T
-        if np.isnan(vals).sum() == vals.size:
+            P = None
+        if (T is None) and (P is None):
+            raise KeyError(f'{propname} not found')
+        if out is None:
+            if (T is None) or (P is None):  # Missing values are nans
+                dtype = np.result_type(T if P is None else P, float)
+            else:
+                dtype = np.result_type(P, T)
+            buf = np.empty((3, self.Nt), dtype=dtype)
+        else:
+            if out.shape != (self.Nt, 3):
+                raise Exception(f'out must have a shape of ({self.Nt}, 3)')
+            buf = out.T
+        if T is None:
+            buf[1] = np.nan
+        else:
+            buf[1] = T
+        if P is None:
+            buf[0] = np.nan
+            buf[2] = np.nan
+        else:
+            P1, P2 = self.network._get_conduit_pores()
+            P = np.asarray(P, dtype=buf.dtype)
+            np.take(P, P1, out=buf[0])
+            np.take(P, P2, out=buf[2])
+        vals = buf.T if out is None else out
+        # Only scan the whole array if the first conduit is all nans
+        if np.isnan(vals[:1]).all() and np.isnan(vals).all():
             raise KeyError(f'{propname} not found')
         return vals
 
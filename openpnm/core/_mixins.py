@@ -8,6 +8,49 @@ __all__ = [
 ]
 
 
+_label_modes = {
+    'or': 'or', 'any': 'or', 'union': 'or',
+    'and': 'and', 'all': 'and', 'intersection': 'and',
+    'xor': 'xor', 'exclusive_or': 'xor',
+    'nor': 'nor', 'not': 'nor', 'none': 'nor',
+    'nand': 'nand',
+    'xnor': 'xnor', 'nxor': 'xnor',
+}
+
+
+def _combine_masks(masks, mode, N):
+    r"""
+    Combines boolean masks according to the given mode in a single pass
+    over their bit-packed form
+
+    Rather than summing the masks, the locations seen at least once and
+    at least twice are tracked as bitsets, which is sufficient for all the
+    modes and touches 8 times less memory.
+    """
+    nbytes = (N + 7)//8
+    once = np.zeros(nbytes, dtype=np.uint8)
+    twice = np.zeros(nbytes, dtype=np.uint8)
+    every = np.full(nbytes, 255, dtype=np.uint8)
+    for mask in masks:
+        b = np.packbits(np.asarray(mask, dtype=bool))
+        twice |= once & b
+        once |= b
+        every &= b
+    if mode == 'or':
+        bits = once
+    elif mode == 'and':
+        bits = every
+    elif mode == 'xor':
+        bits = once & ~twice
+    elif mode == 'nor':
+        bits = ~once
+    elif mode == 'nand':
+        bits = once & ~every
+    elif mode == 'xnor':
+        bits = twice
+    return np.unpackbits(bits, count=N).view(bool)
+
+
 class ParserMixin:
 
     def _parse_indices(self, indices):
@@ -113,27 +156,26 @@ class ParserMixin:
             labels = [labels]
         # Parse the labels list
         parsed_labels = []
+        Ls = None
         for label in labels:
             # Remove element from label, if present
             if element in label:
                 label = label.split('.', 1)[-1]
             # Deal with wildcards
             if '*' in label:
-                Ls = [L.split('.', 1)[-1] for L in self.labels(element=element)]
+                if Ls is None:
+                    Ls = [L.split('.', 1)[-1]
+                          for L in self.labels(element=element)]
                 if label.startswith('*'):
                     temp = [L for L in Ls if L.endswith(label.strip('*'))]
                 if label.endswith('*'):
                     temp = [L for L in Ls if L.startswith(label.strip('*'))]
                 temp = [element+'.'+L for L in temp]
-            elif element+'.'+label in self.keys():
-                temp = [element+'.'+label]
             else:
                 temp = [element+'.'+label]
             parsed_labels.extend(temp)
-            # Remove duplicates if any
-            _ = [parsed_labels.remove(L) for L in parsed_labels
-                 if parsed_labels.count(L) > 1]
-        return parsed_labels
+        # Remove duplicates if any, keeping the order
+        return list(dict.fromkeys(parsed_labels))
 
     def _parse_mode(self, mode, allowed=None, single=False):
         r"""
@@ -366,56 +408,54 @@ class LabelMixin:
             _ = self.pop('pore.' + label, None)
             _ = self.pop('throat.' + label, None)
 
+    def _parse_query(self, element, labels, mode):
+        r"""
+        Converts the labels and mode of a query into the keys of the label
+        arrays and the standard name of the mode
+
+        The result is cached until a key is added or removed from the object,
+        so wildcards are only expanded once.
+        """
+        if not isinstance(mode, str) or (mode not in _label_modes):
+            raise Exception('Unsupported mode: '+str(mode))
+        try:
+            query = (element, labels if isinstance(labels, str)
+                     else tuple(labels), mode)
+            hash(query)
+        except TypeError:  # Unhashable labels are parsed every time
+            query = None
+        hit = self._label_queries.get(query, None)
+        if (hit is not None) and (hit[0] == self._keys_version):
+            return hit[1]
+        labels = self._parse_labels(labels=labels, element=element)
+        keys = tuple(element+'.'+item.split('.', 1)[-1] for item in labels)
+        parsed = (keys, _label_modes[mode])
+        if query is not None:
+            if len(self._label_queries) > 256:
+                self._label_queries.clear()
+            self._label_queries[query] = (self._keys_version, parsed)
+        return parsed
+
+    def _get_mask(self, element, labels, mode='or'):
+        r"""
+        Returns a boolean mask of the locations satisfying a label query.
+        The returned array may be the label array itself, so must not be
+        modified.
+        """
+        element = self._parse_element(element, single=True)
+        keys, mode = self._parse_query(element, labels, mode)
+        masks = [self[k] for k in keys]
+        if (len(masks) == 1) and (mode in ['or', 'and']):
+            return np.asarray(masks[0], dtype=bool)
+        return _combine_masks(masks, mode, self._count(element))
+
     def _get_indices(self, element, labels, mode='or'):
         r"""
         This is the actual method for getting indices, but should not be called
         directly.  Use ``pores`` or ``throats`` instead.
         """
-        # Parse and validate all input values.
-        element = self._parse_element(element, single=True)
-        labels = self._parse_labels(labels=labels, element=element)
-
-        # Begin computing label array
-        if mode in ['or', 'any', 'union']:
-            union = np.zeros([self._count(element), ], dtype=bool)
-            for item in labels:  # Iterate over labels and collect all indices
-                union = union + self[element+'.'+item.split('.', 1)[-1]]
-            ind = union
-        elif mode in ['and', 'all', 'intersection']:
-            intersect = np.ones([self._count(element), ], dtype=bool)
-            for item in labels:  # Iterate over labels and collect all indices
-                intersect = intersect*self[element+'.'+item.split('.', 1)[-1]]
-            ind = intersect
-        elif mode in ['xor', 'exclusive_or']:
-            xor = np.zeros([self._count(element), ], dtype=int)
-            for item in labels:  # Iterate over labels and collect all indices
-                info = self[element+'.'+item.split('.', 1)[-1]]
-                xor = xor + np.int8(info)
-            ind = (xor == 1)
-        elif mode in ['nor', 'not', 'none']:
-            nor = np.zeros([self._count(element), ], dtype=int)
-            for item in labels:  # Iterate over labels and collect all indices
-                info = self[element+'.'+item.split('.', 1)[-1]]
-                nor = nor + np.int8(info)
-            ind = (nor == 0)
-        elif mode in ['nand']:
-            nand = np.zeros([self._count(element), ], dtype=int)
-            for item in labels:  # Iterate over labels and collect all indices
-                info = self[element+'.'+item.split('.', 1)[-1]]
-                nand = nand + np.int8(info)
-            ind = (nand < len(labels)) * (nand > 0)
-        elif mode in ['xnor', 'nxor']:
-            xnor = np.zeros([self._count(element), ], dtype=int)
-            for item in labels:  # Iterate over labels and collect all indices
-                info = self[element+'.'+item.split('.', 1)[-1]]
-                xnor = xnor + np.int8(info)
-            ind = (xnor > 1)
-        else:
-            raise Exception('Unsupported mode: '+mode)
-        # Extract indices from boolean mask
-        ind = np.where(ind)[0]
-        ind = ind.astype(dtype=int)
-        return ind
+        mask = self._get_mask(element=element, labels=labels, mode=mode)
+        return np.flatnonzero(mask).astype(dtype=int, copy=False)
 
     def pores(self, labels=None, mode='or', asmask=False):
         r"""
@@ -473,10 +513,9 @@ class LabelMixin:
         """
         if labels is None:
             labels = self.name
-        ind = self._get_indices(element='pore', labels=labels, mode=mode)
         if asmask:
-            ind = self.to_mask(pores=ind)
-        return ind
+            return np.array(self._get_mask('pore', labels=labels, mode=mode))
+        return self._get_indices(element='pore', labels=labels, mode=mode)
 
     def throats(self, labels=None, mode='or', asmask=False):
         r"""
@@ -525,10 +564,9 @@ class LabelMixin:
         """
         if labels is None:
             labels = self.name
-        ind = self._get_indices(element='throat', labels=labels, mode=mode)
         if asmask:
-            ind = self.to_mask(throats=ind)
-        return ind
+            return np.array(self._get_mask('throat', labels=labels, mode=mode))
+        return self._get_indices(element='throat', labels=labels, mode=mode)
 
     def filter_by_label(self, pores=[], throats=[], labels=None, mode='or'):
         r"""
@@ -585,12 +623,8 @@ class LabelMixin:
             locations = self._parse_indices(throats)
         else:
             return np.array([], dtype=int)
-        labels = self._parse_labels(labels=labels, element=element)
-        labels = [element+'.'+item.split('.', 1)[-1] for item in labels]
-        all_locs = self._get_indices(element=element, labels=labels, mode=mode)
-        mask = self._tomask(indices=all_locs, element=element)
-        ind = mask[locations]
-        return locations[ind]
+        mask = self._get_mask(element=element, labels=labels, mode=mode)
+        return locations[mask[locations]]
 
     def num_pores(self, labels='all', mode='or'):
         r"""
@@ -641,9 +675,8 @@ class LabelMixin:
 
         """
         # Count number of pores of specified type
-        Ps = self._get_indices(labels=labels, mode=mode, element='pore')
-        Np = np.shape(Ps)[0]
-        return Np
+        mask = self._get_mask(labels=labels, mode=mode, element='pore')
+        return int(np.count_nonzero(mask))
 
     def num_throats(self, labels='all', mode='union'):
         r"""
@@ -691,7 +724,6 @@ class LabelMixin:
         not included.
 
         """
-        # Count number of pores of specified type
-        Ts = self._get_indices(labels=labels, mode=mode, element='throat')
-        Nt = np.shape(Ts)[0]
-        return Nt
+        # Count number of throats of specified type
+        mask = self._get_mask(labels=labels, mode=mode, element='throat')
+        return int(np.count_nonzero(mask))
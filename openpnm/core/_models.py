@@ -1,5 +1,6 @@
 import logging
 import inspect
+import weakref
 import openpnm as op
 import numpy as np
 from copy import deepcopy
@@ -35,15 +36,30 @@ class ModelsDict(PrintableDict):
 
     """
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_target', None)  # Weak references cannot be pickled
+        return state
+
+    def __setitem__(self, key, value):
+        if isinstance(value, ModelWrapper):
+            value._models = weakref.ref(self)
+        super().__setitem__(key, value)
+
     def _find_target(self):
         """
         Finds and returns the target object to which this ModelsDict is
         associated.
         """
+        ref = self.__dict__.get('_target', None)
+        obj = ref() if ref is not None else None
+        if (obj is not None) and (getattr(obj, 'models', None) is self):
+            return obj
         for proj in ws.values():
             for obj in proj:
                 if hasattr(obj, "models"):
                     if obj.models is self:
+                        self._target = weakref.ref(obj)
                         return obj
         raise Exception("No target object found!")
 
@@ -254,8 +270,25 @@ class ModelWrapper(dict):
                 kwargs[k] = v
         return model(self.target, **kwargs)
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_models', None)  # Weak references cannot be pickled
+        return state
+
+    def _find_models(self):
+        ref = self.__dict__.get('_models', None)
+        models = ref() if ref is not None else None
+        if models is not None:
+            for key, mod in models.items():
+                if mod is self:
+                    return key, models
+        return None, None
+
     @property
     def name(self):
+        key, _ = self._find_models()
+        if key is not None:
+            return key
         for proj in ws.values():
             for obj in proj:
                 if hasattr(obj, 'models'):
@@ -294,6 +327,9 @@ class ModelWrapper(dict):
         """
         Finds and returns the object to which this model is assigned
         """
+        _, models = self._find_models()
+        if models is not None:
+            return models._find_target()
         for proj in ws.values():
             for obj in proj:
                 if hasattr(obj, "models"):
@@ -313,6 +349,7 @@ class ModelsMixin2:
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.models = ModelsDict()
+        self.models._target = weakref.ref(self)
 
     def add_model(self, propname, model, domain='all', regen_mode='normal',
                   **kwargs):
@@ -470,15 +507,24 @@ class ModelsMixin2:
         tmp = [e.split("@")[0] for e in propnames]
         idx_sorted = [all_models.index(e) for e in tmp]
         propnames = [elem for i, elem in sorted(zip(idx_sorted, propnames))]
+        # Models can share intermediate results, such as conduit lengths,
+        # through _model_cache for the duration of the pass
+        outer = self._model_cache is None
+        if outer:
+            self._model_cache = {}
         # Now run each on in sequence
-        for item in propnames:
-            try:
-                self.run_model(item)
-            except KeyError as e:
-                msg = (f"{item} was not run since the following property"
-                       f" is missing: {e}")
-                logger.warning(msg)
-                self.models[item]['regen_mode'] = 'deferred'
+        try:
+            for item in propnames:
+                try:
+                    self.run_model(item)
+                except KeyError as e:
+                    msg = (f"{item} was not run since the following property"
+                           f" is missing: {e}")
+                    logger.warning(msg)
+                    self.models[item]['regen_mode'] = 'deferred'
+        finally:
+            if outer:
+                self._model_cache = None
 
     def run_model(self, propname, domain=None):
         r"""
@@ -537,9 +583,11 @@ class ModelsMixin2:
                     temp = self._initialize_empty_array_like(vals, element)
                     self[f'{element}.{prop}'] = temp
                 self[propname][self[f'{element}.{domain}']] = vals
+                self._touch(propname)
             elif isinstance(vals, dict):  # If model returns a dict of arrays
                 for k, v in vals.items():
                     if f'{propname}.{k}' not in self.keys():
                         temp = self._initialize_empty_array_like(v, element)
                         self[f'{propname}.{k}'] = temp
                     self[f'{propname}.{k}'][self[f'{element}.{domain}']] = v
+                    self._touch(f'{propname}.{k}')
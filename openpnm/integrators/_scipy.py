@@ -1,6 +1,5 @@
 from scipy.integrate import solve_ivp
 from openpnm.integrators import Integrator
-from openpnm.algorithms._solution import TransientSolution
 
 __all__ = ['ScipyRK45']
 
@@ -49,6 +48,8 @@ class ScipyRK45(Integrator):
             # FIXME: uncomment next line when/if scipy#11815 is merged
             # "verbose": self.verbose,
         }
+        # Imported here since algorithms itself imports this module
+        from openpnm.algorithms._solution import TransientSolution
         sol = solve_ivp(rhs, tspan, x0, method="RK45", **options)
         if sol.success:
             return TransientSolution(sol.t, sol.y)
@@ -8,10 +8,12 @@ between OpenPNM and other formats.
 """
 
 from ._utils import *
-from ._dict import project_to_dict
+from ._dict import project_to_dict, iter_project
 from ._vtk import project_to_vtk
 from ._pandas import project_to_pandas, network_to_pandas
 from ._csv import project_to_csv, network_to_csv, network_from_csv
+from ._arrow import project_to_arrow, network_from_arrow
+from ._arrow import project_to_parquet, network_to_parquet, network_from_parquet
 from ._hdf5 import project_to_hdf5, print_hdf5
 from ._xdmf import project_to_xdmf
 from ._marock import network_from_marock
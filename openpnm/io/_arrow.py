@@ -0,0 +1,235 @@
+import logging
+import numpy as np
+from openpnm.io import iter_project, _parse_filename
+from openpnm.utils import Project
+
+
+logger = logging.getLogger(__name__)
+
+
+__all__ = [
+    'project_to_arrow',
+    'network_from_arrow',
+    'project_to_parquet',
+    'network_to_parquet',
+    'network_from_parquet',
+]
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa
+    except ModuleNotFoundError:
+        msg = (
+            "The pyarrow package must be installed to use the Arrow and"
+            " Parquet exporters, which can be done with"
+            " conda install -c conda-forge pyarrow. It is not explicitly"
+            " included as a dependency of OpenPNM."
+        )
+        raise ModuleNotFoundError(msg)
+    return pa
+
+
+def _to_arrow_array(arr):
+    r"""
+    Converts an ndarray to an Arrow array, storing multi-column data as a
+    fixed-size list column.  Numerical data is wrapped without copying
+    when the array is contiguous.
+    """
+    pa = _import_pyarrow()
+    if arr.ndim == 1:
+        return pa.array(arr)
+    vals = np.ascontiguousarray(arr).reshape(arr.shape[0], -1)
+    return pa.FixedSizeListArray.from_arrays(pa.array(vals.ravel()),
+                                             vals.shape[1])
+
+
+def _from_arrow_array(col, field=None):
+    r"""
+    Converts an Arrow (chunked) array back to an ndarray, reshaping fixed
+    size list columns into 2D arrays, or into the shape stored in the
+    metadata of ``field`` for arrays with more than 2 dimensions
+    """
+    pa = _import_pyarrow()
+    if isinstance(col, pa.ChunkedArray):
+        col = col.combine_chunks()
+    if pa.types.is_fixed_size_list(col.type):
+        meta = (field.metadata if field is not None else None) or {}
+        shape = meta.get(b'openpnm.shape', None)
+        if shape is None:
+            shape = [col.type.list_size]
+        else:
+            shape = [int(i) for i in shape.decode().split(',')]
+        vals = col.flatten().to_numpy(zero_copy_only=False)
+        return vals.reshape(-1, *shape)
+    return col.to_numpy(zero_copy_only=False)
+
+
+def _items_to_table(items, element, network):
+    pa = _import_pyarrow()
+    fields, arrays = [], []
+    for k, v in items:
+        if v.dtype == 'O':
+            logger.warning(k + ' has dtype object, will not write to file')
+            continue
+        arr = _to_arrow_array(v)
+        # Arrays with more than 2 dimensions are stored flattened, so the
+        # trailing shape is kept in the field metadata to restore them
+        meta = None
+        if v.ndim > 2:
+            meta = {'openpnm.shape': ','.join(str(i) for i in v.shape[1:])}
+        fields.append(pa.field(k, arr.type, metadata=meta))
+        arrays.append(arr)
+    metadata = {'openpnm.element': element, 'openpnm.network': network}
+    schema = pa.schema(fields, metadata=metadata)
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def project_to_arrow(project):
+    r"""
+    Converts the data on all objects in the project to Arrow tables
+
+    Parameters
+    ----------
+    project : list
+        An OpenPNM ``project`` object
+
+    Returns
+    -------
+    tables : dict
+        A dictionary with ``'pore'`` and ``'throat'`` keys, each containing
+        a ``pyarrow.Table``. Columns are named ``<object name>.<propname>``
+        in both tables, so the network, phases and algorithms all share the
+        same layout. Multi-column properties like ``'pore.coords'`` and
+        ``'throat.conns'`` are stored as fixed-size list columns, with the
+        trailing shape of arrays with more than 2 dimensions stored in the
+        metadata of the field.
+
+    Notes
+    -----
+    Numerical arrays are handed to Arrow without copying where possible,
+    but boolean arrays are always copied since Arrow stores them as
+    packed bits.
+
+    """
+    network = project.network
+    tables = {}
+    for element in ['pore', 'throat']:
+        items = iter_project(project=project, element=element,
+                             categorize_by=['name'], delim='.')
+        tables[element] = _items_to_table(items, element=element,
+                                          network=network.name)
+    return tables
+
+
+def network_from_arrow(tables):
+    r"""
+    Creates a Network from a pair of Arrow tables
+
+    Parameters
+    ----------
+    tables : dict
+        A dictionary with ``'pore'`` and ``'throat'`` keys containing the
+        ``pyarrow.Table`` objects, as produced by ``project_to_arrow``.
+
+    Returns
+    -------
+    network : Network
+        A new Network object containing the data found in the tables that
+        belongs to the network. Data belonging to other objects is ignored.
+
+    """
+    from openpnm.network import Network
+    dct = {}
+    name = None
+    for element in ['pore', 'throat']:
+        table = tables[element]
+        meta = table.schema.metadata or {}
+        name = meta.get(b'openpnm.network', b'').decode() or name
+        for col in table.column_names:
+            obj, propname = col.split('.', 1)
+            if propname.startswith(element + '.') and (obj == name):
+                dct[propname] = _from_arrow_array(table.column(col),
+                                                  field=table.field(col))
+    network = Network(name=name)
+    network.update(dct)
+    return network
+
+
+def project_to_parquet(project, filename=''):
+    r"""
+    Saves all the pore and throat data in the project to a pair of Parquet
+    files
+
+    Parameters
+    ----------
+    project : list
+        An openpnm ``project`` object
+    filename : str or path object
+        The name of the file to store the data. The pore and throat data
+        are written to ``<filename>_pore.parquet`` and
+        ``<filename>_throat.parquet`` respectively.
+
+    """
+    _import_pyarrow()
+    import pyarrow.parquet as pq
+    tables = project_to_arrow(project)
+    if filename == '':
+        filename = project.name
+    fname = _parse_filename(filename=filename, ext='parquet')
+    for element, table in tables.items():
+        f = fname.with_name(fname.stem + '_' + element + fname.suffix)
+        pq.write_table(table, f)
+
+
+def network_to_parquet(network, filename=''):
+    r"""
+    Saves the pore and throat data on the given Network to a pair of
+    Parquet files
+
+    Parameters
+    ----------
+    network : Network
+        The Network whose data should be written
+    filename : str or path object
+        The name of the file to store the data. The pore and throat data
+        are written to ``<filename>_pore.parquet`` and
+        ``<filename>_throat.parquet`` respectively.
+
+    """
+    proj = Project()
+    proj.append(network)
+    if filename == '':
+        filename = network.name
+    project_to_parquet(proj, filename=filename)
+
+
+def network_from_parquet(filename):
+    r"""
+    Creates a Network from the Parquet files written by
+    ``project_to_parquet`` or ``network_to_parquet``
+
+    Parameters
+    ----------
+    filename : str or path object
+        The name of the files, either without the ``_pore``/``_throat``
+        suffix or pointing to either one of the pair.
+
+    Returns
+    -------
+    network : Network
+        A new Network object containing the network data
+
+    """
+    _import_pyarrow()
+    import pyarrow.parquet as pq
+    fname = _parse_filename(filename=filename, ext='parquet')
+    stem = fname.stem
+    for element in ['_pore', '_throat']:
+        if stem.endswith(element):
+            stem = stem[:-len(element)]
+    tables = {}
+    for element in ['pore', 'throat']:
+        f = fname.with_name(stem + '_' + element + fname.suffix)
+        tables[element] = pq.read_table(f, memory_map=True)
+    return network_from_arrow(tables)
@@ -1,4 +1,5 @@
 import logging
+import numpy as np
 from openpnm.utils import NestedDict
 from openpnm.utils._misc import is_transient, nbr_to_str
 
@@ -6,6 +7,12 @@ from openpnm.utils._misc import is_transient, nbr_to_str
 logger = logging.getLogger(__name__)
 
 
+__all__ = [
+    'project_to_dict',
+    'iter_project',
+]
+
+
 def project_to_dict(project, categorize_by=['name'], flatten=False, element=None,
                     delim=' | '):
     r"""
@@ -43,21 +50,76 @@ def project_to_dict(project, categorize_by=['name'], flatten=False, element=None
     actual format of which depends on the arguments to the function.
 
     """
-    network = project.network
-    phases = project.phases
-    algs = project.algorithms
-
     if flatten:
         d = {}
     else:
         d = NestedDict(delimiter=delim)
+    for path, arr in iter_project(project=project, categorize_by=categorize_by,
+                                  element=element, delim=delim):
+        d[path] = arr
+    return d
+
 
-    def build_path(obj, key):
+def iter_project(project, categorize_by=['name'], element=None, objects=None,
+                 dtype=None, delim=' | '):
+    r"""
+    Iterates over the data arrays in the given project without copying them
+
+    This is the lazy counterpart of ``project_to_dict``, and is the
+    preferred way for exporters to access the data since nothing is
+    collected in memory.
+
+    Parameters
+    ----------
+    project : list
+        An OpenPNM project object
+    categorize_by : str or list[str]
+        Indicates how the paths should be constructed.  Accepts the same
+        options as ``project_to_dict``.
+    element : str or list[str], optional
+        Only arrays belonging to the given element(s) are returned, either
+        ``'pore'``, ``'throat'`` or both (default).
+    objects : list, optional
+        The objects (or their names) whose data should be returned.  The
+        default is all the network, phase and algorithm objects.
+    dtype : dtype, optional
+        Only arrays whose dtype is a subtype of the given one are returned,
+        such as ``bool`` for labels or ``np.number`` for numerical data.
+    delim : str
+        The delimiter placed between the levels of each path
+
+    Yields
+    ------
+    path, array : tuple
+        The path of each array as it would appear in ``project_to_dict``,
+        and the array itself.  For transient algorithms the solution at
+        each time step is returned as a separate column view, with
+        ``'#<time>'`` appended to the path.
+
+    Notes
+    -----
+    The returned arrays are the ones stored on the objects, so they must
+    not be modified in place.
+
+    """
+    if isinstance(categorize_by, str):
+        categorize_by = [categorize_by]
+    if element is None:
+        element = ['pore', 'throat']
+    elif isinstance(element, str):
+        element = [element]
+    algs = project.algorithms
+    if objects is None:
+        objects = [project.network] + project.phases + algs
+    elif not isinstance(objects, list):
+        objects = [objects]
+    objects = [project[obj] if isinstance(obj, str) else obj for obj in objects]
+
+    def build_path(obj, key, arr):
         propname = key
         name = ''
         prefix = ''
         datatype = ''
-        arr = obj[key]
         if 'object' in categorize_by:
             if hasattr(obj, 'coords'):
                 prefix = 'network' + delim
@@ -75,28 +137,28 @@ def project_to_dict(project, categorize_by=['name'], flatten=False, element=None
         path = prefix + name + datatype + propname
         return path
 
-    for key in network.props(element=element) + network.labels(element=element):
-        path = build_path(obj=network, key=key)
-        d[path] = network[key]
-
-    for phase in phases:
-        for key in phase.props(element=element) + phase.labels(element=element):
-            path = build_path(obj=phase, key=key)
-            d[path] = phase[key]
-
-    for alg in algs:
-        try:  # 'quantity' is missing for multiphysics algorithm
-            key = alg.settings['quantity']
-        except AttributeError:
-            break
-        # only for transient algs
-        transient = is_transient(alg)
-        path = build_path(alg, key)
-        if transient:
-            times = alg.soln[key].t
-            for i, t in enumerate(times):
-                d[path + '#' + nbr_to_str(t)] = alg.soln[key][:, i]
+    def keep(arr):
+        return (dtype is None) or np.issubdtype(arr.dtype, dtype)
+
+    for obj in objects:
+        if obj in algs:
+            try:  # 'quantity' is missing for multiphysics algorithm
+                key = obj.settings['quantity']
+            except AttributeError:
+                continue
+            if (key.split('.', 1)[0] not in element) or (key not in obj.soln):
+                continue
+            soln = obj.soln[key]
+            if not keep(soln):
+                continue
+            path = build_path(obj, key, soln)
+            if is_transient(obj):
+                for i, t in enumerate(soln.t):
+                    yield path + '#' + nbr_to_str(t), soln[:, i]
+            else:
+                yield path, soln
         else:
-            d[path] = alg.soln[key]
-
-    return d
+            for key in obj.props(element=element) + obj.labels(element=element):
+                arr = obj[key]
+                if keep(arr):
+                    yield build_path(obj, key, arr), arr
@@ -1,6 +1,5 @@
 import logging
-from openpnm.io import project_to_dict, _parse_filename
-import pandas as pd
+from openpnm.io import iter_project, _parse_filename
 
 
 logger = logging.getLogger(__name__)
@@ -29,21 +28,17 @@ def project_to_hdf5(project, filename=''):
         filename = project.name
     filename = _parse_filename(filename, ext='hdf')
 
-    dct = project_to_dict(project=project)
-    d = pd.json_normalize(dct, sep='.').to_dict(orient='records')[0]
-    for k in list(d.keys()):
-        d[k.replace('.', '/')] = d.pop(k)
     f = hdfFile(filename, "w")
-    for item in list(d.keys()):
-        tempname = '_'.join(item.split('.'))
-        arr = d[item]
-        if d[item].dtype == 'O':
+    # Arrays are written one at a time straight from the objects
+    for item, arr in iter_project(project=project,
+                                  categorize_by=['name', 'element'],
+                                  delim='/'):
+        if arr.dtype == 'O':
             logger.warning(item + ' has dtype object, will not write to file')
-            del d[item]
-        elif 'U' in str(arr[0].dtype):
+        elif arr.dtype.kind == 'U':
             pass
         else:
-            f.create_dataset(name='/'+tempname, shape=arr.shape,
+            f.create_dataset(name='/'+item, shape=arr.shape,
                              dtype=arr.dtype, data=arr)
     return f
 
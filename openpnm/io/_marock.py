@@ -2,6 +2,8 @@ import logging
 import os as os
 import numpy as np
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from numba import njit
 from openpnm.network import Network
 from openpnm.topotools import trim
 
@@ -60,55 +62,35 @@ def network_from_marock(filename, voxel_size=1):
         elif file.endswith(".th2np"):
             th2np_file = os.path.join(path, file)
 
-    with open(np2th_file, mode='rb') as f:
-        [Np, Nt] = np.fromfile(file=f, count=2, dtype='u4')
-        net['pore.boundary_type'] = np.ndarray([Np, ], int)
-        net['throat.conns'] = np.ones([Nt, 2], int)*(-1)
-        net['pore.coordination'] = np.ndarray([Np, ], int)
-        net['pore.ID_number'] = np.ndarray([Np, ], int)
-        for i in range(0, Np):
-            ID = np.fromfile(file=f, count=1, dtype='u4')
-            net['pore.ID_number'][i] = ID
-            net['pore.boundary_type'][i] = np.fromfile(file=f, count=1,
-                                                       dtype='u1')
-            z = np.fromfile(file=f, count=1, dtype='u4')[0]
-            net['pore.coordination'][i] = z
-            att_pores = np.fromfile(file=f, count=z, dtype='u4')
-            att_throats = np.fromfile(file=f, count=z, dtype='u4')
-            for j in range(0, len(att_throats)):
-                t = att_throats[j] - 1
-                p = att_pores[j] - 1
-                net['throat.conns'][t] = [i, p]
-        net['throat.conns'] = np.sort(net['throat.conns'], axis=1)
-        net['pore.volume'] = np.fromfile(file=f, count=Np, dtype='u4')
-        nx = np.fromfile(file=f, count=1, dtype='u4')
-        nxy = np.fromfile(file=f, count=1, dtype='u4')
-        pos = np.fromfile(file=f, count=Np, dtype='u4')
-        ny = nxy/nx
-        ni = np.mod(pos, nx)
-        nj = np.mod(np.floor(pos/nx), ny)
-        nk = np.floor(np.floor(pos/nx)/ny)
-        net['pore.coords'] = np.array([ni, nj, nk]).T
-
-    with open(th2np_file, mode='rb') as f:
-        Nt = np.fromfile(file=f, count=1, dtype='u4')[0]
-        net['throat.cross_sectional_area'] = \
-            np.ones([Nt, ], dtype=int)*(-1)
-        for i in range(0, Nt):
-            ID = np.fromfile(file=f, count=1, dtype='u4')
-            net['throat.cross_sectional_area'][i] = \
-                np.fromfile(file=f, count=1, dtype='f4')
-            # numvox = np.fromfile(file=f, count=1, dtype='u4')
-            att_pores = np.fromfile(file=f, count=2, dtype='u4')
-        nx = np.fromfile(file=f, count=1, dtype='u4')
-        nxy = np.fromfile(file=f, count=1, dtype='u4')
-        pos = np.fromfile(file=f, count=Nt, dtype='u4')
-        ny = nxy/nx
-        ni = np.mod(pos, nx)
-        nj = np.mod(np.floor(pos/nx), ny)
-        nk = np.floor(np.floor(pos/nx)/ny)
-        net['throat.coords'] = np.array([ni, nj, nk]).T
-        net['pore.internal'] = net['pore.boundary_type'] == 0
+    # Both files are independent so read them concurrently
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        np2th, th2np = pool.map(lambda f: np.fromfile(f, dtype='u1'),
+                                [np2th_file, th2np_file])
+
+    # The pore records have a variable length depending on the number of
+    # neighbors, so they are walked in a compiled loop
+    Np, Nt = np.frombuffer(np2th, dtype='<u4', count=2)
+    ID, btype, coordination, conns, i = _parse_pore_records(np2th, Np, Nt)
+    net['pore.ID_number'] = ID
+    net['pore.boundary_type'] = btype
+    net['pore.coordination'] = coordination
+    net['throat.conns'] = np.sort(conns, axis=1)
+    net['pore.volume'] = np.frombuffer(np2th, dtype='<u4', count=Np, offset=i)
+    i += 4*Np
+    nx, nxy = np.frombuffer(np2th, dtype='<u4', count=2, offset=i)
+    pos = np.frombuffer(np2th, dtype='<u4', count=Np, offset=i+8)
+    net['pore.coords'] = _pos_to_coords(pos, nx, nxy)
+
+    # The throat records have a fixed length so are read in one pass
+    Nt = np.frombuffer(th2np, dtype='<u4', count=1)[0]
+    dtype = np.dtype([('ID', '<u4'), ('area', '<f4'), ('pores', '<u4', 2)])
+    throats = np.frombuffer(th2np, dtype=dtype, count=Nt, offset=4)
+    net['throat.cross_sectional_area'] = throats['area'].astype(int)
+    i = 4 + dtype.itemsize*Nt
+    nx, nxy = np.frombuffer(th2np, dtype='<u4', count=2, offset=i)
+    pos = np.frombuffer(th2np, dtype='<u4', count=Nt, offset=i+8)
+    net['throat.coords'] = _pos_to_coords(pos, nx, nxy)
+    net['pore.internal'] = net['pore.boundary_type'] == 0
 
     # Convert voxel area and volume to actual dimensions
     net['throat.cross_sectional_area'] = \
@@ -123,3 +105,38 @@ def network_from_marock(filename, voxel_size=1):
     trim(network=network, throats=ind)
 
     return network
+
+
+def _pos_to_coords(pos, nx, nxy):
+    ny = nxy/nx
+    ni = np.mod(pos, nx)
+    nj = np.mod(np.floor(pos/nx), ny)
+    nk = np.floor(np.floor(pos/nx)/ny)
+    return np.array([ni, nj, nk]).T
+
+
+@njit(cache=True)
+def _read_u4(buf, i):  # pragma: no cover
+    return buf[i] | (buf[i+1] << 8) | (buf[i+2] << 16) | (buf[i+3] << 24)
+
+
+@njit(cache=True)
+def _parse_pore_records(buf, Np, Nt):  # pragma: no cover
+    ID = np.empty(Np, dtype=np.int64)
+    btype = np.empty(Np, dtype=np.int64)
+    coordination = np.empty(Np, dtype=np.int64)
+    conns = -np.ones((Nt, 2), dtype=np.int64)
+    i = 8  # Skip Np and Nt at the start of the file
+    for n in range(Np):
+        ID[n] = _read_u4(buf, i)
+        btype[n] = buf[i+4]
+        z = _read_u4(buf, i+5)
+        coordination[n] = z
+        i += 9
+        for j in range(z):
+            p = _read_u4(buf, i + 4*j) - 1
+            t = _read_u4(buf, i + 4*(z + j)) - 1
+            conns[t, 0] = n
+            conns[t, 1] = p
+        i += 8*z
+    return ID, btype, coordination, conns, i
@@ -1,6 +1,6 @@
 import numpy as np
 from pandas import DataFrame
-from openpnm.io import project_to_dict
+from openpnm.io import iter_project
 from openpnm.utils import sanitize_dict, Project
 
 
@@ -8,10 +8,10 @@ def network_to_pandas(network, join=False, delim='.'):
     proj = Project()
     proj.append(network)
     # Initialize pore and throat data dictionary using Dict class
-    pdata = project_to_dict(project=proj, element='pore',
-                            flatten=True, categorize_by=[], delim=delim)
-    tdata = project_to_dict(project=proj, element='throat',
-                            flatten=True, categorize_by=[], delim=delim)
+    pdata = dict(iter_project(project=proj, element='pore',
+                              categorize_by=[], delim=delim))
+    tdata = dict(iter_project(project=proj, element='throat',
+                              categorize_by=[], delim=delim))
     data = _to_pandas(pdata, tdata, join, Np=network.Np, Nt=network.Nt)
     return data
 
@@ -43,10 +43,10 @@ def project_to_pandas(project, join=False, delim='.'):
     network = project.network
 
     # Initialize pore and throat data dictionary using Dict class
-    pdata = project_to_dict(project=project, element='pore',
-                            flatten=True, categorize_by=['name'], delim=delim)
-    tdata = project_to_dict(project=project, element='throat',
-                            flatten=True, categorize_by=['name'], delim=delim)
+    pdata = dict(iter_project(project=project, element='pore',
+                              categorize_by=['name'], delim=delim))
+    tdata = dict(iter_project(project=project, element='throat',
+                              categorize_by=['name'], delim=delim))
     data = _to_pandas(pdata, tdata, join, Np=network.Np, Nt=network.Nt)
     return data
 
@@ -1,7 +1,6 @@
 import os
 import numpy as np
 import openpnm as op
-import pandas as pd
 
 
 def project_to_paraview(project, filename):  # pragma: no cover
@@ -49,22 +48,16 @@ def project_to_paraview(project, filename):  # pragma: no cover
     # Create a new 'XML PolyData Reader'
     Path = os.getcwd() + "\\" + file + '.vtp'
     net_vtp = paraview.simple.XMLPolyDataReader(FileName=[Path])
-    p = op.io.Dict.to_dict(project=project, element=['pore'],
-                           flatten=False,
-                           categorize_by=['data' 'object'])
-    # The folloing lines are bit complex but avoid using the flatdict lib
-    p = pd.json_normalize(p, sep='.').to_dict(orient='records')[0]
-    for k in list(p.keys()):
-        p[k.replace('.', ' | ')] = p.pop(k)
-    t = op.io.Dict.to_dict(project=project, element=['throat'],
-                           flatten=False,
-                           categorize_by=['data' 'object'])
-    t = pd.json_normalize(t, sep='.').to_dict(orient='records')[0]
-    for k in list(t.keys()):
-        t[k.replace('.', '/')] = t.pop(k)
-    # Now write the p and t dictionaries
-    net_vtp.CellArrayStatus = t.keys()
-    net_vtp.PointArrayStatus = p.keys()
+    # Use the same array names as written by project_to_vtk
+    p = [k for k, _ in op.io.iter_project(project=project, element='pore',
+                                          categorize_by=['object', 'data',
+                                                         'element'])]
+    t = [k for k, _ in op.io.iter_project(project=project, element='throat',
+                                          categorize_by=['object', 'data',
+                                                         'element'])]
+    # Now write the p and t lists
+    net_vtp.CellArrayStatus = t
+    net_vtp.PointArrayStatus = p
     # Get active view
     render_view = paraview.simple.GetActiveViewOrCreate('RenderView')
     # Uncomment following to set a specific view size
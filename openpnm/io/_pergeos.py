@@ -169,12 +169,16 @@ def network_from_pergeos(filename):
             elif s[0] == '#':
                 break
 
-        s = f.read().split('@')
+        # Split the data section into blocks, each starting with '@<key>',
+        # and parse each block in a single pass since newlines are treated
+        # as whitespace by the tokenizer
+        blocks = {}
+        for block in ('\n' + f.read()).split('\n@')[1:]:
+            key, data = block.split('\n', 1)
+            blocks[int(key.strip('@ '))] = data
         for key in propmap.keys():
-            if key in s:
-                data = s[key].split('\n')[1:]
-                data = ' '.join(data)
-                arr = np.fromstring(data, dtype=typemap[key], sep=' ')
+            if key in blocks.keys():
+                arr = np.fromstring(blocks[key], dtype=typemap[key], sep=' ')
                 arr = np.reshape(arr, newshape=shapemap[key])
                 net[propmap[key]] = arr
         # End file parsing
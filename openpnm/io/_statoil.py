@@ -1,16 +1,23 @@
-import os
 import logging
 import numpy as np
-from openpnm.topotools import trim, extend
+from concurrent.futures import ThreadPoolExecutor
+from openpnm.topotools import trim
 from openpnm.network import Network
 from pathlib import Path
-from pandas import read_table, DataFrame
-from tqdm.auto import tqdm
 
 
 logger = logging.getLogger(__name__)
 
 
+def _read_columns(filename, ncols, skiprows=0):
+    r"""
+    Reads the given number of whitespace delimited columns from a text
+    file, ignoring any additional columns on a row
+    """
+    return np.loadtxt(filename, skiprows=skiprows, usecols=range(ncols),
+                      ndmin=2)
+
+
 def network_from_statoil(path, prefix):
     r"""
     Load data from the \'dat\' files located in specified folder.
@@ -45,84 +52,60 @@ def network_from_statoil(path, prefix):
     specific property. Headers are not provided in the files, so one must
     refer to various theses and documents to interpret their meaning.
 
+    The four files are independent so they are parsed concurrently, and
+    each one is read in a single vectorized pass with a known number of
+    columns.
+
     """
     net = {}
 
+    path = Path(path).resolve()
+    # Number of columns to read and header rows to skip in each file.  The
+    # rows of node1 have a variable length since they list the neighbors of
+    # each pore, but only the first 4 columns are needed.
+    files = {
+        'link1': (6, 1),
+        'link2': (8, 0),
+        'node1': (4, 1),
+        'node2': (5, 0),
+    }
+    with ThreadPoolExecutor(max_workers=len(files)) as pool:
+        jobs = {k: pool.submit(_read_columns, Path(path, prefix+'_'+k+'.dat'),
+                               ncols=n, skiprows=skip)
+                for k, (n, skip) in files.items()}
+        data = {k: v.result() for k, v in jobs.items()}
+
     # Parse the link1 file
-    path = Path(path)
-    filename = Path(path.resolve(), prefix+'_link1.dat')
-    with open(filename, mode='r') as f:
-        link1 = read_table(filepath_or_buffer=f,
-                           header=None,
-                           skiprows=1,
-                           sep=' ',
-                           skipinitialspace=True,
-                           index_col=0)
-    link1.columns = ['throat.pore1', 'throat.pore2', 'throat.radius',
-                     'throat.shape_factor', 'throat.total_length']
+    link1 = data['link1']
     # Add link1 props to net
-    net['throat.conns'] = np.vstack((link1['throat.pore1']-1,
-                                     link1['throat.pore2']-1)).T
-    net['throat.conns'] = np.sort(net['throat.conns'], axis=1)
-    net['throat.radius'] = np.array(link1['throat.radius'])
-    net['throat.shape_factor'] = np.array(link1['throat.shape_factor'])
-    net['throat.total_length'] = np.array(link1['throat.total_length'])
-
-    filename = Path(path.resolve(), prefix+'_link2.dat')
-    with open(filename, mode='r') as f:
-        link2 = read_table(filepath_or_buffer=f,
-                           header=None,
-                           sep=' ',
-                           skipinitialspace=True,
-                           index_col=0)
-    link2.columns = ['throat.pore1', 'throat.pore2',
-                     'throat.pore1_length', 'throat.pore2_length',
-                     'throat.length', 'throat.volume',
-                     'throat.clay_volume']
+    net['throat.conns'] = np.sort(link1[:, 1:3].astype(int) - 1, axis=1)
+    net['throat.radius'] = link1[:, 3]
+    net['throat.shape_factor'] = link1[:, 4]
+    net['throat.total_length'] = link1[:, 5]
+
+    # Parse the link2 file
+    link2 = data['link2']
     # Add link2 props to net
-    cl_t = np.array(link2['throat.length'])
+    cl_t = link2[:, 5]
     net['throat.length'] = cl_t
     net['throat.conduit_lengths.throat'] = cl_t
-    net['throat.volume'] = np.array(link2['throat.volume'])
-    cl_p1 = np.array(link2['throat.pore1_length'])
-    net['throat.conduit_lengths.pore1'] = cl_p1
-    cl_p2 = np.array(link2['throat.pore2_length'])
-    net['throat.conduit_lengths.pore2'] = cl_p2
-    net['throat.clay_volume'] = np.array(link2['throat.clay_volume'])
+    net['throat.volume'] = link2[:, 6]
+    net['throat.conduit_lengths.pore1'] = link2[:, 3]
+    net['throat.conduit_lengths.pore2'] = link2[:, 4]
+    net['throat.clay_volume'] = link2[:, 7]
     # ---------------------------------------------------------------------
     # Parse the node1 file
-    filename = Path(path.resolve(), prefix+'_node1.dat')
-    with open(filename, mode='r') as f:
-        row_0 = f.readline().split()
-        num_lines = int(row_0[0])
-        array = np.ndarray([num_lines, 6])
-        for i in range(num_lines):
-            row = f.readline()\
-                   .replace('\t', ' ').replace('\n', ' ').split()
-            array[i, :] = row[0:6]
-    node1 = DataFrame(array[:, [1, 2, 3, 4]])
-    node1.columns = ['pore.x_coord', 'pore.y_coord', 'pore.z_coord',
-                     'pore.coordination_number']
+    node1 = data['node1']
     # Add node1 props to net
-    net['pore.coords'] = np.vstack((node1['pore.x_coord'],
-                                    node1['pore.y_coord'],
-                                    node1['pore.z_coord'])).T
+    net['pore.coords'] = node1[:, 1:4]
     # ---------------------------------------------------------------------
     # Parse the node2 file
-    filename = Path(path.resolve(), prefix+'_node2.dat')
-    with open(filename, mode='r') as f:
-        node2 = read_table(filepath_or_buffer=f,
-                           header=None,
-                           sep=' ',
-                           skipinitialspace=True,
-                           index_col=0)
-    node2.columns = ['pore.volume', 'pore.radius', 'pore.shape_factor',
-                     'pore.clay_volume']
+    node2 = data['node2']
     # Add node2 props to net
-    net['pore.volume'] = np.array(node2['pore.volume'])
-    net['pore.radius'] = np.array(node2['pore.radius'])
-    net['pore.shape_factor'] = np.array(node2['pore.shape_factor'])
-    net['pore.clay_volume'] = np.array(node2['pore.clay_volume'])
+    net['pore.volume'] = node2[:, 1]
+    net['pore.radius'] = node2[:, 2]
+    net['pore.shape_factor'] = node2[:, 3]
+    net['pore.clay_volume'] = node2[:, 4]
     net['throat.cross_sectional_area'] = ((net['throat.radius']**2)
                                           / (4.0*net['throat.shape_factor']))
     net['pore.area'] = ((net['pore.radius']**2)
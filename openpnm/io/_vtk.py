@@ -1,8 +1,7 @@
 import logging
 import numpy as np
-import pandas as pd
 from xml.etree import ElementTree as ET
-from openpnm.io import project_to_dict, _parse_filename
+from openpnm.io import iter_project, _parse_filename
 from openpnm.utils import Workspace
 from openpnm.utils._misc import is_transient
 logger = logging.getLogger(__name__)
@@ -69,11 +68,8 @@ def project_to_vtk(project, filename="",
         filename = project.name
     filename = _parse_filename(filename=filename, ext="vtp")
 
-    am = project_to_dict(project=project,
-                         categorize_by=["object", "data"])
-    am = pd.json_normalize(am, sep='.').to_dict(orient='records')[0]
-    for k in list(am.keys()):
-        am[k.replace('.', ' | ')] = am.pop(k)
+    am = dict(iter_project(project=project,
+                           categorize_by=["object", "data", "element"]))
     key_list = list(sorted(am.keys()))
 
     points = network["pore.coords"]
@@ -101,20 +97,21 @@ def project_to_vtk(project, filename="",
         if array.dtype == "O":
             logger.warning(key + " has dtype object," + " will not write to file")
         else:
-            if array.dtype == np.bool:
+            if array.dtype == bool:
                 array = array.astype(int)
+            # The arrays belong to the objects, so fill into new arrays
             if np.any(np.isnan(array)):
                 if fill_nans is None:
                     logger.warning(key + " has nans," + " will not write to file")
                     continue
                 else:
-                    array[np.isnan(array)] = fill_nans
+                    array = np.where(np.isnan(array), fill_nans, array)
             if np.any(np.isinf(array)):
                 if fill_infs is None:
                     logger.warning(key + " has infs," + " will not write to file")
                     continue
                 else:
-                    array[np.isinf(array)] = fill_infs
+                    array = np.where(np.isinf(array), fill_infs, array)
             element = _array_to_element(key, array)
             if array.size == num_points:
                 point_data_node.append(element)
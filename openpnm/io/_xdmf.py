@@ -1,7 +1,6 @@
 import logging
-import pandas as pd
 import xml.etree.cElementTree as ET
-from openpnm.io import project_to_dict, _parse_filename
+from openpnm.io import iter_project, _parse_filename
 from openpnm.utils._misc import is_transient
 
 
@@ -41,11 +40,9 @@ def project_to_xdmf(project, filename=''):
     path = _parse_filename(filename=filename, ext='xmf')
     # Path is a pathlib object, so slice it up as needed
     fname_xdf = path.name
-    d = project_to_dict(project=project, flatten=False,
-                        categorize_by=['element', 'data'])
-    D = pd.json_normalize(d, sep='.').to_dict(orient='records')[0]
-    for k in list(D.keys()):
-        D[k.replace('.', '/')] = D.pop(k)
+    # This only holds references to the arrays on each object
+    D = dict(iter_project(project=project, categorize_by=['element', 'data'],
+                          delim='/'))
     # Identify time steps
     t_steps = []
     if transient:
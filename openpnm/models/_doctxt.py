@@ -1,4 +1,4 @@
-from matplotlib.docstring import Substitution
+import inspect
 
 
 __all__ = [
@@ -6,7 +6,24 @@ __all__ = [
 ]
 
 
-_doctxt = Substitution(
+class _Substitution:
+    r"""
+    Decorator that performs %-substitution on a function's docstring
+
+    This is equivalent to ``matplotlib.docstring.Substitution``, but avoids
+    importing matplotlib just to build the docstrings of the models.
+    """
+
+    def __init__(self, **kwargs):
+        self.params = kwargs
+
+    def __call__(self, func):
+        if func.__doc__:
+            func.__doc__ = inspect.cleandoc(func.__doc__) % self.params
+        return func
+
+
+_doctxt = _Substitution(
     phase=
     r"""phase : OpenPNM Phase object
             The phase object to which this model is associated (i.e. attached).
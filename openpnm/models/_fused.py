@@ -0,0 +1,129 @@
+r"""
+Compiled kernels which evaluate several pore-scale models in one pass over
+the throats, used when the ``compiled_models`` setting of the ``Workspace``
+is ``True``
+"""
+import numpy as np
+from numba import njit, prange
+
+
+__all__ = [
+    'spheres_and_cylinders_conduits',
+    'series_conductance',
+]
+
+
+@njit(parallel=True, cache=True, error_model='numpy')
+def spheres_and_cylinders_conduits(Dp, Dt, c1, c2, L_ctc):
+    r"""
+    Computes the conduit lengths, and the hydraulic and diffusive size
+    factors, of conduits made of spherical pores and cylindrical throats
+
+    Parameters
+    ----------
+    Dp, Dt : ndarray
+        The pore and throat diameters
+    c1, c2 : ndarray
+        The pores on either end of each throat
+    L_ctc : ndarray
+        The center-to-center distance between the pores of each throat
+
+    Returns
+    -------
+    vals : ndarray
+        A 3-by-Nt-by-3 array containing the conduit lengths, hydraulic size
+        factors and diffusive size factors, each as ``[pore1, throat,
+        pore2]``
+    n_bad : int
+        The number of throats which are wider than one of their pores, in
+        which case the results are not meaningful
+
+    Notes
+    -----
+    The arithmetic mirrors the corresponding functions in
+    ``openpnm.models.geometry`` so the results agree with them to within
+    floating point round-off.
+
+    """
+    Nt = Dt.size
+    vals = np.empty((3, Nt, 3), dtype=np.float64)
+    n_bad = 0
+    for i in prange(Nt):
+        D1 = Dp[c1[i]]
+        D2 = Dp[c2[i]]
+        Di = Dt[i]
+        L = L_ctc[i]
+        if (Di > D1) or (Di > D2):
+            n_bad += 1
+        # Conduit lengths
+        if L - 0.5 * (D1 + D2) < 0:
+            L1 = (4 * L**2 + D1**2 - D2**2) / (8 * L)
+            L2 = L - L1
+        else:
+            L1 = np.sqrt(D1**2 - Di**2) / 2
+            L2 = np.sqrt(D2**2 - Di**2) / 2
+        Li = max(L - (L1 + L2), 1e-15)
+        vals[0, i, 0] = L1
+        vals[0, i, 1] = Li
+        vals[0, i, 2] = L2
+        # Both size factors use the same integral of 1/r over the pores
+        T1 = np.arctanh(2 * L1 / D1)
+        T2 = np.arctanh(2 * L2 / D2)
+        # Hydraulic size factors
+        a = 4 / (D1**3 * np.pi**2)
+        b = 2 * D1 * L1 / (D1**2 - 4 * L1**2) + T1
+        F1 = a * b
+        a = 4 / (D2**3 * np.pi**2)
+        b = 2 * D2 * L2 / (D2**2 - 4 * L2**2) + T2
+        F2 = a * b
+        Fi = Li / (np.pi / 4 * Di**2)**2
+        I_r = 1 / (2 * np.pi)
+        vals[1, i, 0] = 1 / (16 * np.pi**2 * I_r * F1)
+        vals[1, i, 1] = 1 / (16 * np.pi**2 * I_r * Fi)
+        vals[1, i, 2] = 1 / (16 * np.pi**2 * I_r * F2)
+        # Diffusive size factors
+        F1 = 2 / (D1 * np.pi) * T1
+        F2 = 2 / (D2 * np.pi) * T2
+        Fi = Li / (np.pi / 4 * Di**2)
+        vals[2, i, 0] = 1 / F1
+        vals[2, i, 1] = 1 / Fi
+        vals[2, i, 2] = 1 / F2
+    return vals, n_bad
+
+
+@njit(parallel=True, cache=True, error_model='numpy')
+def series_conductance(c1, c2, SF, Kp, Kt, divide):
+    r"""
+    Computes the conductance of each conduit as three resistors in series
+
+    Parameters
+    ----------
+    c1, c2 : ndarray
+        The pores on either end of each throat
+    SF : ndarray
+        The Nt-by-3 array of conduit size factors
+    Kp, Kt : ndarray
+        The pore and throat values of the transport property
+    divide : bool
+        If ``True`` the size factors are divided by the property, as for
+        viscosity, otherwise they are multiplied by it
+
+    Returns
+    -------
+    g : ndarray
+        The conductance of each conduit
+
+    """
+    Nt = Kt.size
+    g = np.empty(Nt, dtype=np.float64)
+    for i in prange(Nt):
+        if divide:
+            g1 = SF[i, 0] / Kp[c1[i]]
+            gt = SF[i, 1] / Kt[i]
+            g2 = SF[i, 2] / Kp[c2[i]]
+        else:
+            g1 = Kp[c1[i]] * SF[i, 0]
+            gt = Kt[i] * SF[i, 1]
+            g2 = Kp[c2[i]] * SF[i, 2]
+        g[i] = 1 / (1 / g1 + 1 / gt + 1 / g2)
+    return g
@@ -1,4 +1,4 @@
-from matplotlib.docstring import Substitution
+from openpnm.models._doctxt import _Substitution
 
 
 __all__ = [
@@ -6,7 +6,7 @@ __all__ = [
 ]
 
 
-_geodocs = Substitution(
+_geodocs = _Substitution(
     network=
     r"""network : OpenPNM Network object
 
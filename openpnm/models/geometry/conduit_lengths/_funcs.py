@@ -1,6 +1,11 @@
 import numpy as np
 
 from openpnm.models.geometry import _geodocs
+from openpnm.utils import Workspace
+
+
+ws = Workspace()
+
 
 __all__ = [
     "spheres_and_cylinders",
@@ -45,22 +50,12 @@ def spheres_and_cylinders(
         ``[pore1, throat, pore2]``.
 
     """
-    L_ctc = _get_L_ctc(network)
-    D1, Dt, D2 = network.get_conduit_data(pore_diameter.split(".", 1)[-1]).T
-
-    # Handle the case where Dt > Dp
-    if (Dt > D1).any() or (Dt > D2).any():
-        _raise_incompatible_data()
-    L1 = np.sqrt(D1**2 - Dt**2) / 2
-    L2 = np.sqrt(D2**2 - Dt**2) / 2
-
-    # Handle throats w/ overlapping pores
-    _L1 = (4 * L_ctc**2 + D1**2 - D2**2) / (8 * L_ctc)
-    mask = L_ctc - 0.5 * (D1 + D2) < 0
-    L1[mask] = _L1[mask]
-    L2[mask] = (L_ctc - L1)[mask]
-    Lt = np.maximum(L_ctc - (L1 + L2), 1e-15)
-    return np.vstack((L1, Lt, L2)).T
+    vals = _compiled_spheres_and_cylinders(network, pore_diameter,
+                                           throat_diameter)
+    if vals is not None:
+        return vals[0].copy()
+    return _shared(_spheres_and_cylinders, network,
+                   pore_diameter=pore_diameter, throat_diameter=throat_diameter)
 
 
 @_geodocs
@@ -115,19 +110,8 @@ def cones_and_cylinders(
     -------
 
     """
-    L_ctc = _get_L_ctc(network)
-    D1, Dt, D2 = network.get_conduit_data(pore_diameter.split(".", 1)[-1]).T
-
-    L1 = D1 / 2
-    L2 = D2 / 2
-
-    # Handle throats w/ overlapping pores
-    _L1 = (4 * L_ctc**2 + D1**2 - D2**2) / (8 * L_ctc)
-    mask = L_ctc - 0.5 * (D1 + D2) < 0
-    L1[mask] = _L1[mask]
-    L2[mask] = (L_ctc - L1)[mask]
-    Lt = np.maximum(L_ctc - (L1 + L2), 1e-15)
-    return np.vstack((L1, Lt, L2)).T
+    return _shared(_cones_and_cylinders, network,
+                   pore_diameter=pore_diameter, throat_diameter=throat_diameter)
 
 
 @_geodocs
@@ -149,13 +133,8 @@ def intersecting_cones(network, pore_coords="pore.coords", throat_coords="throat
     -------
 
     """
-    P12 = network["throat.conns"]
-    p_coords = network[pore_coords]
-    t_coords = network[throat_coords]
-    L1 = np.sqrt(np.sum(((p_coords[P12[:, 0]] - t_coords)) ** 2, axis=1))
-    L2 = np.sqrt(np.sum(((p_coords[P12[:, 1]] - t_coords)) ** 2, axis=1))
-    Lt = np.zeros(len(network.Ts))
-    return np.vstack((L1, Lt, L2)).T
+    return _shared(_intersecting_cones, network,
+                   pore_coords=pore_coords, throat_coords=throat_coords)
 
 
 @_geodocs
@@ -178,24 +157,8 @@ def hybrid_cones_and_cylinders(
     -------
 
     """
-    L_ctc = _get_L_ctc(network)
-    D1, Dt, D2 = network.get_conduit_data(pore_diameter.split(".", 1)[-1]).T
-
-    L1 = D1 / 2
-    L2 = D2 / 2
-    Lt = np.maximum(L_ctc - (L1 + L2), 1e-15)
-    # Handle intersecting pores
-    XYp = network.coords[network.conns]
-    XYt = network[throat_coords]
-    _L1, _L2 = np.linalg.norm(XYp - XYt[:, None], axis=2).T
-    mask1 = _L1 < L1
-    mask2 = _L2 < L2
-    mask = np.logical_or(mask1, mask2)
-    if mask.any():
-        L1[mask] = _L1[mask]
-        L2[mask] = _L2[mask]
-        Lt[mask] = 0.0
-    return np.vstack((L1, Lt, L2)).T
+    return _shared(_hybrid_cones_and_cylinders, network,
+                   pore_diameter=pore_diameter, throat_coords=throat_coords)
 
 
 @_geodocs
@@ -382,20 +345,8 @@ def cubes_and_cuboids(
     -------
 
     """
-    L_ctc = _get_L_ctc(network)
-    D1, Dt, D2 = network.get_conduit_data(pore_diameter.split(".", 1)[-1]).T
-
-    L1 = D1 / 2
-    L2 = D2 / 2
-    Lt = L_ctc - (L1 + L2)
-
-    # Handle overlapping pores
-    mask = (Lt < 0) & (L1 > L2)
-    L2[mask] = (L_ctc - L1)[mask]
-    mask = (Lt < 0) & (L2 > L1)
-    L1[mask] = (L_ctc - L2)[mask]
-    Lt = np.maximum(Lt, 1e-15)
-    return np.vstack((L1, Lt, L2)).T
+    return _shared(_cubes_and_cuboids, network,
+                   pore_diameter=pore_diameter, throat_diameter=throat_diameter)
 
 
 @_geodocs
@@ -428,6 +379,146 @@ def squares_and_rectangles(
     )
 
 
+# Sharing conduit lengths between models
+def _shared(func, network, copy=True, **kwargs):
+    r"""
+    Calls ``func`` with the given arguments, or returns a copy of the result
+    of an earlier identical call made during the same ``regenerate_models``
+    pass if none of the data it depends on have been written to since
+    """
+    cache = getattr(network, '_model_cache', None)
+    if cache is None:
+        return func(network, **kwargs)
+    keys = {'pore.coords', 'throat.conns', 'throat.spacing'}
+    for v in kwargs.values():
+        prop = v.split('.', 1)[-1]
+        keys.update(['pore.' + prop, 'throat.' + prop])
+    version = (network.Np, network.Nt) \
+        + tuple(network._get_version(k) for k in sorted(keys))
+    key = ('conduit_lengths', func.__name__) + tuple(sorted(kwargs.items()))
+    if key not in cache or cache[key][0] != version:
+        cache[key] = (version, func(network, **kwargs))
+    return cache[key][1].copy() if copy else cache[key][1]
+
+
+def _compiled_spheres_and_cylinders(network, pore_diameter, throat_diameter):
+    r"""
+    Returns a 3-by-Nt-by-3 array of the conduit lengths, hydraulic size
+    factors and diffusive size factors of spheres and cylinders computed
+    in one pass, or ``None`` if compiled models are disabled or the data
+    is not in a form the compiled kernel handles
+    """
+    if not ws.settings.compiled_models:
+        return None
+    prop = pore_diameter.split(".", 1)[-1]
+    try:
+        Dp = network['pore.' + prop]
+        Dt = network['throat.' + prop]
+    except KeyError:
+        return None
+    if (Dp.ndim != 1) or (Dt.ndim != 1):
+        return None
+    return _shared(_spheres_and_cylinders_conduits, network, copy=False,
+                   pore_diameter=pore_diameter,
+                   throat_diameter=throat_diameter)
+
+
+def _spheres_and_cylinders_conduits(network, pore_diameter, throat_diameter):
+    from openpnm.models._fused import spheres_and_cylinders_conduits
+    prop = pore_diameter.split(".", 1)[-1]
+    c1, c2 = network.network._get_conduit_pores()
+    vals, n_bad = spheres_and_cylinders_conduits(
+        np.asarray(network['pore.' + prop], dtype=float),
+        np.asarray(network['throat.' + prop], dtype=float),
+        c1, c2, np.asarray(_get_L_ctc(network), dtype=float))
+    if n_bad:
+        _raise_incompatible_data()
+    return vals
+
+
+def _spheres_and_cylinders(network, pore_diameter, throat_diameter):
+    L_ctc = _get_L_ctc(network)
+    D1, Dt, D2 = network.get_conduit_data(pore_diameter.split(".", 1)[-1]).T
+
+    # Handle the case where Dt > Dp
+    if (Dt > D1).any() or (Dt > D2).any():
+        _raise_incompatible_data()
+    L1 = np.sqrt(D1**2 - Dt**2) / 2
+    L2 = np.sqrt(D2**2 - Dt**2) / 2
+
+    # Handle throats w/ overlapping pores
+    _L1 = (4 * L_ctc**2 + D1**2 - D2**2) / (8 * L_ctc)
+    mask = L_ctc - 0.5 * (D1 + D2) < 0
+    L1[mask] = _L1[mask]
+    L2[mask] = (L_ctc - L1)[mask]
+    Lt = np.maximum(L_ctc - (L1 + L2), 1e-15)
+    return np.vstack((L1, Lt, L2)).T
+
+
+def _cones_and_cylinders(network, pore_diameter, throat_diameter):
+    L_ctc = _get_L_ctc(network)
+    D1, Dt, D2 = network.get_conduit_data(pore_diameter.split(".", 1)[-1]).T
+
+    L1 = D1 / 2
+    L2 = D2 / 2
+
+    # Handle throats w/ overlapping pores
+    _L1 = (4 * L_ctc**2 + D1**2 - D2**2) / (8 * L_ctc)
+    mask = L_ctc - 0.5 * (D1 + D2) < 0
+    L1[mask] = _L1[mask]
+    L2[mask] = (L_ctc - L1)[mask]
+    Lt = np.maximum(L_ctc - (L1 + L2), 1e-15)
+    return np.vstack((L1, Lt, L2)).T
+
+
+def _intersecting_cones(network, pore_coords, throat_coords):
+    P12 = network["throat.conns"]
+    p_coords = network[pore_coords]
+    t_coords = network[throat_coords]
+    L1 = np.sqrt(np.sum(((p_coords[P12[:, 0]] - t_coords)) ** 2, axis=1))
+    L2 = np.sqrt(np.sum(((p_coords[P12[:, 1]] - t_coords)) ** 2, axis=1))
+    Lt = np.zeros(len(network.Ts))
+    return np.vstack((L1, Lt, L2)).T
+
+
+def _hybrid_cones_and_cylinders(network, pore_diameter, throat_coords):
+    L_ctc = _get_L_ctc(network)
+    D1, Dt, D2 = network.get_conduit_data(pore_diameter.split(".", 1)[-1]).T
+
+    L1 = D1 / 2
+    L2 = D2 / 2
+    Lt = np.maximum(L_ctc - (L1 + L2), 1e-15)
+    # Handle intersecting pores
+    XYp = network.coords[network.conns]
+    XYt = network[throat_coords]
+    _L1, _L2 = np.linalg.norm(XYp - XYt[:, None], axis=2).T
+    mask1 = _L1 < L1
+    mask2 = _L2 < L2
+    mask = np.logical_or(mask1, mask2)
+    if mask.any():
+        L1[mask] = _L1[mask]
+        L2[mask] = _L2[mask]
+        Lt[mask] = 0.0
+    return np.vstack((L1, Lt, L2)).T
+
+
+def _cubes_and_cuboids(network, pore_diameter, throat_diameter):
+    L_ctc = _get_L_ctc(network)
+    D1, Dt, D2 = network.get_conduit_data(pore_diameter.split(".", 1)[-1]).T
+
+    L1 = D1 / 2
+    L2 = D2 / 2
+    Lt = L_ctc - (L1 + L2)
+
+    # Handle overlapping pores
+    mask = (Lt < 0) & (L1 > L2)
+    L2[mask] = (L_ctc - L1)[mask]
+    mask = (Lt < 0) & (L2 > L1)
+    L1[mask] = (L_ctc - L2)[mask]
+    Lt = np.maximum(Lt, 1e-15)
+    return np.vstack((L1, Lt, L2)).T
+
+
 # Dealing with errors and exceptions
 def _raise_incompatible_data():
     msg = (
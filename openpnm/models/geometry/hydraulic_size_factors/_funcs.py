@@ -1,5 +1,8 @@
 import numpy as _np
 import openpnm.models.geometry.conduit_lengths as _conduit_lengths
+from openpnm.models.geometry.conduit_lengths._funcs import (
+    _compiled_spheres_and_cylinders,
+)
 from openpnm.models.geometry import _geodocs
 
 
@@ -59,6 +62,10 @@ def spheres_and_cylinders(
     pores on each end.
 
     """
+    vals = _compiled_spheres_and_cylinders(network, pore_diameter,
+                                           throat_diameter)
+    if vals is not None:
+        return vals[1].copy()
     D1, Dt, D2 = network.get_conduit_data(pore_diameter.split('.', 1)[-1]).T
     L1, Lt, L2 = _conduit_lengths.spheres_and_cylinders(
         network=network,
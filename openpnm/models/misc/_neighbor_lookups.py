@@ -5,6 +5,7 @@ Neighbor Lookups
 """
 import logging
 import numpy as np
+from openpnm._skgraph import queries
 logger = logging.getLogger(__name__)
 
 
@@ -39,36 +40,25 @@ def from_neighbor_throats(target, prop, mode='min', ignore_nans=True):
                          neighboring throats
             ===========  =====================================================
 
+    ignore_nans : bool (default is ``True``)
+        If ``True`` the result will ignore ``nans`` in the neighbors
+
     Returns
     -------
     value : ndarray
         Array containing customized values based on those of adjacent throats.
+        Pores with no (non-``nan``) neighboring throats receive ``inf`` for
+        'min', ``-inf`` for 'max' and ``nan`` for 'mean'.
 
     """
     network = target.network
-    data = target[prop]
-    nans = np.isnan(data)
-    im = network.create_incidence_matrix()
-    if mode == 'min':
-        if ignore_nans:
-            data[nans] = np.inf
-        values = np.ones((network.Np, ))*np.inf
-        np.minimum.at(values, im.row, data[im.col])
-    if mode == 'max':
-        if ignore_nans:
-            data[nans] = -np.inf
-        values = np.ones((network.Np, ))*-np.inf
-        np.maximum.at(values, im.row, data[im.col])
-    if mode == 'mean':
-        if ignore_nans:
-            data[nans] = 0
-        values = np.zeros((network.Np, ))
-        np.add.at(values, im.row, data[im.col])
-        counts = np.zeros((network.Np, ))
-        np.add.at(counts, im.row, np.ones((network.Nt, ))[im.col])
-        if ignore_nans:
-            np.subtract.at(counts, im.row, nans[im.col])
-        values = values/counts
+    if mode not in ['min', 'max', 'mean']:
+        raise Exception(f'Unrecognized mode: {mode}')
+    # The throats of each pore are stored as sorted segments, so each pore
+    # is reduced over a contiguous block instead of using ufunc.at
+    indptr, indices = network.get_neighbor_lists(element='throat')
+    values = queries.segment_reduce(indptr, target[prop][indices], mode=mode,
+                                    ignore_nans=ignore_nans)
     return values
 
 
@@ -112,16 +102,23 @@ def from_neighbor_pores(target, prop, mode='min', ignore_nans=True):
     network = target.network
     throats = target.Ts
     P12 = network.find_connected_pores(throats)
-    pvalues = target[prop][P12]
-    if ignore_nans:
-        pvalues = np.ma.MaskedArray(data=pvalues, mask=np.isnan(pvalues))
-    try:  # If pvalues is not empty
-        if mode == 'min':
-            value = np.amin(pvalues, axis=1)
-        if mode == 'max':
-            value = np.amax(pvalues, axis=1)
-        if mode == 'mean':
-            value = np.mean(pvalues, axis=1)
-    except np.AxisError:  # Handle case of empty pvalues
-        value = []
-    return np.array(value)
+    # The dtype is kept for 'min' and 'max' so labels and integers survive
+    pvalues = np.array(target[prop][P12], ndmin=2)
+    if mode == 'min':
+        f = np.fmin if ignore_nans else np.minimum
+        value = f(pvalues[:, 0], pvalues[:, 1])
+    elif mode == 'max':
+        f = np.fmax if ignore_nans else np.maximum
+        value = f(pvalues[:, 0], pvalues[:, 1])
+    elif mode == 'mean':
+        pvalues = pvalues.astype(float)
+        if ignore_nans:
+            nans = np.isnan(pvalues)
+            total = np.where(nans, 0, pvalues).sum(axis=1)
+            with np.errstate(invalid='ignore'):
+                value = total/(~nans).sum(axis=1)
+        else:
+            value = pvalues.mean(axis=1)
+    else:
+        raise Exception(f'Unrecognized mode: {mode}')
+    return value
@@ -1,6 +1,5 @@
 import logging
 import numpy as np
-import scipy.stats as spts
 from openpnm.models import _doctxt
 
 logger = logging.getLogger(__name__)
@@ -61,6 +60,7 @@ def weibull(network, seeds, shape, scale, loc):
        plt.show()
 
     """
+    import scipy.stats as spts
     seeds = network[seeds]
     value = spts.weibull_min.ppf(q=seeds, c=shape, scale=scale, loc=loc)
     return value
@@ -106,6 +106,7 @@ def normal(network, seeds, mean=None, stddev=None, scale=None, loc=None):
        plt.show()
 
     """
+    import scipy.stats as spts
     scale = stddev if stddev is not None else scale
     loc = mean if mean is not None else loc
     seeds = network[seeds]
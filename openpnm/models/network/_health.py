@@ -5,7 +5,6 @@ Health Checks
 """
 import logging
 import numpy as np
-import pandas as pd
 logger = logging.getLogger(__name__)
 
 __all__ = [
@@ -103,7 +102,11 @@ def duplicate_throats(network):
     r"""
     Find repeat occurrences of throat connections
     """
-    return pd.DataFrame(network.conns).duplicated().to_numpy()
+    hits = np.ones(network.Nt, dtype=bool)
+    # np.unique returns the index of the first occurrence of each row
+    _, first = np.unique(network.conns, axis=0, return_index=True)
+    hits[first] = False
+    return hits
 
 
 def count_coincident_pores(network, thresh=1e-6):
@@ -124,11 +127,7 @@ def count_coincident_pores(network, thresh=1e-6):
     """
     # This needs to be a bit complicated because it cannot be assumed
     # the coincident pores are topologically connected
-    import scipy.spatial as sptl
-    coords = network.coords
-    tree = sptl.KDTree(coords)
-    hits = tree.query_pairs(r=thresh)
-    arr = np.array(list(hits)).flatten()
+    arr = network.spatial_index.query_pairs(r=thresh).flatten()
     v, n = np.unique(arr, return_counts=True)
     values = np.zeros(network.Np, dtype=int)
     values[v.astype(int)] = n
@@ -156,9 +155,7 @@ def find_coincident_pores(network, thresh=1e-6):
     """
     # This needs to be a bit complicated because it cannot be assumed
     # the coincident pores are topologically connected
-    import scipy.spatial as sptl
-    coords = network['pore.coords']
-    tree = sptl.KDTree(coords)
+    tree = network.spatial_index.tree
     a = tree.sparse_distance_matrix(tree, max_distance=thresh,
                                     output_type='coo_matrix')
     a.data += 1.0
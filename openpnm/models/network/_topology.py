@@ -5,8 +5,8 @@ Pore-scale models related to topology of the network.
 
 """
 from numpy.linalg import norm
+from openpnm._skgraph import queries
 import numpy as np
-import scipy.spatial as sptl
 
 
 __all__ = [  # Keep this alphabetical for easier inspection of what's imported
@@ -48,10 +48,8 @@ def gabriel_edges(network):
     m = (c[:, 0, :] + c[:, 1, :])/2
     # Find the radius the sphere between each pair of nodes
     r = np.sqrt(np.sum((c[:, 0, :] - c[:, 1, :])**2, axis=1))/2
-    # Use the kd-tree function in Scipy's spatial module
-    tree = sptl.cKDTree(dn['pore.coords'])
     # Find the nearest point for each midpoint
-    n = tree.query(x=m, k=1)[0]
+    n = dn.spatial_index.query_knn(m, k=1)[0][:, 0]
     # If nearest point to m is at distance r, then the edge is a Gabriel edge
     g = n >= r*(0.999)  # This factor avoids precision errors in the distances
     return g
@@ -80,29 +78,24 @@ def distance_to_nearest_neighbor(network):
     r"""
     Find the distance between each pore and its closest topological neighbor
     """
-    cn = network['throat.conns']
-    C1 = network['pore.coords'][cn[:, 0]]
-    C2 = network['pore.coords'][cn[:, 1]]
-    D = norm(C1 - C2, axis=1)
-    im = network.create_incidence_matrix()
-    values = np.ones((network.Np, ))*np.inf
-    np.minimum.at(values, im.row, D[im.col])
-    return np.array(values)
+    D = _neighbor_distances(network)
+    return queries.segment_reduce(D[0], D[1], mode='min')
 
 
 def distance_to_furthest_neighbor(network):
     r"""
     Find the distance between each pore and its furthest topological neighbor
     """
-    throats = network.throats(network.name)
-    cn = network['throat.conns'][throats]
-    C1 = network['pore.coords'][cn[:, 0]]
-    C2 = network['pore.coords'][cn[:, 1]]
-    D = norm(C1 - C2, axis=1)
-    im = network.create_incidence_matrix()
-    values = np.zeros((network.Np, ))
-    np.maximum.at(values, im.row, D[im.col])
-    return np.array(values)
+    D = _neighbor_distances(network)
+    values = queries.segment_reduce(D[0], D[1], mode='max')
+    return np.maximum(values, 0)  # Isolated pores give -inf
+
+
+def _neighbor_distances(network):
+    indptr, indices = network.get_neighbor_lists(element='pore')
+    Ps = np.repeat(np.arange(network.Np), np.diff(indptr))
+    coords = network['pore.coords']
+    return indptr, norm(coords[Ps] - coords[indices], axis=1)
 
 
 def distance_to_nearest_pore(network):
@@ -110,9 +103,6 @@ def distance_to_nearest_pore(network):
     Find distance to and index of nearest pore even if not topologically
     connected
     """
-    import scipy.spatial as sptl
-    coords = network.coords
-    tree = sptl.KDTree(coords)
-    ds, ids = tree.query(coords, k=2)
+    ds, ids = network.spatial_index.query_knn(network.coords, k=2)
     values = ds[:, 1]
     return values
@@ -1,4 +1,4 @@
-from matplotlib.docstring import Substitution
+from openpnm.models._doctxt import _Substitution
 
 
 __all__ = [
@@ -6,7 +6,7 @@ __all__ = [
 ]
 
 
-_phasedocs = Substitution(
+_phasedocs = _Substitution(
     phase=
     r"""phase : OpenPNM Phase object
             The phase object to which this model is associated (i.e. attached).
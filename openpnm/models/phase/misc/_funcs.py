@@ -1,3 +1,4 @@
+import inspect
 import numpy as np
 from openpnm.models.phase import _phasedocs
 
@@ -5,6 +6,7 @@ from openpnm.models.phase import _phasedocs
 __all__ = [
     "mix_and_match",
     "mole_to_mass_fraction",
+    "cached_correlation",
 ]
 
 
@@ -76,3 +78,224 @@ def mole_to_mass_fraction(
     for c in xs.keys():
         ms[c] = ms[c]/denom
     return ms
+
+
+class _NotUniform(Exception):
+    pass
+
+
+class _PhaseView:
+    r"""
+    Stands in for a phase while a correlation is evaluated, recording the
+    version of each item it reads and optionally reducing uniform arrays to
+    a single value
+    """
+
+    def __init__(self, phase, reduce=False, T=None, T_vals=None):
+        self.phase = phase
+        self.reduce = reduce
+        self.T = T
+        self.T_vals = T_vals
+        self.N = None
+        self.inputs = {}
+        self.tracked = True
+
+    def __getitem__(self, key):
+        try:
+            vals = self.phase[key]
+        except KeyError:
+            # The result depends on the key being missing, so is only
+            # valid until the set of keys changes
+            self.inputs[None] = self.phase._keys_version
+            raise
+        sig = _signature(self.phase, key)
+        if sig is None:
+            self.tracked = False
+        self.inputs[key] = sig
+        if key == self.T and self.T_vals is not None:
+            return self.T_vals
+        if self.reduce and isinstance(vals, np.ndarray) and (vals.ndim == 1):
+            if (vals.size == 0) or not (vals.min() == vals.max()):
+                raise _NotUniform
+            self.N = vals.size
+            vals = vals[:1]
+        return vals
+
+    def __contains__(self, key):
+        self.inputs[None] = self.phase._keys_version
+        return key in self.phase
+
+    def keys(self):
+        self.inputs[None] = self.phase._keys_version
+        return self.phase.keys()
+
+    def __getattr__(self, name):
+        # Anything not read by key, such as components, cannot be tracked
+        self.tracked = False
+        return getattr(self.phase, name)
+
+
+def _signature(phase, key):
+    if key.startswith('param'):
+        return ('value', np.copy(phase[key]))
+    if dict.__contains__(phase, key):
+        return ('version', phase._get_version(key))
+    network = phase.network
+    if (network is not phase) and dict.__contains__(network, key):
+        return ('network', network._get_version(key))
+    return None  # Interpolated or domain data has no version
+
+
+def _is_current(phase, inputs):
+    for key, sig in inputs.items():
+        if key is None:
+            if sig != phase._keys_version:
+                return False
+        elif sig[0] == 'value':
+            if key[6:] not in phase.params:
+                return False
+            if not np.array_equal(sig[1], phase[key]):
+                return False
+        elif _signature(phase, key) != sig:
+            return False
+    return True
+
+
+def _evaluate(phase, func, kwargs, T=None, T_vals=None, reduce=False):
+    view = _PhaseView(phase, reduce=reduce, T=T, T_vals=T_vals)
+    vals = func(view, **kwargs)
+    return vals, view
+
+
+@_phasedocs
+def cached_correlation(
+    phase,
+    func,
+    T='pore.temperature',
+    T_range=None,
+    points=1000,
+    **kwargs,
+):
+    r"""
+    Evaluates a correlation only when its inputs have changed, and only
+    once when they are uniform
+
+    Parameters
+    ----------
+    %(phase)s
+    func : function
+        The pore-scale model to evaluate, such as
+        ``openpnm.models.phase.viscosity.water_correlation``
+    %(T)s
+    T_range : list, optional
+        The lower and upper temperatures over which to tabulate ``func``. If
+        given, the correlation is evaluated once at ``points`` evenly spaced
+        temperatures and the values in each pore are found by linear
+        interpolation of this table. The default is ``None``, which
+        evaluates ``func`` directly.
+    points : int
+        The number of temperatures in the table, if ``T_range`` is given
+    kwargs
+        All other arguments are passed on to ``func``
+
+    Returns
+    -------
+    vals : ndarray
+        The values returned by ``func``
+
+    Notes
+    -----
+    The correlation is evaluated as follows:
+
+    1. If none of the items read by ``func`` have been written to since the
+       last call, the previous result is returned. Writing into an array
+       in-place, such as ``phase['pore.temperature'][0] = 300``, cannot be
+       detected so the array should be reassigned instead.
+    2. If all the arrays read by ``func`` are uniform, it is evaluated on a
+       single value and the result is copied to all locations.
+    3. If ``T_range`` is given and all the arrays except temperature are
+       uniform, the values are interpolated from the table, which is
+       itself only rebuilt when the other inputs change. Temperatures
+       outside ``T_range`` fall back to evaluating ``func`` directly.
+    4. Otherwise ``func`` is evaluated in every location.
+
+    Only models which return a single array and read all their inputs from
+    ``phase`` by key benefit from this. Any other models are evaluated
+    directly every time, which gives the same results.
+
+    Examples
+    --------
+    >>> import openpnm as op
+    >>> pn = op.network.Cubic(shape=[5, 5, 5])
+    >>> water = op.phase.Water(network=pn)
+    >>> water.add_model(
+    ...     propname='pore.viscosity',
+    ...     model=op.models.phase.misc.cached_correlation,
+    ...     func=op.models.phase.viscosity.water_correlation,
+    ...     T_range=[273.15, 373.15])
+
+    """
+    if 'T' in inspect.getfullargspec(func).args:
+        kwargs['T'] = T
+    if T_range is not None:
+        T_range = tuple(T_range)
+    try:  # Arguments such as arrays cannot be used to identify results
+        key = (func, tuple(sorted(kwargs.items())), T_range, points)
+        hash(key)
+    except TypeError:
+        key = None
+    cache = phase._correlation_cache
+    hit = cache.get(key, None)
+    if (hit is not None) and _is_current(phase, hit[0]):
+        return hit[1].copy()
+    vals = None
+    try:  # Evaluate once if all inputs are uniform
+        temp, view = _evaluate(phase, func, kwargs, reduce=True)
+        if isinstance(temp, np.ndarray) and (temp.size == 1) and view.N:
+            vals = np.full(view.N, temp.item(), dtype=temp.dtype)
+    except _NotUniform:
+        pass
+    if (vals is None) and (T_range is not None):
+        vals, view = _interpolate(phase, func, kwargs, T, T_range, points, key)
+    if vals is None:
+        vals, view = _evaluate(phase, func, kwargs)
+    if (key is not None) and view.tracked and isinstance(vals, np.ndarray):
+        cache[key] = (view.inputs, vals)
+        vals = vals.copy()
+    return vals
+
+
+def _interpolate(phase, func, kwargs, T, T_range, points, key):
+    if key is None:
+        return None, None
+    key = key + ('table', )
+    cache = phase._correlation_cache
+    hit = cache.get(key, None)
+    T_vals = np.linspace(T_range[0], T_range[1], int(points))
+    if (hit is None) or not _is_current(phase, hit[0]):
+        try:
+            table, view = _evaluate(phase, func, kwargs, T=T, T_vals=T_vals,
+                                    reduce=True)
+        except _NotUniform:
+            return None, None
+        if not view.tracked or not (isinstance(table, np.ndarray)
+                                    and table.shape == T_vals.shape):
+            return None, None
+        inputs = view.inputs.copy()
+        inputs.pop(T, None)
+        hit = cache[key] = (inputs, table)
+    temp = phase[T]
+    if (temp.min() < T_vals[0]) or (temp.max() > T_vals[-1]):
+        return None, None
+    view = _PhaseView(phase)
+    view.inputs = {**hit[0], T: _signature(phase, T)}
+    view.tracked = view.inputs[T] is not None
+    # The table is evenly spaced so the interval of each value is found
+    # directly rather than by searching
+    table = hit[1]
+    x = (temp - T_vals[0])/(T_vals[1] - T_vals[0])
+    i = np.minimum(x.astype(np.intp), table.size - 2)
+    x -= i
+    vals = table[i]
+    vals += x*(table[i+1] - vals)
+    return vals, view
@@ -90,6 +90,9 @@ def mixing_rule(
         If ``mode='power'`` this indicates the value of the exponent,
         otherwise this is ignored.
     """
+    if isinstance(prop, str) and hasattr(phase, 'get_mix_vals'):
+        mode = 'linear' if mode == 'simple' else mode
+        return phase.get_mix_vals(prop, mode=mode, power=power)
     xs = phase['pore.mole_fraction']
     ys = phase.get_comp_vals(prop)
     z = 0.0
@@ -1,11 +1,17 @@
 r"""
 Pore-scale models for calculating the conductance of conduits.
 """
+import numpy as np
 from numpy import vstack
+from openpnm.utils import Workspace
+
+
+ws = Workspace()
 
 
 __all__ = [
     '_poisson_conductance',
+    '_compiled_series_conductance',
     '_get_key_props',
 ]
 
@@ -43,6 +49,12 @@ def _poisson_conductance(phase,
     already be calculated.
 
     """
+    g = _compiled_series_conductance(phase=phase,
+                                     pore_prop=pore_conductivity,
+                                     throat_prop=throat_conductivity,
+                                     size_factors=size_factors)
+    if g is not None:
+        return g
     network = phase.network
     cn = network.conns
     Dt = phase[throat_conductivity]
@@ -61,6 +73,34 @@ def _poisson_conductance(phase,
         return Dt * F
 
 
+def _compiled_series_conductance(phase,
+                                 pore_prop,
+                                 throat_prop,
+                                 size_factors,
+                                 divide=False):
+    r"""
+    Computes the conductance of the conduits in a single compiled pass,
+    multiplying (or dividing if ``divide`` is ``True``) the size factors by
+    the given pore and throat properties. Returns ``None`` if compiled
+    models are disabled or the data is not in a form the compiled kernel
+    handles.
+    """
+    if not ws.settings.compiled_models:
+        return None
+    network = phase.network
+    SF = network[size_factors]
+    Kp = phase[pore_prop]
+    Kt = phase[throat_prop]
+    if isinstance(SF, dict) or (SF.ndim != 2) or (Kp.ndim != 1) \
+            or (Kt.ndim != 1):
+        return None
+    from openpnm.models._fused import series_conductance
+    c1, c2 = network._get_conduit_pores()
+    return series_conductance(c1, c2, np.asarray(SF, dtype=float),
+                              np.asarray(Kp, dtype=float),
+                              np.asarray(Kt, dtype=float), divide)
+
+
 def _get_key_props(phase=None,
                    diameter="throat.diameter",
                    surface_tension="throat.surface_tension",
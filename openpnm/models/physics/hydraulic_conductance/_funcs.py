@@ -1,5 +1,6 @@
 import numpy as _np
 from openpnm.models import _doctxt
+from openpnm.models.physics._utils import _compiled_series_conductance
 
 
 __all__ = [
@@ -34,6 +35,13 @@ def generic_hydraulic(
     %(return_arr)s hydraulic conductance
 
     """
+    g = _compiled_series_conductance(phase=phase,
+                                     pore_prop=pore_viscosity,
+                                     throat_prop=throat_viscosity,
+                                     size_factors=size_factors,
+                                     divide=True)
+    if g is not None:
+        return g
     network = phase.network
     conns = network.conns
     mu1, mu2 = phase[pore_viscosity][conns].T
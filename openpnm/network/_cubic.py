@@ -1,3 +1,4 @@
+import os
 import logging
 import numpy as np
 from openpnm.network import Network
@@ -52,21 +53,74 @@ class Cubic(Network):
         can specify 14 or 18, then use ``openpnm.topotools.trim`` to remove
         the face-to-face connections, which can be identified by looking
         for throats with a length equal to the network spacing.
+    memmap_dir : str, optional
+        If given, the coordinates, connections and labels of the network,
+        as well as any properties written to it afterward, are stored in
+        memory-mapped ``.npy`` files in this directory instead of in RAM.
+        This allows networks with billions of throats to be generated and
+        used on machines without enough memory to hold them. The files
+        are not deleted when the network is.
 
     %(Network.parameters)s
 
     """
 
-    def __init__(self, shape, spacing=[1, 1, 1], connectivity=6, **kwargs):
+    def __init__(self, shape, spacing=[1, 1, 1], connectivity=6,
+                 memmap_dir=None, **kwargs):
         super().__init__(**kwargs)
+        if memmap_dir is not None:
+            memmap_dir = os.path.join(memmap_dir, self.settings['uuid'])
+            os.makedirs(memmap_dir, exist_ok=True)
         net = skgr.generators.cubic(shape=shape, spacing=spacing,
                                     connectivity=connectivity,
-                                    node_prefix='pore', edge_prefix='throat')
+                                    node_prefix='pore', edge_prefix='throat',
+                                    memmap_dir=memmap_dir)
         self.update(net)
-        self["pore.surface"] = skgr.tools.find_surface_nodes_cubic(self)
-        Ps = self["pore.surface"]
-        self["throat.surface"] = np.all(Ps[self["throat.conns"]], axis=1)
-        self.update(skgr.generators.tools.label_faces_cubic(self))
+        shape = np.array(shape, ndmin=1).tolist()
+        shape = shape + [1]*(3 - len(shape))
+        if memmap_dir is None:
+            self["pore.surface"] = skgr.tools.find_surface_nodes_cubic(self)
+            Ps = self["pore.surface"]
+            self["throat.surface"] = np.all(Ps[self["throat.conns"]], axis=1)
+            self.update(skgr.generators.tools.label_faces_cubic(self))
+        else:
+            self._memmap_dir = memmap_dir
+            self._label_lattice(shape)
+        self._lattice = {'shape': shape,
+                         'connectivity': connectivity,
+                         'mask': None,
+                         'version': self._get_version('throat.conns')}
+
+    def _label_lattice(self, shape):
+        r"""
+        Adds the surface and face labels directly from the lattice shape,
+        processing the throats in chunks, which gives the same result as
+        ``find_surface_nodes_cubic`` and ``label_faces_cubic`` without
+        holding any full-length temporary arrays in memory
+        """
+        faces = [('left', 'right'), ('front', 'back'), ('bottom', 'top')]
+        labels = {}
+        for key in ['surface'] + [k for ax, f in enumerate(faces)
+                                  if shape[ax] > 1 for k in f]:
+            labels[key] = self._empty('pore.' + key, (self.Np, ), bool)
+            labels[key].fill(False)
+        grid = {k: v.reshape(shape) for k, v in labels.items()}
+        for ax, (lo, hi) in enumerate(faces):
+            if shape[ax] == 1:  # Faces are only labelled along real axes
+                continue
+            for label, i in [(lo, 0), (hi, -1)]:
+                s = [slice(None)]*3
+                s[ax] = i
+                grid[label][tuple(s)] = True
+                grid['surface'][tuple(s)] = True
+        conns = self['throat.conns']
+        Ts = self._empty('throat.surface', (self.Nt, ), bool)
+        step = 2**20
+        for i in range(0, self.Nt, step):
+            Ts[i:i+step] = np.all(labels['surface'][conns[i:i+step]], axis=1)
+        labels = {'pore.' + k: v for k, v in labels.items()}
+        labels['throat.surface'] = Ts
+        self.update(labels)
 
     def add_boundary_pores(self, labels=["top", "bottom", "front",
                                          "back", "left", "right"],
@@ -46,6 +46,10 @@ class CubicTemplate(Network):
                              node_prefix='pore',
                              edge_prefix='throat')
         self.update(net)
+        self._lattice = {'shape': list(template.shape),
+                         'connectivity': 6,
+                         'mask': template.flatten().astype(bool),
+                         'version': self._get_version('throat.conns')}
         if not label_surface_pores:
             return
         self['pore.surface'] = find_surface_nodes(self)
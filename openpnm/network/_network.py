@@ -1,11 +1,12 @@
 import logging
 import numpy as np
 import scipy.sparse as sprs
-import scipy.spatial as sptl
 from openpnm.core import Domain
 from openpnm import topotools
 from openpnm.utils import Docorator
 from openpnm.utils import Workspace
+from openpnm.utils import SpatialIndex
+from openpnm._skgraph.queries import neighbors_from_csr
 import openpnm.models.network as mods
 logger = logging.getLogger(__name__)
 ws = Workspace()
@@ -95,6 +96,10 @@ class Network(Domain):
         self.settings._update(NetworkSettings())
         self._am = {}
         self._im = {}
+        self._lattice = None
+        self._spatial_index = None
+        self._topology = {'version': None}
+        self._edit_session = None
 
         if coords is not None:
             coords = np.array(coords)
@@ -139,7 +144,8 @@ class Network(Domain):
         This method will only create the requested matrix in the specified
         format if one is not already saved on the object.  If not present,
         this method will create and return the matrix, as well as store it
-        for future use.
+        for future use. The stored matrices are discarded when the topology
+        of the network changes (see ``_get_topology_cache``).
 
         To obtain a matrix with weights other than throat IDs at each
         non-zero location use ``create_adjacency_matrix``.
@@ -149,6 +155,7 @@ class Network(Domain):
 
         """
         # Retrieve existing matrix if available
+        self._get_topology_cache()
         if fmt in self._am.keys():
             am = self._am[fmt]
         else:
@@ -175,12 +182,14 @@ class Network(Domain):
         This method will only create the requested matrix in the specified
         format if one is not already saved on the object. If not present,
         this method will create and return the matrix, as well as store it
-        for future use.
+        for future use. The stored matrices are discarded when the topology
+        of the network changes (see ``_get_topology_cache``).
 
         To obtain a matrix with weights other than pore IDs at each
         non-zero location use ``create_incidence_matrix``.
 
         """
+        self._get_topology_cache()
         if fmt in self._im.keys():
             im = self._im[fmt]
         elif self._im.keys():
@@ -195,6 +204,136 @@ class Network(Domain):
 
     im = property(fget=get_incidence_matrix)
 
+    def _get_topology_cache(self):
+        r"""
+        Returns a dictionary for storing structures derived from the
+        topology of the network, such as sparsity patterns and degrees
+
+        The dictionary is emptied, along with the stored adjacency and
+        incidence matrices, whenever 'throat.conns' is written to or the
+        number of pores changes, so anything stored in it is always
+        consistent with the current topology.
+
+        Notes
+        -----
+        Writing into the existing 'throat.conns' array in-place, such as
+        ``pn['throat.conns'][0] = [1, 2]``, cannot be detected.
+        """
+        version = (self._get_version('throat.conns'), self.Np)
+        if self._topology['version'] != version:
+            self._am.clear()
+            self._im.clear()
+            self._topology = {'version': version}
+        return self._topology
+
+    def _get_pattern(self, kind):
+        r"""
+        Returns the CSR sparsity pattern of the adjacency matrix (``kind``
+        is 'full' or 'triu'), the incidence matrix ('im') or the Laplacian
+        ('laplacian'), computing it only once per topology
+        """
+        cache = self._get_topology_cache()
+        if kind not in cache:
+            conns = self['throat.conns']
+            if kind == 'triu':
+                row, col = conns[:, 0], conns[:, 1]
+            elif kind == 'im':
+                row = conns.flatten(order='F')
+                col = np.tile(np.arange(self.Nt), 2)
+            else:
+                row = conns.flatten(order='F')
+                col = conns[:, ::-1].flatten(order='F')
+            if kind == 'laplacian':
+                P = np.arange(self.Np)
+                cache[kind] = {'row': np.append(row, P),
+                               'col': np.append(col, P)}
+            else:
+                cache[kind] = _csr_pattern(row, col, self.Np)
+        return cache[kind]
+
+    def _create_laplacian(self, weights):
+        r"""
+        Creates the weighted Laplacian matrix in COO format, which is the
+        same as ``scipy.sparse.csgraph.laplacian`` applied to the matrix
+        from ``create_adjacency_matrix(weights)``, using the stored pattern
+        """
+        weights = np.array(weights, dtype=float)
+        if weights.shape == (self.Nt, 2):
+            weights = weights.flatten(order='F')
+        elif weights.shape == (self.Nt, ):
+            weights = np.append(weights, weights)
+        elif weights.shape != (2 * self.Nt, ):
+            raise Exception('Received weights are of incorrect length')
+        pattern = self._get_pattern('laplacian')
+        Nt2 = weights.size
+        # Self-loops do not contribute to the Laplacian
+        weights[pattern['row'][:Nt2] == pattern['col'][:Nt2]] = 0.0
+        diag = np.bincount(pattern['col'][:Nt2], weights=weights,
+                           minlength=self.Np)
+        return sprs.coo_matrix((np.append(-weights, diag),
+                                (pattern['row'], pattern['col'])),
+                               shape=(self.Np, self.Np))
+
+    def get_neighbor_lists(self, element='pore'):
+        r"""
+        Returns the neighbors of every pore in compressed sparse row (CSR)
+        form
+
+        Parameters
+        ----------
+        element : str
+            Either 'pore' (default) to get the neighboring pores of each
+            pore, or 'throat' to get the throats connected to each pore
+
+        Returns
+        -------
+        indptr, indices : ndarray
+            The neighbors of pore ``i`` are ``indices[indptr[i]:indptr[i+1]]``,
+            sorted in ascending order
+
+        Notes
+        -----
+        The lists are computed once and stored until the topology of the
+        network changes, so the returned arrays must not be modified.
+
+        Examples
+        --------
+        >>> import openpnm as op
+        >>> pn = op.network.Cubic(shape=[3, 3, 1])
+        >>> indptr, indices = pn.get_neighbor_lists(element='pore')
+        >>> print(indices[indptr[4]:indptr[5]])
+        [1 3 5 7]
+
+        """
+        kind = {'pore': 'full', 'throat': 'im'}[element.split('.', 1)[0]]
+        pattern = self._get_pattern(kind)
+        return pattern['indptr'], pattern['indices']
+
+    def _get_degrees(self):
+        r"""
+        Returns the number of throats connected to each pore
+        """
+        cache = self._get_topology_cache()
+        if 'degrees' not in cache:
+            conns = self['throat.conns']
+            cache['degrees'] = np.bincount(conns.flatten(),
+                                           minlength=self.Np)
+        return cache['degrees']
+
+    def _get_conduit_pores(self):
+        r"""
+        Returns the pores on either end of each throat as two contiguous
+        arrays, which have been checked to lie within ``[0, Np)``
+        """
+        cache = self._get_topology_cache()
+        if 'conduits' not in cache:
+            conns = self['throat.conns']
+            if conns.size and ((conns.min() < 0) or (conns.max() >= self.Np)):
+                raise Exception('Some throat conns point to non-existent pores')
+            cache['conduits'] = (np.ascontiguousarray(conns[:, 0]),
+                                 np.ascontiguousarray(conns[:, 1]))
+        return cache['conduits']
+
     am = property(fget=get_adjacency_matrix)
 
     def create_adjacency_matrix(self, weights=None, fmt='coo', triu=False,
@@ -264,26 +403,30 @@ class Network(Domain):
         weights = np.array(weights)
 
         # Append row & col to each other, and data to itself
-        conn = self['throat.conns']
-        row = conn[:, 0]
-        col = conn[:, 1]
-        if weights.shape == (2 * self.Nt):
-            # The flip is necessary since we want [conns.T, reverse(conns).T].T
-            row = np.append(row, conn[:, 1])
-            col = np.append(col, conn[:, 0])
+        kind = 'full'
+        if weights.shape == (2 * self.Nt, ):
+            pass
         elif weights.shape == (self.Nt, 2):
-            # The flip is necessary since we want [conns.T, reverse(conns).T].T
-            row = np.append(row, conn[:, 1])
-            col = np.append(col, conn[:, 0])
             weights = weights.flatten(order='F')
         elif not triu:
-            # The flip is necessary since we want [conns.T, reverse(conns).T].T
-            row = np.append(row, conn[:, 1])
-            col = np.append(col, conn[:, 0])
             weights = np.append(weights, weights)
+        else:
+            kind = 'triu'
 
-        # Generate sparse adjacency matrix in 'coo' format
-        temp = sprs.coo_matrix((weights, (row, col)), (self.Np, self.Np))
+        if fmt == 'coo':
+            conn = self['throat.conns']
+            row = conn[:, 0]
+            col = conn[:, 1]
+            if kind == 'full':
+                # The flip is necessary since we want [conns.T, reverse(conns).T].T
+                row = np.append(row, conn[:, 1])
+                col = np.append(col, conn[:, 0])
+            # Generate sparse adjacency matrix in 'coo' format
+            temp = sprs.coo_matrix((weights, (row, col)), (self.Np, self.Np))
+        else:
+            # Other formats are assembled from the stored CSR pattern
+            temp = _from_pattern(self._get_pattern(kind), weights,
+                                 (self.Np, self.Np))
 
         if drop_zeros:
             temp.eliminate_zeros()
@@ -292,7 +435,7 @@ class Network(Domain):
         if fmt == 'coo':
             pass  # temp is already in coo format
         elif fmt == 'csr':
-            temp = temp.tocsr()
+            pass  # temp is already in csr format
         elif fmt == 'lil':
             temp = temp.tolil()
         elif fmt == 'dok':
@@ -355,14 +498,18 @@ class Network(Domain):
         elif np.shape(weights)[0] != self.Nt:
             raise Exception('Received dataset of incorrect length')
 
-        conn = self['throat.conns']
-        row = conn[:, 0]
-        row = np.append(row, conn[:, 1])
-        col = np.arange(self.Nt)
-        col = np.append(col, col)
         weights = np.append(weights, weights)
-
-        temp = sprs.coo.coo_matrix((weights, (row, col)), (self.Np, self.Nt))
+        if fmt == 'coo':
+            conn = self['throat.conns']
+            row = conn[:, 0]
+            row = np.append(row, conn[:, 1])
+            col = np.arange(self.Nt)
+            col = np.append(col, col)
+            temp = sprs.coo_matrix((weights, (row, col)), (self.Np, self.Nt))
+        else:
+            # Other formats are assembled from the stored CSR pattern
+            temp = _from_pattern(self._get_pattern('im'), weights,
+                                 (self.Np, self.Nt))
 
         if drop_zeros:
             temp.eliminate_zeros()
@@ -371,7 +518,7 @@ class Network(Domain):
         if fmt == 'coo':
             pass  # temp is already in coo format
         elif fmt == 'csr':
-            temp = temp.tocsr()
+            pass  # temp is already in csr format
         elif fmt == 'lil':
             temp = temp.tolil()
         elif fmt == 'dok':
@@ -566,10 +713,10 @@ class Network(Domain):
         pores = self._parse_indices(pores)
         if np.size(pores) == 0:
             return np.array([], ndmin=1, dtype=int)
-        neighbors = topotools.find_neighbor_sites(sites=pores, logic=mode,
-                                                  network=self,
-                                                  flatten=flatten,
-                                                  include_input=include_input)
+        indptr, indices = self.get_neighbor_lists(element='pore')
+        neighbors = neighbors_from_csr(indptr, indices, pores, logic=mode,
+                                       flatten=flatten,
+                                       exclude=None if include_input else pores)
         if asmask is False:
             return neighbors
         elif flatten is True:
@@ -650,13 +797,9 @@ class Network(Domain):
         pores = self._parse_indices(pores)
         if np.size(pores) == 0:
             return np.array([], ndmin=1, dtype=int)
-        if flatten is False:
-            neighbors = topotools.find_neighbor_bonds(sites=pores, logic=mode,
-                                                      network=self,
-                                                      flatten=flatten)
-        else:
-            neighbors = topotools.find_neighbor_bonds(sites=pores, logic=mode,
-                                                      network=self, flatten=True)
+        indptr, indices = self.get_neighbor_lists(element='throat')
+        neighbors = neighbors_from_csr(indptr, indices, pores, logic=mode,
+                                       flatten=flatten)
         if asmask is False:
             return neighbors
         elif flatten is True:
@@ -736,9 +879,8 @@ class Network(Domain):
             num = self.find_neighbor_pores(pores, flatten=flatten,
                                            mode=mode, include_input=True)
             num = np.size(num)
-        else:   # Could be done much faster if flatten == False
-            am = self.create_adjacency_matrix(fmt="csr")
-            num = am[pores].sum(axis=1).A1
+        else:
+            num = self._get_degrees()[pores]
         return num
 
     def find_nearby_pores(self, pores, r, flatten=False, include_input=False):
@@ -795,32 +937,35 @@ class Network(Domain):
             return np.array([], dtype=np.int64)
         if r <= 0:
             raise Exception('Provided distances should be greater than 0')
-        # Create kdTree objects
-        kd = sptl.cKDTree(self['pore.coords'])
-        kd_pores = sptl.cKDTree(self['pore.coords'][pores])
-        # Perform search
-        Ps_within_r = kd_pores.query_ball_tree(kd, r=r)
-        # Remove self from each list
-        for i, P in enumerate(Ps_within_r):
-            Ps_within_r[i].remove(pores[i])
-        # Convert to flattened list by default
-        temp = np.concatenate((Ps_within_r))
-        Pn = np.unique(temp).astype(np.int64)
-        # Remove inputs if necessary
+        indptr, indices = self.spatial_index.query_radius(
+            self['pore.coords'][pores], r=r)
+        rows = np.repeat(np.arange(pores.size), np.diff(indptr))
+        # Remove self from each list, and the inputs if necessary
+        keep = indices != pores[rows]
         if include_input is False:
-            Pn = Pn[~np.in1d(Pn, pores)]
-        # Convert list of lists to a list of ndarrays
-        if flatten is False:
-            if len(Pn) == 0:  # Deal with no nearby neighbors
-                Pn = [np.array([], dtype=np.int64) for i in pores]
-            else:
-                mask = np.zeros(shape=np.amax((Pn.max(), pores.max())) + 1, dtype=bool)
-                mask[Pn] = True
-                temp = []
-                for item in Ps_within_r:
-                    temp.append(np.array(item, dtype=np.int64)[mask[item]])
-                Pn = temp
-        return Pn
+            keep &= ~self.to_mask(pores=pores)[indices]
+        if flatten:
+            return np.unique(indices[keep])
+        counts = np.bincount(rows[keep], minlength=pores.size)
+        return np.split(indices[keep], np.cumsum(counts)[:-1])
+
+    @property
+    def spatial_index(self):
+        r"""
+        A ``SpatialIndex`` of the pore coordinates for performing batched
+        neighbor queries
+
+        Notes
+        -----
+        The index is built when first requested and reused until
+        'pore.coords' is written to. Writing into the existing array
+        in-place, such as ``pn['pore.coords'][0] = 1.0``, is not detected,
+        so the coordinates must be reassigned afterward to update the index.
+        """
+        version = self._get_version('pore.coords')
+        if (self._spatial_index is None) or (self._spatial_index[0] != version):
+            self._spatial_index = (version, SpatialIndex(self['pore.coords']))
+        return self._spatial_index[1]
 
     @property
     def conns(self):
@@ -831,3 +976,50 @@ class Network(Domain):
     def coords(self):
         r"""Returns the list of pore coordinates of the network."""
         return self['pore.coords']
+
+    @property
+    def lattice(self):
+        r"""
+        Returns the ``shape``, ``connectivity`` and site ``mask`` of the
+        cubic lattice on which the network was generated, or ``None`` if
+        it was not generated on a lattice or its topology has changed since.
+        """
+        lattice = getattr(self, '_lattice', None)
+        if lattice is None:
+            return None
+        lattice = lattice.copy()
+        if lattice.pop('version') != self._get_version('throat.conns'):
+            return None
+        return lattice
+
+
+def _csr_pattern(row, col, n):
+    r"""
+    Finds the CSR structure of a sparse matrix with ``n`` rows and non-zeros
+    at the given locations, along with the slot into which each location
+    is summed
+    """
+    order = np.lexsort((col, row))
+    r, c = row[order], col[order]
+    new = np.ones(r.size, dtype=bool)
+    new[1:] = (r[1:] != r[:-1]) | (c[1:] != c[:-1])
+    slot = np.empty(r.size, dtype=np.int64)
+    slot[order] = np.cumsum(new) - 1
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(r[new], minlength=n), out=indptr[1:])
+    return {'indptr': indptr, 'indices': c[new], 'slot': slot,
+            'duplicates': not new.all()}
+
+
+def _from_pattern(pattern, data, shape):
+    r"""
+    Assembles a CSR matrix with the given stored pattern and values, which
+    sums the values at duplicate locations as ``tocsr`` would
+    """
+    vals = np.zeros(pattern['indices'].size, dtype=data.dtype)
+    if pattern['duplicates']:
+        np.add.at(vals, pattern['slot'], data)
+    else:
+        vals[pattern['slot']] = data
+    return sprs.csr_matrix((vals, pattern['indices'].copy(),
+                            pattern['indptr'].copy()), shape=shape)
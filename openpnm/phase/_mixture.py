@@ -47,6 +47,7 @@ class Mixture(Phase):
 
     def __init__(self, components=[], name='mixture_?', **kwargs):
         self._components = []
+        self._mix_cache = {}
         super().__init__(name=name, **kwargs)
         self.settings._update(MixtureSettings())
 
@@ -102,12 +103,38 @@ class Mixture(Phase):
         try:
             vals = {}
             for comp in self.components.values():
-                vals[comp.name] = comp[propname]
+                # Arrays stored on the component are fetched directly
+                temp = dict.get(comp, propname, None)
+                vals[comp.name] = comp[propname] if temp is None else temp
             return vals
         except KeyError:
             msg = f'{propname} not found on at least one component'
             raise Exception(msg)
 
+    def _get_comp_block(self, propname):
+        r"""
+        Gathers the mole fractions and the given property of all components
+        into two contiguous n_comp-by-Np arrays
+
+        Notes
+        -----
+        The arrays are refilled on every call, but their memory is reused
+        for the same property while the number of components and pores
+        stays the same.
+        """
+        comps = self.components
+        shape = (len(comps), self.Np)
+        buf = self._mix_cache.get(propname, None)
+        if (buf is None) or (buf[0].shape != shape):
+            buf = (np.empty(shape), np.empty(shape))
+            self._mix_cache[propname] = buf
+        X, Y = buf
+        ys = self.get_comp_vals(propname)
+        for i, name in enumerate(comps.keys()):
+            X[i] = self['pore.mole_fraction.' + name]
+            Y[i] = ys[name]
+        return X, Y
+
     def get_mix_vals(self, propname, mode='linear', power=1):
         r"""
         Get the mole fraction weighted value of a given property for the mixture
@@ -141,18 +168,41 @@ class Mixture(Phase):
             weigthing.
 
         """
-        Xs = self['pore.mole_fraction']
-        ys = self.get_comp_vals(propname)
+        # Several models may mix the same property while the models are
+        # being regenerated, so the result is shared for the duration of
+        # the pass
+        cache = self._model_cache
+        if cache is not None:
+            sig = self._get_mix_signature(propname)
+            key = ('get_mix_vals', propname, mode, power)
+            hit = cache.get(key, None)
+            if (hit is not None) and (sig is not None) and (hit[0] == sig):
+                return hit[1].copy()
+        X, Y = self._get_comp_block(propname)
+        # Each mixing rule is a single weighted sum over the components
         if mode == 'linear':
-            z = np.vstack([Xs[k]*ys[k] for k in Xs.keys()]).sum(axis=0)
+            z = np.einsum('ij,ij->j', X, Y)
         elif mode == 'logarithmic':
-            z = np.vstack([Xs[k]*np.log(ys[k]) for k in Xs.keys()]).sum(axis=0)
-            z = np.exp(z)
+            z = np.exp(np.einsum('ij,ij->j', X, np.log(Y)))
         elif mode == 'power':
-            z = np.vstack([Xs[k]*(ys[k])**power for k in Xs.keys()]).sum(axis=0)
-            z = z**(1/power)
+            z = np.einsum('ij,ij->j', X, Y**power)**(1/power)
+        else:
+            raise Exception(f'Unrecognized mode: {mode}')
+        if cache is not None:
+            cache[key] = (sig, z.copy())
         return z
 
+    def _get_mix_signature(self, propname):
+        # The write versions of the inputs to get_mix_vals, or None if any
+        # is not an array stored directly on its object
+        sig = [self._keys_version]
+        for name, comp in self.components.items():
+            if not dict.__contains__(comp, propname):
+                return None
+            sig.append(self._get_version('pore.mole_fraction.' + name))
+            sig.append(comp._get_version(propname))
+        return sig
+
     @property
     def info(self):  # pragma: no cover
         hr = '―' * 78
@@ -168,12 +218,18 @@ class Mixture(Phase):
         print(lines)
 
     def _get_comps(self):
+        # The components only change when the keys do, so the lookup of
+        # each one in the project is reused until then
+        hit = self._mix_cache.get('components', None)
+        if (hit is not None) and (hit[0] == self._keys_version):
+            return hit[1].copy()
         comps = {}
         for k in self.keys():
             if k.startswith('pore.mole_fraction'):
                 name = k.split('.')[-1]
                 comps[name] = self.project[name]
-        return comps
+        self._mix_cache['components'] = (self._keys_version, comps)
+        return comps.copy()
 
     def _set_comps(self, components):
         if not isinstance(components, list):
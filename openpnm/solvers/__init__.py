@@ -11,3 +11,4 @@ from ._scipy import *
 from ._pardiso import *
 from ._petsc import *
 from ._pyamg import *
+from ._stencil import *
@@ -1,4 +1,3 @@
-from pypardiso import spsolve
 from openpnm.solvers import DirectSolver
 from scipy.sparse import csr_matrix, csc_matrix
 
@@ -10,6 +9,7 @@ class PardisoSpsolve(DirectSolver):
 
     def solve(self, A, b, **kwargs):
         """Solves the given linear system of equations Ax=b."""
+        from pypardiso import spsolve
         if not isinstance(A, (csr_matrix, csc_matrix)):
             A = A.tocsr()
         return (spsolve(A, b), 0)
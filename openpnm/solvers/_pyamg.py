@@ -1,4 +1,3 @@
-import pyamg
 from scipy.sparse import csr_matrix
 from ._base import IterativeSolver
 
@@ -10,6 +9,7 @@ class PyamgRugeStubenSolver(IterativeSolver):
     """Brief description of 'PyamgRugeStubenSolver'"""
 
     def solve(self, A, b, x0=None):
+        import pyamg
         if not isinstance(A, csr_matrix):
             A = A.tocsr()
         ml = pyamg.ruge_stuben_solver(A)
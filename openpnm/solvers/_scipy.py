@@ -1,5 +1,5 @@
 from scipy.sparse import csr_matrix, csc_matrix
-from scipy.sparse.linalg import spsolve, cg
+from scipy.sparse.linalg import spsolve, cg, LinearOperator
 from openpnm.solvers import DirectSolver, IterativeSolver
 
 __all__ = ['ScipySpsolve', 'ScipyCG']
@@ -20,7 +20,11 @@ class ScipyCG(IterativeSolver):
 
     def solve(self, A, b, **kwargs):
         """Solves the given linear system of equations Ax=b."""
-        if not isinstance(A, (csr_matrix, csc_matrix)):
+        if isinstance(A, LinearOperator):
+            # Matrix-free operators may supply their own preconditioner
+            if hasattr(A, 'preconditioner'):
+                kwargs.setdefault('M', A.preconditioner())
+        elif not isinstance(A, (csr_matrix, csc_matrix)):
             A = A.tocsr()
         atol = self._get_atol(b)
         return cg(A, b, tol=self.tol, atol=atol, **kwargs)
@@ -0,0 +1,241 @@
+import copy
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.linalg import LinearOperator
+from openpnm._skgraph.generators._cubic import _cubic_joints
+
+__all__ = ['StencilLaplacian']
+
+
+class StencilLaplacian(LinearOperator):
+    r"""
+    Matrix-free Laplacian of a cubic lattice with the given throat
+    conductances
+
+    Instead of assembling a sparse matrix, the conductances are reshaped
+    onto the faces (and edges and corners) of the lattice and the
+    Laplacian is applied as a stencil using array slicing. This requires
+    no index arrays and stores only the conductances and the diagonal.
+
+    Parameters
+    ----------
+    g : ndarray
+        The conductance of each throat, in the order produced by
+        ``openpnm.network.Cubic`` (or ``CubicTemplate``).
+    shape : array_like
+        The [Nx, Ny, Nz] shape of the lattice
+    connectivity : int
+        The connectivity of the lattice. Options are 6, 14, 18, 20 and 26.
+    mask : ndarray, optional
+        A flattened boolean array indicating which lattice sites are present
+        in the network, as is the case for ``CubicTemplate``.  Throats are
+        assumed to exist between all pairs of neighboring sites that are
+        both present.
+
+    Notes
+    -----
+    This operator supports the parts of the sparse matrix interface used
+    by the transport algorithms, namely ``diagonal``, ``setdiag``, ``copy``
+    and ``tocsr``. The latter assembles the equivalent sparse matrix so
+    that the operator can be passed to any solver, though only solvers
+    that accept a ``LinearOperator`` (i.e. ``ScipyCG``) avoid the memory
+    cost of doing so.
+
+    """
+
+    def __init__(self, g, shape, connectivity=6, mask=None):
+        self.grid = tuple(int(i) for i in shape)
+        self.connectivity = connectivity
+        self._joints = _cubic_joints(connectivity)
+        if mask is not None:
+            mask = np.array(mask, dtype=bool).flatten()
+            N = int(mask.sum())
+        else:
+            N = int(np.prod(self.grid))
+        super().__init__(dtype=float, shape=(N, N))
+        self._mask = mask
+        self._g = self._reshape_conductance(g)
+        self._degree = self._extract(self._offdiag(self._embed(np.ones(N))))
+        self._diag = self._degree.copy()
+        self._fixed = None
+
+    def _reshape_conductance(self, g):
+        g = np.asarray(g, dtype=float)
+        if self._mask is None:
+            sites = np.ones(self.grid, dtype=bool)
+        else:
+            sites = self._mask.reshape(self.grid)
+        gs, start = [], 0
+        for T, H in self._joints:
+            exists = sites[T] & sites[H]
+            stop = start + int(exists.sum())
+            if stop > g.size:
+                break
+            if self._mask is None:
+                gs.append(g[start:stop].reshape(exists.shape))
+            else:
+                temp = np.zeros(exists.shape, dtype=float)
+                temp[exists] = g[start:stop]
+                gs.append(temp)
+            start = stop
+        if (start != g.size) or (len(gs) != len(self._joints)):
+            raise Exception('The number of conductance values does not match'
+                            + ' the number of throats in the lattice')
+        return gs
+
+    def _embed(self, x):
+        if self._mask is None:
+            return x.reshape(self.grid)
+        temp = np.zeros(self._mask.size, dtype=float)
+        temp[self._mask] = x
+        return temp.reshape(self.grid)
+
+    def _extract(self, X):
+        if self._mask is None:
+            return X.reshape(-1)
+        return X.reshape(-1)[self._mask]
+
+    def _offdiag(self, X):
+        Y = np.zeros(self.grid, dtype=float)
+        for (T, H), g in zip(self._joints, self._g):
+            Y[T] += g * X[H]
+            Y[H] += g * X[T]
+        return Y
+
+    def _matvec(self, x):
+        x = np.asarray(x, dtype=float).reshape(-1)
+        if self._fixed is not None:
+            xw = np.where(self._fixed, 0.0, x)
+        else:
+            xw = x
+        w = self._extract(self._offdiag(self._embed(xw)))
+        if self._fixed is not None:
+            w[self._fixed] = 0.0
+        return self._diag * x - w
+
+    def _rmatvec(self, x):
+        return self._matvec(x)
+
+    def _adjoint(self):
+        return self
+
+    @property
+    def data(self):
+        r"""
+        The diagonal of the operator, which is the sum of the conductances
+        of each row, so it is finite only if all the conductances are
+        """
+        return self._diag
+
+    def diagonal(self):
+        r"""Returns a copy of the diagonal of the operator"""
+        return self._diag.copy()
+
+    def setdiag(self, values):
+        r"""Overwrites the diagonal of the operator with the given values"""
+        self._diag = np.array(values, dtype=float) * np.ones(self.shape[0])
+
+    def set_fixed_rows(self, rows, value):
+        r"""
+        Removes all off-diagonal entries in the given rows and columns, and
+        sets their diagonal to ``value``, as is done when applying value
+        boundary conditions
+        """
+        fixed = np.zeros(self.shape[0], dtype=bool)
+        if self._fixed is not None:
+            fixed[self._fixed] = True
+        fixed[rows] = True
+        self._fixed = fixed
+        self._diag[rows] = value
+
+    def copy(self):
+        r"""Returns a copy which shares the conductances with this one"""
+        new = copy.copy(self)
+        new._diag = self._diag.copy()
+        if self._fixed is not None:
+            new._fixed = self._fixed.copy()
+        return new
+
+    def tocoo(self):
+        r"""Assembles the equivalent sparse matrix in COO format"""
+        idx = np.arange(np.prod(self.grid)).reshape(self.grid)
+        if self._mask is not None:
+            remap = np.cumsum(self._mask) - 1
+            idx = np.where(self._mask, remap, -1).reshape(self.grid)
+        rows, cols, vals = [], [], []
+        for (T, H), g in zip(self._joints, self._g):
+            keep = (idx[T] >= 0) & (idx[H] >= 0)
+            rows.append(idx[T][keep])
+            cols.append(idx[H][keep])
+            vals.append(-g[keep])
+        rows, cols = np.hstack(rows), np.hstack(cols)
+        vals = np.hstack(vals)
+        if self._fixed is not None:
+            vals[self._fixed[rows] | self._fixed[cols]] = 0.0
+        diag = np.arange(self.shape[0])
+        i = np.hstack((rows, cols, diag))
+        j = np.hstack((cols, rows, diag))
+        vals = np.hstack((vals, vals, self._diag))
+        A = coo_matrix((vals, (i, j)), shape=self.shape)
+        A.sum_duplicates()
+        A.eliminate_zeros()
+        return A
+
+    def tocsr(self):
+        r"""Assembles the equivalent sparse matrix in CSR format"""
+        return self.tocoo().tocsr()
+
+    def tocsc(self):
+        r"""Assembles the equivalent sparse matrix in CSC format"""
+        return self.tocoo().tocsc()
+
+    def preconditioner(self):
+        r"""
+        Returns a preconditioner for use with conjugate gradient type
+        solvers
+
+        Returns
+        -------
+        M : LinearOperator
+            Approximates the inverse of the operator by replacing the
+            conductances of each family of throats with their mean, which
+            makes the Laplacian diagonalizable by a discrete cosine
+            transform (DCT) and hence invertible in O(N log N). Fixed rows
+            are inverted exactly.
+
+        """
+        from scipy.fft import dctn, idctn
+        thetas = np.meshgrid(*[np.pi*np.arange(n)/n for n in self.grid],
+                             indexing='ij', sparse=True)
+        lam = np.zeros(self.grid, dtype=float)
+        for (T, H), g in zip(self._joints, self._g):
+            if g.size == 0:
+                continue
+            T, H = np.index_exp[T], np.index_exp[H]
+            step = [(t.start or 0) - (h.start or 0) for t, h in zip(T, H)]
+            step += [0] * (3 - len(step))
+            symbol = np.ones(self.grid, dtype=float)
+            for i in range(3):
+                if step[i] != 0:
+                    symbol = symbol * np.cos(thetas[i])
+            lam += 2*g.mean()*(1 - symbol)
+        free = np.ones(self.shape[0], dtype=bool)
+        if self._fixed is not None:
+            free = ~self._fixed
+        if free.any():
+            lam += max((self._diag - self._degree)[free].mean(), 0.0)
+        # The constant mode is singular unless removed by value BCs
+        nonzero = lam[lam > 0]
+        lam.flat[0] = nonzero.min()/4 if nonzero.size else 1.0
+        lam[lam <= 0] = lam.flat[0]
+        diag = self._diag.copy()
+
+        def solve(r):
+            r = np.asarray(r, dtype=float).reshape(-1)
+            R = self._embed(np.where(free, r, 0.0))
+            z = self._extract(idctn(dctn(R, norm='ortho')/lam, norm='ortho'))
+            z[~free] = r[~free]/diag[~free]
+            return z
+
+        return LinearOperator(shape=self.shape, matvec=solve, rmatvec=solve,
+                              dtype=float)
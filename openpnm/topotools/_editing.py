@@ -0,0 +1,195 @@
+import logging
+import numpy as np
+from contextlib import contextmanager
+
+
+logger = logging.getLogger(__name__)
+__all__ = [
+    'edit',
+    'TopologyEditor',
+]
+
+
+@contextmanager
+def edit(network):
+    r"""
+    Opens a batched editing session on the given network
+
+    Within the ``with`` block all calls to ``extend``, ``trim``, and the
+    functions built on them (``clone_pores``, ``connect_pores``,
+    ``merge_pores``, ``merge_networks``, ``stitch`` and
+    ``add_boundary_pores``) are recorded instead of being applied. The
+    network and all objects in its project are then resized only once, when
+    the block exits.
+
+    Parameters
+    ----------
+    network : Network
+        The network to edit
+
+    Yields
+    ------
+    editor : TopologyEditor
+        The object recording the edits, which can also be used to add or
+        remove pores and throats directly
+
+    Notes
+    -----
+    Since the network is not modified until the session closes, any
+    queries made inside the block see the network as it was when the
+    session was opened. In particular:
+
+    - Pores and throats which have been added are numbered after the
+      existing ones, and after each other in the order they were added,
+      but they cannot be found by queries such as ``find_neighbor_pores``.
+    - Pores and throats which have been trimmed keep their indices, so
+      indices obtained before or during the session remain valid for
+      the rest of it.
+
+    If an exception is raised inside the block the pending edits are
+    discarded. Opening a session on a network which is already being edited
+    returns the existing session.
+
+    Examples
+    --------
+    >>> import openpnm as op
+    >>> pn = op.network.Cubic(shape=[5, 5, 1])
+    >>> with op.topotools.edit(pn) as e:
+    ...     op.topotools.connect_pores(pn, pores1=[0], pores2=[24])
+    ...     op.topotools.trim(pn, pores=[12])
+    ...     print(e.Np, e.Nt)
+    25 41
+    >>> print(pn.Np, pn.Nt)
+    24 37
+
+    """
+    editor = getattr(network, '_edit_session', None)
+    if editor is not None:  # Nested sessions just reuse the outer one
+        yield editor
+        return
+    editor = TopologyEditor(network)
+    network._edit_session = editor
+    try:
+        yield editor
+    finally:
+        network._edit_session = None
+    editor.commit()
+
+
+class TopologyEditor:
+    r"""
+    Records additions and deletions of pores and throats on a network and
+    applies them all at once
+
+    Parameters
+    ----------
+    network : Network
+        The network being edited
+
+    Notes
+    -----
+    This object is normally created by ``openpnm.topotools.edit``. Added
+    pores and throats are kept as a list of blocks of data, and deletions
+    as lists of indices, so each edit costs time proportional to its own
+    size rather than to the size of the network.
+
+    """
+
+    def __init__(self, network):
+        self.network = network
+        self._Np = network.Np
+        self._Nt = network.Nt
+        self._blocks = []
+        self._trim = {'pore': [], 'throat': []}
+
+    @property
+    def Np(self):
+        r"""The number of pores including those pending addition"""
+        return self._Np
+
+    @property
+    def Nt(self):
+        r"""The number of throats including those pending addition"""
+        return self._Nt
+
+    def append(self, pores={}, throats={}):
+        r"""
+        Records a block of new pores and throats
+
+        Parameters
+        ----------
+        pores, throats : dict
+            The data for the new pores and throats, with ``'pore.coords'``
+            and ``'throat.conns'`` required in each respectively. The conns
+            must use the numbering of the pores including those pending
+            addition.
+
+        Returns
+        -------
+        Ps, Ts : ndarray
+            The indices the new pores and throats will have, ignoring any
+            pending deletions
+
+        """
+        pores = {'pore.coords': np.zeros((0, 3)), **pores}
+        throats = {'throat.conns': np.zeros((0, 2), dtype=int), **throats}
+        Np = pores['pore.coords'].shape[0]
+        Nt = throats['throat.conns'].shape[0]
+        if np.any(throats['throat.conns'] >= self._Np + Np):
+            raise Exception('Some throat conns point to non-existent pores')
+        Ps = np.arange(self._Np, self._Np + Np)
+        Ts = np.arange(self._Nt, self._Nt + Nt)
+        self._blocks.append((pores, throats))
+        self._Np += Np
+        self._Nt += Nt
+        return Ps, Ts
+
+    def extend(self, coords=[], conns=[], labels=[]):
+        r"""
+        Records new pores and throats, as ``openpnm.topotools.extend``
+
+        Returns
+        -------
+        Ps, Ts : ndarray
+            The indices the new pores and throats will have, ignoring any
+            pending deletions
+
+        """
+        from openpnm.topotools._topotools import _extension_blocks
+        return self.append(*_extension_blocks(coords, conns, labels))
+
+    def trim(self, pores=[], throats=[]):
+        r"""
+        Marks pores and throats for deletion, as ``openpnm.topotools.trim``
+
+        Parameters
+        ----------
+        pores, throats : array_like
+            The indices or boolean masks of the pores and throats to
+            delete, which may include those pending addition
+
+        """
+        for element, inds in zip(['pore', 'throat'], [pores, throats]):
+            inds = np.array(inds, ndmin=1)
+            if inds.dtype == bool:
+                inds = np.where(inds)[0]
+            N = self._Np if element == 'pore' else self._Nt
+            if np.any(inds >= N):
+                raise Exception(f'Some {element} indices are out of range')
+            self._trim[element].append(inds.astype(np.int64))
+
+    def commit(self):
+        r"""
+        Applies all the recorded edits to the network, then clears them
+        """
+        from openpnm.topotools._topotools import _append, trim
+        blocks, self._blocks = self._blocks, []
+        Ps = np.hstack(self._trim['pore'] + [np.array([], dtype=np.int64)])
+        Ts = np.hstack(self._trim['throat'] + [np.array([], dtype=np.int64)])
+        self._trim = {'pore': [], 'throat': []}
+        if len(blocks):
+            _append(self.network, blocks)
+        if Ps.size or Ts.size:
+            trim(self.network, pores=np.unique(Ps), throats=np.unique(Ts))
+        self._Np = self.network.Np
+        self._Nt = self.network.Nt
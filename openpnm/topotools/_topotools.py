@@ -21,6 +21,7 @@ __all__ = [
     'dimensionality',
     'clone_pores',
     'merge_networks',
+    'ensemble',
     'stitch',
     'connect_pores',
     'merge_pores',
@@ -166,7 +167,16 @@ def trim(network, pores=[], throats=[]):
         The indices of the of the pores or throats to be removed from the
         network.
 
+    Notes
+    -----
+    Inside an ``edit`` session the pores and throats are only marked for
+    deletion, and are removed when the session closes.
+
     """
+    editor = getattr(network, '_edit_session', None)
+    if editor is not None:
+        editor.trim(pores=pores, throats=throats)
+        return
     pores = network._parse_indices(pores)
     throats = network._parse_indices(throats)
     Pkeep = np.copy(network['pore.all'])
@@ -250,75 +260,124 @@ def extend(network, coords=[], conns=[], labels=[], **kwargs):
     labels : str, or list[str], optional
         A list of labels to apply to the new pores and throats
 
+    Notes
+    -----
+    Inside an ``edit`` session the new pores and throats are only recorded,
+    and are added when the session closes.
+
     """
     if 'throat_conns' in kwargs.keys():
         conns = kwargs['throat_conns']
     if 'pore_coords' in kwargs.keys():
         coords = kwargs['pore_coords']
-    coords = np.array(coords)
-    conns = np.array(conns)
-    Np_old = network.num_pores()
-    Nt_old = network.num_throats()
-    Np = Np_old + coords.shape[0]
-    Nt = Nt_old + conns.shape[0]
-    if np.any(conns > Np):
+    pores, throats = _extension_blocks(coords, conns, labels)
+    editor = getattr(network, '_edit_session', None)
+    if editor is not None:
+        editor.append(pores, throats)
+        return
+    Np = network.Np + pores['pore.coords'].shape[0]
+    if np.any(throats['throat.conns'] >= Np):
         raise Exception('Some throat conns point to non-existent pores')
-    network.update({'pore.all': np.ones([Np, ], dtype=bool),
-                    'throat.all': np.ones([Nt, ], dtype=bool)})
-    # Add coords and conns
-    if np.size(coords) > 0:
-        coords = np.vstack((network['pore.coords'], coords))
-        network['pore.coords'] = coords
-    if np.size(conns) > 0:
-        conns = np.vstack((network['throat.conns'], conns))
-        network['throat.conns'] = conns
-
-    # Increase size of any prop or label arrays already on network and phases
-    objs = list(network.project.phases)
-    objs.append(network)
-    for obj in objs:
-        obj.update({'pore.all': np.ones([Np, ], dtype=bool),
-                    'throat.all': np.ones([Nt, ], dtype=bool)})
+    _append(network, [(pores, throats)])
+
+
+def _extension_blocks(coords, conns, labels):
+    r"""
+    Converts the arguments of ``extend`` to dicts of pore and throat data
+    """
+    coords = np.array(coords, dtype=float).reshape(-1, 3)
+    conns = np.array(conns, dtype=int).reshape(-1, 2)
+    pores = {'pore.coords': coords}
+    throats = {'throat.conns': conns}
+    if isinstance(labels, str):
+        labels = [labels]
+    for label in labels:
+        # Remove pore or throat from label, if present
+        label = label.split('.', 1)[-1]
+        if coords.shape[0] > 0:
+            pores['pore.'+label] = np.ones(coords.shape[0], dtype=bool)
+        if conns.shape[0] > 0:
+            throats['throat.'+label] = np.ones(conns.shape[0], dtype=bool)
+    return pores, throats
+
+
+def _append(network, blocks):
+    r"""
+    Appends blocks of new pores and throats to the network, resizing each
+    array on the network and its phases only once
+
+    Parameters
+    ----------
+    network : Network
+        The network to which the pores and throats are added
+    blocks : list of tuples
+        Each tuple contains a dict of pore data, including 'pore.coords',
+        and a dict of throat data, including 'throat.conns'. Arrays which
+        are missing from a block, or from the network, are filled with
+        ``False`` for labels and ``nan`` otherwise.
+
+    """
+    counts = {
+        'pore': [network.Np] + [b[0]['pore.coords'].shape[0] for b in blocks],
+        'throat': [network.Nt] + [b[1]['throat.conns'].shape[0] for b in blocks],
+    }
+    N = {k: sum(v) for k, v in counts.items()}
+    for i, element in enumerate(['pore', 'throat']):
+        data = [dict(network)] + [b[i] for b in blocks]
+        keys = set().union(*[d.keys() for d in data])
+        keys = [k for k in keys if k.startswith(element + '.')
+                and k.split('.', 1)[1] not in ['all', '_id']]
+        # Coords and conns define the new length so must be written first
+        keys = sorted(keys, key=lambda k: k not in ['pore.coords',
+                                                    'throat.conns'])
+        for key in keys:
+            template = next(d[key] for d in data if key in d)
+            network[key] = _concatenate([d.get(key, None) for d in data],
+                                        counts[element], template)
+    network.update({'pore.all': np.ones([N['pore'], ], dtype=bool),
+                    'throat.all': np.ones([N['throat'], ], dtype=bool)})
+
+    # Increase size of any prop or label arrays already on the phases
+    for obj in network.project.phases:
+        obj.update({'pore.all': np.ones([N['pore'], ], dtype=bool),
+                    'throat.all': np.ones([N['throat'], ], dtype=bool)})
         for item in list(obj.keys()):
-            N = obj._count(element=item.split('.', 1)[0])
-            if obj[item].shape[0] < N:
+            n = obj._count(element=item.split('.', 1)[0])
+            if obj[item].shape[0] < n:
                 arr = obj.pop(item)
-                s = arr.shape
-                if arr.dtype == bool:
-                    obj[item] = np.zeros(shape=(N, *s[1:]), dtype=bool)
-                else:
-                    obj[item] = np.ones(shape=(N, *s[1:]), dtype=float)*np.nan
-                obj[item][:arr.shape[0]] = arr
+                obj[item] = _concatenate([arr, None], [arr.shape[0],
+                                         n - arr.shape[0]], arr)
 
     # Regenerate models on all objects to fill new elements
     for obj in network.project.phases:
         if hasattr(obj, 'models'):
             obj.regenerate_models()
 
-    # Apply labels, if supplied
-    if labels != []:
-        # Convert labels to list if necessary
-        if isinstance(labels, str):
-            labels = [labels]
-        for label in labels:
-            # Remove pore or throat from label, if present
-            label = label.split('.', 1)[-1]
-            if np.size(coords) > 0:
-                Ps = np.r_[Np_old:Np]
-                if 'pore.'+label not in network.labels():
-                    network['pore.'+label] = False
-                network['pore.'+label][Ps] = True
-            if np.size(conns) > 0:
-                Ts = np.r_[Nt_old:Nt]
-                if 'throat.'+label not in network.labels():
-                    network['throat.'+label] = False
-                network['throat.'+label][Ts] = True
-
     # Clear adjacency and incidence matrices which will be out of date now
     network._am.clear()
     network._im.clear()
 
 
+def _concatenate(arrays, counts, template):
+    r"""
+    Concatenates the given arrays, replacing any ``None`` with ``False`` for
+    boolean arrays or ``nan`` otherwise
+    """
+    template = np.asarray(template)
+    if template.dtype == bool:
+        fill, dtype = False, bool
+    elif all(a is not None for a in arrays):
+        fill, dtype = None, np.result_type(*arrays)
+    else:
+        fill, dtype = np.nan, float
+    out = np.empty((sum(counts), *template.shape[1:]), dtype=dtype)
+    start = 0
+    for arr, n in zip(arrays, counts):
+        out[start:start+n] = fill if arr is None else arr
+        start += n
+    return out
+
+
 def label_faces(network, tol=0.0, label='surface'):
     r"""
     Finds pores on the surface of the network and labels them according to
@@ -474,39 +533,30 @@ def clone_pores(network, pores, labels=['clone'], mode='parents'):
     if isinstance(labels, str):
         labels = [labels]
     network._parse_indices(pores)
-    Np = network.Np
-    Nt = network.Nt
-    # Clone pores
     parents = np.array(pores, ndmin=1)
-    pcurrent = network['pore.coords']
-    pclone = pcurrent[pores, :]
-    pnew = np.concatenate((pcurrent, pclone), axis=0)
-    Npnew = np.shape(pnew)[0]
-    clones = np.arange(Np, Npnew)
-    # Create cloned pores first
-    extend(network=network, pore_coords=pclone)
-    # Apply provided labels to cloned pores
-    for item in labels:
-        network.set_label(label=item, pores=range(Np, Npnew))
+    Np = _num_pores(network)
+    clones = np.arange(Np, Np + parents.size)
     # Add connections between parents and clones
     if mode == 'parents':
-        tclone = np.vstack((parents, clones)).T
-        extend(network=network, conns=tclone)
+        conns = np.vstack((parents, clones)).T
     elif mode == 'siblings':
         ts = network.find_neighbor_throats(pores=pores, mode='xnor')
-        mapping = np.zeros([network.Np, ], dtype=int)
-        mapping[pores] = np.arange(Np, network.Np)
-        tclone = mapping[network['throat.conns'][ts]]
-        extend(network=network, throat_conns=tclone)
+        mapping = np.zeros([Np + parents.size, ], dtype=int)
+        mapping[pores] = clones
+        conns = mapping[network['throat.conns'][ts]]
     elif mode == 'isolated':
-        pass
-    Ntnew = network.Nt
-    for item in labels:
-        network.set_label(label=item, throats=range(Nt, Ntnew))
+        conns = []
+    extend(network=network, coords=network['pore.coords'][parents],
+           conns=conns, labels=labels)
 
-    # Clear adjacency and incidence matrices which will be out of date now
-    network._am.clear()
-    network._im.clear()
+
+def _num_pores(network):
+    r"""
+    Returns the number of pores on the network, including those added in
+    an ongoing ``edit`` session
+    """
+    editor = getattr(network, '_edit_session', None)
+    return network.Np if editor is None else editor.Np
 
 
 def merge_networks(network, donor=[]):
@@ -533,58 +583,91 @@ def merge_networks(network, donor=[]):
     else:
         donors = [donor]
 
+    blocks = []
+    Np = _num_pores(network)
     for donor in donors:
-        network['throat.conns'] = np.vstack((network['throat.conns'],
-                                             donor['throat.conns']
-                                             + network.Np))
-        network['pore.coords'] = np.vstack((network['pore.coords'],
-                                            donor['pore.coords']))
-        p_all = np.ones((np.shape(network['pore.coords'])[0],), dtype=bool)
-        t_all = np.ones((np.shape(network['throat.conns'])[0],), dtype=bool)
-        network.update({'pore.all': p_all})
-        network.update({'throat.all': t_all})
-        for key in set(network.keys()).union(set(donor.keys())):
-            if key.split('.')[1] not in ['conns', 'coords', '_id', 'all']:
-                if key in network.keys():
-                    pop_flag = False
-                    # If key not on donor add it first with dummy values to
-                    # simplify merging later
-                    if key not in donor.keys():
-                        logger.debug('Adding ' + key + ' to donor')
-                        if network[key].dtype == bool:  # Deal with labels
-                            donor[key] = False
-                        else:  # Deal with numerical data
-                            element = key.split('.', 1)[0]
-                            shape = list(network[key].shape)
-                            N = donor._count(element)
-                            shape[0] = N
-                            donor[key] = np.empty(shape=shape)*np.nan
-                        pop_flag = True
-                    # Then merge it with existing array on network
-                    if len(network[key].shape) == 1:
-                        temp = np.hstack((network[key], donor[key]))
-                    else:
-                        temp = np.vstack((network[key], donor[key]))
-                    network[key] = temp
-                    if pop_flag:
-                        donor.pop(key, None)
-                else:
-                    # If key not on network add it first
-                    logger.debug('Adding ' + key + ' to network')
-                    if donor[key].dtype == bool:
-                        network[key] = False
-                    else:
-                        data_shape = list(donor[key].shape)
-                        pore_prop = True if key.split(".")[0] == "pore" else False
-                        data_shape[0] = network.Np if pore_prop else network.Nt
-                        network[key] = np.empty(data_shape) * np.nan
-                    # Then append donor values to network
-                    s = np.shape(donor[key])[0]
-                    network[key][-s:] = donor[key]
+        pores, throats = {}, {}
+        for key in donor.keys():
+            if key.split('.', 1)[1] in ['all', '_id']:
+                continue
+            if key.startswith('pore.'):
+                pores[key] = donor[key]
+            else:
+                throats[key] = donor[key]
+        throats['throat.conns'] = donor['throat.conns'] + Np
+        blocks.append((pores, throats))
+        Np += donor.Np
+
+    editor = getattr(network, '_edit_session', None)
+    if editor is not None:
+        for pores, throats in blocks:
+            editor.append(pores, throats)
+    else:
+        _append(network, blocks)
 
-    # Clear adjacency and incidence matrices which will be out of date now
-    network._am.clear()
-    network._im.clear()
+
+def ensemble(network, n):
+    r"""
+    Creates a new network containing ``n`` disconnected copies of the given
+    network, for evaluating an ensemble of random realizations at once
+
+    Parameters
+    ----------
+    network : Network
+        The network to copy, including its data, labels and pore-scale
+        models
+    n : int
+        The number of realizations
+
+    Returns
+    -------
+    ensemble : Network
+        A network in a new project in which pore ``i`` of realization ``k``
+        is pore ``k*Np + i``, and likewise for throats
+
+    Notes
+    -----
+    Since the realizations form a single network, regenerating its models
+    draws new random seeds for all of them at once, every model is
+    evaluated once for the whole ensemble, and a transport algorithm run
+    on it solves all the realizations as one block-diagonal system. Any
+    pore or throat array on the ensemble, such as the solution of an
+    algorithm, can be split into realizations with ``x.reshape(n, -1)``.
+
+    The copies all have the same coordinates, so spatial queries such as
+    ``find_nearby_pores`` find pores from every realization.
+
+    Examples
+    --------
+    >>> import openpnm as op
+    >>> pn = op.network.Cubic(shape=[4, 4, 1])
+    >>> pn.add_model_collection(
+    ...     op.models.collections.geometry.spheres_and_cylinders)
+    >>> ens = op.topotools.ensemble(pn, n=10)
+    >>> ens.regenerate_models()
+    >>> D = ens['pore.diameter'].reshape(10, -1)
+    >>> print(D.shape)
+    (10, 16)
+
+    """
+    from openpnm.network import Network
+    n = int(n)
+    Np = network.Np
+    conns = network['throat.conns'][np.newaxis, :, :] \
+        + (np.arange(n)*Np)[:, np.newaxis, np.newaxis]
+    new = Network(conns=conns.reshape(-1, 2),
+                  coords=np.tile(network['pore.coords'], (n, 1)))
+    for key, vals in network.items():
+        if key.split('.', 1)[1] in ['all', '_id', 'coords', 'conns']:
+            continue
+        vals = np.asarray(vals)
+        new[key] = np.tile(vals, (n, ) + (1, )*(vals.ndim - 1))
+    for key, mod in network.models.items():
+        kwargs = dict(mod)
+        kwargs['regen_mode'] = 'deferred'  # Do not run the model yet
+        new.add_model(propname=key, **kwargs)
+        new.models[key]['regen_mode'] = mod['regen_mode']
+    return new
 
 
 def stitch(network, donor, P_network, P_donor, method='nearest',
@@ -641,8 +724,7 @@ def stitch(network, donor, P_network, P_donor, method='nearest',
             network['throat.' + s] = False
     # Get the initial number of pores and throats
     N_init = {}
-    N_init['pore'] = network.Np
-    N_init['throat'] = network.Nt
+    N_init['pore'] = _num_pores(network)
     if method == 'nearest':
         P1 = P_network
         P2 = P_donor + N_init['pore']  # Increment pores on donor
@@ -820,8 +902,8 @@ def merge_pores(network, pores, labels=['merged']):
         points = np.concatenate((temp, Ps))
         XYZs.append(hull_centroid(network["pore.coords"][points]))
 
+    Pnew = np.arange(_num_pores(network), _num_pores(network) + N)
     extend(network, pore_coords=XYZs, labels=labels)
-    Pnew = network.Ps[-N::]
 
     # Possible throats between new pores: This only happens when running in
     # batch mode, i.e. multiple groups of pores are to be merged. In case
@@ -833,8 +915,8 @@ def merge_pores(network, pores, labels=['merged']):
     from itertools import combinations
     for i, j in combinations(range(N), 2):
         if not NBs_set[i].isdisjoint(pores_set[j]):
-            ps1.append([network.Ps[-N+i]])
-            ps2.append([network.Ps[-N+j]])
+            ps1.append([Pnew[i]])
+            ps2.append([Pnew[j]])
 
     # Add (possible) connections between the new pores
     connect_pores(network, pores1=ps1, pores2=ps2, labels=labels)
@@ -894,32 +976,25 @@ def add_boundary_pores(network, pores, offset=None, move_to=None,
     """
     # Parse the input pores
     Ps = np.array(pores, ndmin=1)
-    if Ps.dtype is bool:
+    if Ps.dtype == bool:
         Ps = network.to_indices(Ps)
     if np.size(pores) == 0:  # Handle an empty array if given
         return np.array([], dtype=np.int64)
     # Clone the specifed pores
-    clone_pores(network=network, pores=Ps)
-    newPs = network.pores('pore.clone')
-    del network['pore.clone']
-    newTs = network.throats('clone')
-    del network['throat.clone']
+    coords = np.array(network['pore.coords'][Ps], dtype=float)
     if offset is not None:  # Offset the cloned pores
-        network['pore.coords'][newPs] += offset
+        coords += offset
     if move_to is not None:  # Move the cloned pores
         for i, d in enumerate(move_to):
             if d is not None:
-                temp = network['pore.coords'][newPs]
-                temp[:, i] = d
-                network['pore.coords'][newPs] = temp
+                coords[:, i] = d
+    Np = _num_pores(network)
+    conns = np.vstack((Ps, np.arange(Np, Np + Ps.size))).T
     # Apply labels to boundary pores (trim leading 'pores' if present)
     label = apply_label.split('.', 1)[-1]
-    plabel = 'pore.' + label
-    tlabel = 'throat.' + label
-    network[plabel] = False
-    network[plabel][newPs] = True
-    network[tlabel] = False
-    network[tlabel][newTs] = True
+    network['pore.' + label] = False
+    network['throat.' + label] = False
+    extend(network=network, coords=coords, conns=conns, labels=label)
 
 
 def iscoplanar(coords):
@@ -997,18 +1072,14 @@ def is_fully_connected(network, pores_BC=None):
         are connected to the given boundary condition pores.
 
     """
-    am = network.get_adjacency_matrix(fmt='lil').copy()
+    am = network.get_adjacency_matrix(fmt='csr')
     temp = csgraph.connected_components(am, directed=False)[1]
     is_connected = np.unique(temp).size == 1
     # Ensure all clusters are part of pores, if given
     if not is_connected and pores_BC is not None:
-        am.resize(network.Np + 1, network.Np + 1)
         pores_BC = network._parse_indices(pores_BC)
-        am.rows[-1] = pores_BC.tolist()
-        am.data[-1] = np.arange(network.Nt, network.Nt + len(pores_BC)).tolist()
-        temp = csgraph.connected_components(am, directed=False)[1]
-        is_connected = np.unique(temp).size == 1
-    return is_connected
+        is_connected = np.isin(temp, temp[pores_BC]).all()
+    return bool(is_connected)
 
 
 def get_domain_area(network, inlets=None, outlets=None):
@@ -13,6 +13,7 @@ from ._settings import *
 from ._workspace import *
 from ._project import *
 from ._health import *
+from ._spatial import *
 
 
 def _get_version():
@@ -2,9 +2,11 @@ import re
 import pickle
 import logging
 import uuid
+import weakref
 import numpy as np
 from copy import deepcopy
 from datetime import datetime
+from pathlib import Path
 from openpnm.utils import Workspace, SettingsAttr
 
 
@@ -51,6 +53,82 @@ class SimpleList:
             self._list.append(item)
 
 
+# The attributes of each object which are always written to a checkpoint
+_CHECKPOINT_ATTRS = ['_settings', '_params', 'models', '_name', '_lattice']
+
+# Attributes holding derived data, which are reset to these values when a
+# checkpoint is loaded and rebuilt when next needed
+_CHECKPOINT_RESET = {
+    '_am': {},
+    '_im': {},
+    '_topology': {'version': None},
+    '_spatial_index': None,
+    '_edit_session': None,
+    '_A': None,
+    '_b': None,
+    '_pure_A': None,
+    '_pure_b': None,
+    '_components': [],
+    '_mix_cache': {},
+    '_K': None,
+    '_K_state': None,
+}
+
+# Attributes which are left unset on the loaded objects
+_CHECKPOINT_DROP = ['_project', '_f0_norm']
+
+
+def _checkpoint_attrs(obj, old):
+    r"""
+    Splits the attributes of an object into those written to every
+    checkpoint and those which have been bound to a new value since the
+    last checkpoint, ignoring derived data and the attributes recreated by
+    ``__new__``
+    """
+    skip = set(type(obj).__new__(type(obj)).__dict__.keys())
+    skip.update(_CHECKPOINT_RESET.keys())
+    skip.update(_CHECKPOINT_DROP)
+    shell, data, current = {}, {}, {}
+    for k, v in obj.__dict__.items():
+        if k in _CHECKPOINT_ATTRS:
+            shell[k] = v
+        elif k not in skip:
+            current[k] = v
+            if old.get(k, None) is not v:
+                data[k] = v
+    shell.update({k: deepcopy(v) for k, v in _CHECKPOINT_RESET.items()
+                  if k in obj.__dict__})
+    return shell, data, current
+
+
+class _CheckpointPickler(pickle.Pickler):
+    r"""
+    Pickles references to objects in the project as their uuid, so that
+    the objects are not duplicated inside each other's state
+    """
+
+    def __init__(self, file, objs):
+        super().__init__(file)
+        self._uuids = {id(obj): obj.settings['uuid'] for obj in objs}
+
+    def persistent_id(self, obj):
+        return self._uuids.get(id(obj), None)
+
+
+class _CheckpointUnpickler(pickle.Unpickler):
+    r"""
+    Resolves the uuids written by ``_CheckpointPickler`` to the objects
+    being restored
+    """
+
+    def __init__(self, file, objs):
+        super().__init__(file)
+        self._objs = objs
+
+    def persistent_load(self, pid):
+        return self._objs[pid]
+
+
 class ProjectSettings(SettingsAttr):
     r"""
     uuid : str
@@ -104,14 +182,63 @@ class Project(SimpleList):
         self.settings['uuid'] = str(uuid.uuid4())
         self.settings['original_uuid'] = self.settings['uuid']
         super().__init__(*args, **kwargs)
+        self._link()
         ws[self.settings['name']] = self
 
+    def __setstate__(self, state):
+        # Back-references are not pickled so are restored here, which also
+        # covers deepcopy
+        self.__dict__.update(state)
+        self._link()
+
+    def _link(self):
+        r"""
+        Points each object back to this project, unless it already belongs
+        to another open project, and rebuilds the index of object names
+        """
+        self._names = {}
+        self._network = None
+        for item in self:
+            self._adopt(item)
+            self._names[item.name] = item
+
+    def _adopt(self, item):
+        ref = getattr(item, '_project', None)
+        owner = ref() if ref is not None else None
+        if (owner is None) or (ws.get(owner.name, None) is not owner):
+            item._project = weakref.ref(self)
+
+    def _owns(self, item):
+        ref = getattr(item, '_project', None)
+        return (ref is not None) and (ref() is self)
+
+    def append(self, item):
+        super().append(item)
+        self._adopt(item)
+        if getattr(item, 'name', None) is not None:
+            self._names[item.name] = item
+
+    def __delitem__(self, ii):
+        items = self._list[ii] if isinstance(ii, slice) else [self._list[ii]]
+        super().__delitem__(ii)
+        for item in items:
+            if self._owns(item):
+                item._project = None
+
+    def _rename(self, item, old_name):
+        r"""
+        Updates the index of object names when an object is renamed
+        """
+        if self._names.get(old_name, None) is item:
+            del self._names[old_name]
+        self._names[item.name] = item
+
     def __getitem__(self, key):
         if isinstance(key, str):  # Enable dict-style retrieval if key is a string
-            obj = None
-            for item in self:
-                if item.name == key:
-                    obj = item
+            obj = self._names.get(key, None)
+            if (obj is None) or (obj.name != key) or not self._owns(obj):
+                self._link()  # The index is out of date so rebuild it
+                obj = self._names.get(key, None)
             if obj is None:
                 raise KeyError(key)
         else:
@@ -197,8 +324,13 @@ class Project(SimpleList):
 
     @property
     def network(self):
+        net = self._network
+        if (net is not None) and self._owns(net) \
+                and (('throat.conns' in net.keys()) or ('pore.coords' in net.keys())):
+            return net
         for item in self:
             if ('throat.conns' in item.keys()) or ('pore.coords' in item.keys()):
+                self._network = item
                 return item
 
     @property
@@ -223,6 +355,120 @@ class Project(SimpleList):
     def workspace(self):
         return ws
 
+    def checkpoint(self, path, full=False):
+        r"""
+        Saves an incremental checkpoint of the project into the given folder
+
+        Only the arrays that were written since the last checkpoint into the
+        same folder are saved, along with the settings, models and
+        parameters of each object, which are small. Other attributes, such
+        as the solution of an algorithm, are only saved when they are bound
+        to a new object, while cached data such as the coefficient matrix
+        or the adjacency matrices are not saved and are rebuilt on demand.
+
+        Parameters
+        ----------
+        path : str or Path
+            The folder in which to store the checkpoint files. It is created
+            if it does not exist.
+        full : bool
+            If ``True`` all arrays are written, and any checkpoints already
+            in the folder are removed. The default is ``False``. A full
+            checkpoint is always written the first time a project is
+            checkpointed into a given folder.
+
+        Returns
+        -------
+        fname : Path
+            The path to the file containing the checkpoint
+
+        See Also
+        --------
+        Workspace.load_checkpoint
+
+        Notes
+        -----
+        Changes are detected using the write version of each array, which is
+        updated whenever a key is assigned. Arrays that are modified in-place
+        (e.g. ``obj['pore.foo'][0] = 1.0``) are not detected, so they must
+        be re-assigned (``obj['pore.foo'] = arr``), or ``full=True`` used.
+
+        """
+        path = Path(path).resolve()
+        path.mkdir(parents=True, exist_ok=True)
+        state = getattr(self, '_checkpoint', None)
+        if full or (state is None) or (state['path'] != str(path)):
+            for f in path.glob('checkpoint_*.pkl'):
+                f.unlink()
+            state = {'path': str(path), 'count': 0, 'versions': {},
+                     'attrs': {}}
+        header, shells, arrays, data = [], [], {}, {}
+        versions, attrs = {}, {}
+        for obj in self:
+            uid = obj.settings['uuid']
+            old = state['versions'].get(uid, {})
+            versions[uid] = {k: obj._get_version(k) for k in obj.keys()}
+            arrays[uid] = {k: dict.__getitem__(obj, k)
+                           for k, v in versions[uid].items() if old.get(k) != v}
+            # Caches and other derived data are not worth storing, and other
+            # attributes such as solutions are only stored when replaced
+            shell, data[uid], attrs[uid] = \
+                _checkpoint_attrs(obj, state['attrs'].get(uid, {}))
+            header.append((obj.__class__, uid, list(obj.keys())))
+            shells.append(shell)
+        fname = path.joinpath('checkpoint_' + str(state['count']).zfill(4) + '.pkl')
+        with open(fname, 'wb') as f:
+            pickle.dump({'name': self.name, 'header': header}, f)
+            _CheckpointPickler(f, self).dump(
+                {'shells': shells, 'arrays': arrays, 'data': data})
+        state['count'] += 1
+        state['versions'] = versions
+        state['attrs'] = attrs
+        self._checkpoint = state
+        return fname
+
+    @classmethod
+    def _from_checkpoint(cls, path):
+        r"""
+        Rebuilds a project by replaying all checkpoints found in the given
+        folder. Use ``Workspace.load_checkpoint`` instead of calling this
+        directly.
+        """
+        path = Path(path).resolve()
+        files = sorted(path.glob('checkpoint_*.pkl'))
+        if len(files) == 0:
+            raise FileNotFoundError(f'No checkpoints found in {path}')
+        objs, data, attrs = {}, {}, {}
+        for fname in files:
+            with open(fname, 'rb') as f:
+                info = pickle.load(f)
+                for c, uid, _ in info['header']:
+                    if uid not in objs:
+                        objs[uid] = c.__new__(c)
+                        data[uid] = {}
+                        attrs[uid] = {}
+                d = _CheckpointUnpickler(f, objs).load()
+            for uid, arrs in d['arrays'].items():
+                data[uid].update(arrs)
+            for uid, vals in d.get('data', {}).items():
+                attrs[uid].update(vals)
+        # Only the objects and keys present in the latest checkpoint remain
+        proj = cls(name=ws._validate_name(info['name']))
+        for (_, uid, keys), shell in zip(info['header'], d['shells']):
+            obj = objs[uid]
+            obj.__dict__.update(attrs[uid])
+            obj.__dict__.update(shell)
+            obj.update({k: data[uid][k] for k in keys})
+            proj.append(obj)
+        proj._checkpoint = {
+            'path': str(path),
+            'count': len(files),
+            'versions': {obj.settings['uuid']: dict(obj._versions)
+                         for obj in proj},
+            'attrs': {uid: dict(vals) for uid, vals in attrs.items()},
+        }
+        return proj
+
     def _get_locations(self, label):
         r"""
         Find locations indicated by the given label regardless of which object
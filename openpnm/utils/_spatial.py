@@ -0,0 +1,173 @@
+import numpy as np
+
+
+__all__ = [
+    'SpatialIndex',
+]
+
+
+class SpatialIndex:
+    r"""
+    A k-d tree built on a set of points which performs batched neighbor
+    queries and returns their results in compressed sparse row (CSR) form
+
+    Parameters
+    ----------
+    coords : ndarray
+        The N-by-3 array of point coordinates to index
+
+    Notes
+    -----
+    The results of the radius and box queries are returned as ``indptr``
+    and ``indices`` arrays, so the points found for query ``i`` are
+    ``indices[indptr[i]:indptr[i+1]]``, sorted in ascending order. This
+    avoids the creation of lists of lists and is the same layout as the
+    rows of a ``scipy.sparse.csr_matrix``.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from openpnm.utils import SpatialIndex
+    >>> coords = np.array([[0, 0, 0], [1, 0, 0], [2, 0, 0], [3, 0, 0]])
+    >>> index = SpatialIndex(coords)
+    >>> indptr, indices = index.query_radius([[0, 0, 0], [3, 0, 0]], r=1)
+    >>> print(indptr)
+    [0 2 4]
+    >>> print(indices)
+    [0 1 2 3]
+
+    """
+
+    def __init__(self, coords):
+        from scipy.spatial import cKDTree
+        self.coords = np.asarray(coords, dtype=float)
+        self.tree = cKDTree(self.coords)
+
+    def __len__(self):
+        return self.coords.shape[0]
+
+    def _to_csr(self, rows, cols, n, vals=None):
+        order = np.lexsort((cols, rows))
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+        indices = cols[order].astype(np.int64)
+        if vals is None:
+            return indptr, indices
+        return indptr, indices, vals[order]
+
+    def query_radius(self, points, r, p=2, return_distance=False):
+        r"""
+        Finds all indexed points within a distance ``r`` of each query point
+
+        Parameters
+        ----------
+        points : array_like
+            The M-by-3 array of query points
+        r : scalar
+            The search radius, which is inclusive
+        p : float
+            The Minkowski p-norm to use, with 2 (default) being the
+            Euclidean distance and ``np.inf`` the maximum coordinate
+            difference
+        return_distance : bool
+            If ``True`` the distance to each found point is also returned
+
+        Returns
+        -------
+        indptr, indices : ndarray
+            The points found for each query point in CSR form
+        distances : ndarray
+            The distance to each of the points in ``indices``, only returned
+            if ``return_distance`` is ``True``
+
+        """
+        from scipy.spatial import cKDTree
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+        hits = cKDTree(points).sparse_distance_matrix(
+            self.tree, max_distance=r, p=p, output_type='ndarray')
+        vals = hits['v'] if return_distance else None
+        return self._to_csr(hits['i'], hits['j'], points.shape[0], vals)
+
+    def query_knn(self, points, k=1):
+        r"""
+        Finds the ``k`` nearest indexed points to each query point
+
+        Parameters
+        ----------
+        points : array_like
+            The M-by-3 array of query points
+        k : int
+            The number of neighbors to find
+
+        Returns
+        -------
+        distances, indices : ndarray
+            M-by-k arrays containing the distances to and indices of the
+            nearest points, sorted by distance
+
+        """
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+        d, i = self.tree.query(points, k=[i + 1 for i in range(k)])
+        return d, i.astype(np.int64)
+
+    def query_box(self, lo, hi):
+        r"""
+        Finds all indexed points inside each of the given axis-aligned boxes
+
+        Parameters
+        ----------
+        lo, hi : array_like
+            The M-by-3 arrays of the lower and upper corners of each box.
+            The bounds are inclusive.
+
+        Returns
+        -------
+        indptr, indices : ndarray
+            The points found inside each box in CSR form
+
+        """
+        lo = np.atleast_2d(np.asarray(lo, dtype=float))
+        hi = np.atleast_2d(np.asarray(hi, dtype=float))
+        lo, hi = np.broadcast_arrays(lo, hi)
+        half = (hi - lo)/2
+        # Find the points in the cube enclosing each box, then remove those
+        # lying outside the box along its shorter sides. Boxes are searched
+        # in groups of similar size so that one large box does not widen
+        # the search of all the others.
+        r = half.max(axis=1)
+        with np.errstate(divide='ignore'):
+            groups = np.floor(np.log2(r/max(r.max(initial=0), 1e-300)))
+        groups = np.maximum(groups, -64)
+        rows, indices = [], []
+        for g in np.unique(groups):
+            boxes = np.where(groups == g)[0]
+            indptr, i = self.query_radius(lo[boxes] + half[boxes],
+                                          r=r[boxes].max(), p=np.inf)
+            rows.append(np.repeat(boxes, np.diff(indptr)))
+            indices.append(i)
+        rows = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+        indices = np.concatenate(indices) if indices else rows
+        c = self.coords[indices]
+        keep = np.all((c >= lo[rows]) & (c <= hi[rows]), axis=1)
+        return self._to_csr(rows[keep], indices[keep], lo.shape[0])
+
+    def query_pairs(self, r, p=2):
+        r"""
+        Finds all pairs of indexed points within a distance ``r`` of each
+        other
+
+        Parameters
+        ----------
+        r : scalar
+            The search radius, which is inclusive
+        p : float
+            The Minkowski p-norm to use
+
+        Returns
+        -------
+        pairs : ndarray
+            A K-by-2 array of point indices with ``pairs[:, 0] <
+            pairs[:, 1]``
+
+        """
+        return self.tree.query_pairs(r=r, p=p, output_type='ndarray')
@@ -20,6 +20,12 @@ class WorkspaceSettings(SettingsAttr):
         The solver to use by default, if user does not specify one explicitly.
         The default values is PardisoSpsolve, but a good option is ScipySpsolve
         if the Pardiso is causing problems.
+    compiled_models : bool
+        If ``True`` the conduit models used by the standard geometry and
+        physics collections, such as ``spheres_and_cylinders`` and the
+        generic conductance models, are evaluated with compiled numba
+        kernels which compute several of them in a single pass. The
+        default is ``False``.
     loglevel : int
         Sets the threshold for the severity of logger message which appear.
         Ranges are as follows:
@@ -40,6 +46,7 @@ class WorkspaceSettings(SettingsAttr):
         ======= ==============================================================
     """
     default_solver = 'PardisoSpsolve'
+    compiled_models = False
 
     @property
     def loglevel(self):
@@ -229,6 +236,33 @@ class Workspace(dict):
             self[proj.name] = proj
         return proj
 
+    def load_checkpoint(self, path):
+        r"""
+        Loads a Project from the checkpoints saved in the specified folder
+
+        The project is rebuilt from all the incremental checkpoints written
+        by ``Project.checkpoint``, so it is in the state of the most recent
+        one. Further checkpoints of the loaded project into the same folder
+        continue where the previous ones stopped.
+
+        Parameters
+        ----------
+        path : str or Path
+            The folder containing the checkpoint files
+
+        Returns
+        -------
+        proj : list
+            The restored Project, which is added to the Workspace
+
+        See Also
+        --------
+        load_project
+
+        """
+        from openpnm.utils import Project
+        return Project._from_checkpoint(path)
+
     def close_project(self, project):
         r"""
         Removes the specified Project from the Workspace
@@ -1,6 +1,8 @@
+import logging
 import numpy as np
 import openpnm as op
-from tqdm.auto import tqdm
+import numba
+from numba import njit, prange
 from matplotlib.pyplot import cm
 import matplotlib.pyplot as plt
 
@@ -13,10 +15,14 @@ __all__ = [
     'plot_notebook',
     'plot_vispy',
     'generate_voxel_image',
+    'rasterize_network',
     'set_mpl_style',
 ]
 
 
+logger = logging.getLogger(__name__)
+
+
 def plot_connections(network,
                      throats=None,
                      ax=None,
@@ -27,6 +33,7 @@ def plot_connections(network,
                      alpha=1.0,
                      linestyle='solid',
                      linewidth=1,
+                     max_elements=None,
                      **kwargs):  # pragma: no cover
     r"""
     Produce a 3D plot of the network topology.
@@ -66,6 +73,13 @@ def plot_connections(network,
         Controls the thickness of drawn lines.  Is used to scale the thickness
         if ``size_by`` is given. Default is 1. If a value is provided for
         ``size_by`` then they are used to scale the ``linewidth``.
+    max_elements : int (optional)
+        The maximum number of throats to draw.  If more throats are
+        requested, those shorter than a pixel are dropped and the rest are
+        subsampled so that one throat is kept per cell of a regular grid,
+        which preserves the overall look of the network.  The default is
+        ``None``, which draws every throat.  See also ``rasterize_network``
+        for a density image of very large networks.
     **kwargs : dict
         All other keyword arguments are passed on to the ``Line3DCollection``
         class of matplotlib, so check their documentation for additional
@@ -132,6 +146,25 @@ def plot_connections(network,
         fig.delaxes(ax)
         ax = fig.add_subplot(111, projection='3d')
 
+    # Colors and sizes are scaled by the requested throats, not those drawn
+    if color_by is not None:
+        if len(color_by) != len(Ts):
+            color_by = color_by[Ts]
+        color_max = color_by.max()
+    if size_by is not None:
+        size_max = size_by.max()
+
+    # Reduce the number of throats to draw for large networks
+    if (max_elements is not None) and (Ts.size > max_elements):
+        if (size_by is not None) and (np.size(size_by) != len(Ts)):
+            size_by = size_by[Ts]
+        keep = _decimate_throats(network, Ts, dim, fig, max_elements)
+        logger.info(f'Drawing {keep.size} of {Ts.size} throats, set'
+                    ' max_elements=None to draw all of them')
+        Ts = Ts[keep]
+        color_by = None if color_by is None else color_by[keep]
+        size_by = None if size_by is None else size_by[keep]
+
     # Collect coordinates
     Ps = np.unique(network['throat.conns'][Ts])
     X, Y, Z = network['pore.coords'][Ps].T
@@ -145,12 +178,10 @@ def plot_connections(network,
     color = mcolors.to_rgb(color) + tuple([alpha])
     # Override colors with color_by if given
     if color_by is not None:
-        if len(color_by) != len(Ts):
-            color_by = color_by[Ts]
-        color = cm.get_cmap(name=cmap)(color_by / color_by.max())
+        color = cm.get_cmap(name=cmap)(color_by / color_max)
         color[:, 3] = alpha
     if size_by is not None:
-        linewidth = size_by / size_by.max() * linewidth
+        linewidth = size_by / size_max * linewidth
 
     if ThreeD:
         lc = Line3DCollection(throat_pos, colors=color, cmap=cmap,
@@ -180,6 +211,7 @@ def plot_coordinates(network,
                      alpha=1.0,
                      marker='o',
                      markersize=10,
+                     max_elements=None,
                      **kwargs):  # pragma: no cover
     r"""
     Produce a 3D plot showing specified pore coordinates as markers.
@@ -214,6 +246,11 @@ def plot_coordinates(network,
     markersize : scalar
         Controls size of marker, default is 1.0.  This value is used to scale
         the ``size_by`` argument if given.
+    max_elements : int (optional)
+        The maximum number of pores to draw.  If more pores are requested
+        they are subsampled so that one pore is kept per cell of a regular
+        grid, which preserves the overall look of the network.  The default
+        is ``None``, which draws every pore.
     **kwargs
         All other keyword arguments are passed on to the ``scatter``
         function of matplotlib, so check their documentation for additional
@@ -284,6 +321,24 @@ def plot_coordinates(network,
         fig.delaxes(ax)
         ax = fig.add_subplot(111, projection='3d')
 
+    # Colors and sizes are scaled by the requested pores, not those drawn
+    if color_by is not None:
+        color_by = color_by[Ps]
+        color_max = color_by.max()
+    if size_by is not None:
+        size_max = size_by.max()
+
+    # Reduce the number of pores to draw for large networks
+    if (max_elements is not None) and (Ps.size > max_elements):
+        keep = _subsample(network['pore.coords'][Ps][:, dim], max_elements)
+        logger.info(f'Drawing {keep.size} of {Ps.size} pores, set'
+                    ' max_elements=None to draw all of them')
+        if color_by is not None:
+            color_by = color_by[keep]
+        if (size_by is not None) and (np.size(size_by) == Ps.size):
+            size_by = size_by[keep]
+        Ps = Ps[keep]
+
     # Collect specified coordinates
     X, Y, Z = network['pore.coords'][Ps].T
     # The bounding box for fig is the entire ntwork (to fix the problem with
@@ -296,10 +351,9 @@ def plot_coordinates(network,
     if 's' in kwargs.keys():
         markersize = kwargs.pop('s')
     if color_by is not None:
-        color_by = color_by[Ps]
-        color = cm.get_cmap(name=cmap)(color_by / color_by.max())
+        color = cm.get_cmap(name=cmap)(color_by / color_max)
     if size_by is not None:
-        markersize = size_by / size_by.max() * markersize
+        markersize = size_by / size_max * markersize
 
     if ThreeD:
         sc = ax.scatter(X, Y, Z,
@@ -325,6 +379,127 @@ def plot_coordinates(network,
     return sc
 
 
+def _subsample(xyz, n_max):
+    r"""
+    Returns the indices of roughly ``n_max`` points spread evenly over
+    space, by keeping the first point found in each cell of a regular grid
+    """
+    if len(xyz) <= n_max:
+        return np.arange(len(xyz))
+    lo = xyz.min(axis=0)
+    span = np.ptp(xyz, axis=0)
+    active = span > 0
+    if not np.any(active):
+        return np.arange(n_max)
+    # Cell size that gives about n_max cells over the occupied region
+    w = (np.prod(span[active]) / n_max)**(1 / active.sum())
+    ijk = ((xyz[:, active] - lo[active]) / w).astype(np.int64)
+    cells = np.ravel_multi_index(ijk.T, ijk.max(axis=0) + 1)
+    _, keep = np.unique(cells, return_index=True)
+    keep.sort()
+    if keep.size > n_max:
+        keep = keep[np.linspace(0, keep.size - 1, n_max).astype(int)]
+    return keep
+
+
+def _decimate_throats(network, Ts, dim, fig, n_max):
+    r"""
+    Returns the indices into ``Ts`` of the throats worth drawing, which are
+    those longer than a pixel of ``fig``, subsampled by their midpoints
+    """
+    xyz = network['pore.coords'][:, dim]
+    P1, P2 = network['throat.conns'][Ts].T
+    L = np.linalg.norm(xyz[P1] - xyz[P2], axis=1)
+    pixel = np.ptp(xyz, axis=0).max() / (fig.get_size_inches() * fig.dpi).max()
+    keep = np.where(L >= pixel)[0]
+    mid = (xyz[P1[keep]] + xyz[P2[keep]]) / 2
+    return keep[_subsample(mid, n_max)]
+
+
+def rasterize_network(network, pores=None, throats=None, shape=(512, 512),
+                      axes=None):
+    r"""
+    Renders the network into a 2D image of pore and throat density
+
+    This is meant for inspecting networks which are too large to plot with
+    ``plot_connections`` and ``plot_coordinates``, since the time and
+    memory needed only depends on the size of the image and the number of
+    elements, with no per-element graphics objects.
+
+    Parameters
+    ----------
+    network : Network
+        The network to render
+    pores : array_like (optional)
+        The pores to draw as points.  No pores are drawn by default.
+    throats : array_like (optional)
+        The throats to draw as lines.  If neither ``pores`` nor ``throats``
+        are given then all throats are drawn.
+    shape : tuple of ints
+        The number of pixels in the image, given as (rows, columns).
+    axes : list of ints (optional)
+        The two coordinate axes to project onto, such as ``[0, 2]`` to view
+        the x-z plane.  The default is the first two axes along which the
+        network has some extent.
+
+    Returns
+    -------
+    im : ndarray
+        The number of pores and throat segments falling into each pixel.
+        The first axis of ``im`` corresponds to the second coordinate axis,
+        so it can be shown directly with ``imshow`` using ``origin='lower'``.
+    extent : list
+        The coordinates of the image borders, in the order expected by the
+        ``extent`` argument of ``imshow``.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import openpnm as op
+    >>> pn = op.network.Cubic(shape=[20, 20, 1])
+    >>> im, extent = op.visualization.rasterize_network(pn, shape=(100, 100))
+    >>> im.shape
+    (100, 100)
+
+    """
+    from openpnm.topotools import dimensionality
+    if axes is None:
+        dim = dimensionality(network)
+        if dim.sum() < 2:
+            dim[np.where(~dim)[0][:2 - dim.sum()]] = True
+        axes = np.where(dim)[0][:2]
+    xy = network['pore.coords'][:, axes]
+    lo = xy.min(axis=0)
+    span = np.ptp(xy, axis=0)
+    span[span == 0] = 1.0
+    # Convert coordinates into (fractional) pixel units, as (col, row)
+    scale = (np.array(shape[::-1]) - 1) / span
+    im = np.zeros(np.prod(shape))
+    if (pores is None) and (throats is None):
+        throats = network.Ts
+    if pores is not None:
+        ij = np.rint((xy[network._parse_indices(pores)] - lo) * scale)
+        ij = ij.astype(np.int64)
+        im += np.bincount(ij[:, 1]*shape[1] + ij[:, 0], minlength=im.size)
+    if throats is not None:
+        conns = network['throat.conns'][network._parse_indices(throats)]
+        # Throats are processed in blocks to keep the memory use bounded
+        for block in np.array_split(conns, max(1, len(conns) // 2**18)):
+            a = (xy[block[:, 0]] - lo) * scale
+            b = (xy[block[:, 1]] - lo) * scale
+            # Sample each throat at least once per pixel along its length
+            n = np.ceil(np.abs(b - a).max(axis=1)).astype(np.int64) + 1
+            t = np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n)
+            t = t / np.repeat(np.maximum(n - 1, 1), n)
+            pts = np.repeat(a, n, axis=0) \
+                + t[:, None] * np.repeat(b - a, n, axis=0)
+            ij = np.rint(pts).astype(np.int64)
+            im += np.bincount(ij[:, 1]*shape[1] + ij[:, 0], minlength=im.size)
+    im = im.reshape(shape)
+    extent = [lo[0], lo[0] + span[0], lo[1], lo[1] + span[1]]
+    return im, extent
+
+
 def _label_axes(ax, X, Y, Z):
     labels = ["X", "Y", "Z"]
     dim = np.zeros(3, dtype=bool)
@@ -645,7 +820,102 @@ def plot_notebook(network,
     return fig
 
 
-def _generate_voxel_image(network, pore_shape, throat_shape, max_dim=200):
+@njit(parallel=True, cache=True)
+def _insert_spheres(im, slabs, ptr, ids, c, r, val, cube):  # pragma: no cover
+    r"""
+    Inserts spheres (or cubes) into ``im``, with each slab of the image
+    along the x-axis filled by a separate thread using only the primitives
+    that were bucketed into it
+    """
+    for k in prange(len(ptr) - 1):
+        for j in range(ptr[k], ptr[k+1]):
+            i = ids[j]
+            ri = r[i]
+            cx, cy, cz = c[i, 0], c[i, 1], c[i, 2]
+            for x in range(max(cx - ri, slabs[k]), min(cx + ri + 1, slabs[k+1])):
+                for y in range(max(cy - ri, 0), min(cy + ri + 1, im.shape[1])):
+                    for z in range(max(cz - ri, 0), min(cz + ri + 1, im.shape[2])):
+                        if cube or ((x-cx)**2 + (y-cy)**2 + (z-cz)**2 <= ri**2):
+                            im[x, y, z] = val
+
+
+@njit(parallel=True, cache=True)
+def _insert_cylinders(im, slabs, ptr, ids, c0, c1, r, val):  # pragma: no cover
+    r"""
+    Inserts cylinders with rounded ends into the empty voxels of ``im``,
+    using the same slab-wise scheme as ``_insert_spheres``
+    """
+    for k in prange(len(ptr) - 1):
+        for j in range(ptr[k], ptr[k+1]):
+            i = ids[j]
+            ri = r[i]
+            a = c0[i].astype(np.float64)
+            u = c1[i] - a
+            L2 = (u**2).sum()
+            lo = np.minimum(c0[i], c1[i]) - ri
+            hi = np.maximum(c0[i], c1[i]) + ri + 1
+            for x in range(max(lo[0], slabs[k]), min(hi[0], slabs[k+1])):
+                for y in range(max(lo[1], 0), min(hi[1], im.shape[1])):
+                    for z in range(max(lo[2], 0), min(hi[2], im.shape[2])):
+                        if im[x, y, z] != 0:
+                            continue
+                        # Distance from voxel to the closest point on the axis
+                        t = 0.0
+                        if L2 > 0:
+                            t = ((x - a[0])*u[0] + (y - a[1])*u[1]
+                                 + (z - a[2])*u[2]) / L2
+                            t = min(max(t, 0.0), 1.0)
+                        d2 = ((x - a[0] - t*u[0])**2 + (y - a[1] - t*u[1])**2
+                              + (z - a[2] - t*u[2])**2)
+                        if d2 <= ri**2:
+                            im[x, y, z] = val
+
+
+def _bucket_into_slabs(lo, hi, slabs):
+    r"""
+    Finds which slabs each primitive overlaps, given the first (``lo``) and
+    last (``hi``) voxel it covers along the x-axis. Returns the primitive
+    indices sorted by slab along with the offsets of each slab in CSR form.
+    """
+    n_slabs = len(slabs) - 1
+    first = np.searchsorted(slabs, lo, side='right') - 1
+    last = np.searchsorted(slabs, hi, side='right') - 1
+    first = np.clip(first, 0, n_slabs - 1)
+    last = np.clip(last, 0, n_slabs - 1)
+    # Primitives that lie entirely outside the image are dropped
+    n = np.where((hi < 0) | (lo >= slabs[-1]), 0, last - first + 1)
+    ids = np.repeat(np.arange(len(lo)), n)
+    offset = np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n)
+    tiles = np.repeat(first, n) + offset
+    ids = ids[np.argsort(tiles, kind='stable')]
+    ptr = np.zeros(n_slabs + 1, dtype=int)
+    ptr[1:] = np.cumsum(np.bincount(tiles, minlength=n_slabs))
+    return ptr, ids
+
+
+def _voxelize(xyz, cn, pore_radi, throat_radi, shape, cube, n_slabs=None):
+    r"""
+    Rasterizes the pores and throats, given in voxel units, into an image
+    labeled with 1 for pores and 2 for throats
+    """
+    im = np.zeros(shape, dtype=np.uint8)
+    if n_slabs is None:
+        n_slabs = 4 * numba.get_num_threads()
+    slabs = np.unique(np.linspace(0, shape[0], n_slabs + 1).astype(int))
+    # Pores are inserted first, so throats only fill the remaining space
+    ptr, ids = _bucket_into_slabs(xyz[:, 0] - pore_radi, xyz[:, 0] + pore_radi,
+                                  slabs)
+    _insert_spheres(im, slabs, ptr, ids, xyz, pore_radi, 1, cube)
+    c0, c1 = xyz[cn[:, 0]], xyz[cn[:, 1]]
+    lo = np.minimum(c0[:, 0], c1[:, 0]) - throat_radi
+    hi = np.maximum(c0[:, 0], c1[:, 0]) + throat_radi
+    ptr, ids = _bucket_into_slabs(lo, hi, slabs)
+    _insert_cylinders(im, slabs, ptr, ids, c0, c1, throat_radi, 2)
+    return im
+
+
+def _generate_voxel_image(network, pore_shape, throat_shape, max_dim=200,
+                          bounds=None):
     r"""
     Generates a 3d numpy array from an OpenPNM network
 
@@ -659,6 +929,9 @@ def _generate_voxel_image(network, pore_shape, throat_shape, max_dim=200):
         Shape of throats in the network, valid choices are "cylinder", "cuboid"
     max_dim : int
         Number of voxels in the largest dimension of the network
+    bounds : tuple, optional
+        The shifted pore coordinates and clearance as returned by
+        ``_voxel_image_bounds``, if already known
 
     Returns
     -------
@@ -671,11 +944,27 @@ def _generate_voxel_image(network, pore_shape, throat_shape, max_dim=200):
     solid phase, pores, and throats respectively.
 
     """
-    from skimage.morphology import cube, ball
-    from porespy.tools import overlay, insert_cylinder
-    xyz = network["pore.coords"]
-    cn = network["throat.conns"]
+    if throat_shape == "cuboid":
+        raise Exception("Not yet implemented, try 'cylinder'.")
+    if bounds is None:
+        bounds = _voxel_image_bounds(network)
+    xyz, delta = bounds
+    res = (xyz.ptp(axis=0).max() + 2 * delta) / max_dim
+    shape = np.rint((xyz.max(axis=0) + delta) / res).astype(int)
+    # Transforming from real coords to matrix coords
+    xyz = np.rint(xyz / res).astype(int)
+    pore_radi = np.rint(network["pore.diameter"] * 0.5 / res).astype(int)
+    throat_radi = np.rint(network["throat.diameter"] * 0.5 / res).astype(int)
+    im = _voxelize(xyz, network["throat.conns"], pore_radi, throat_radi,
+                   shape=shape, cube=(pore_shape == "cube"))
+    return im
 
+
+def _voxel_image_bounds(network):
+    r"""
+    Returns the pore coordinates shifted so the image origin is at (0, 0, 0)
+    and the clearance added around the network
+    """
     # Distance bounding box from the network by a fixed amount
     delta = network["pore.diameter"].mean() / 2
     if isinstance(network, op.network.Cubic):
@@ -683,64 +972,9 @@ def _generate_voxel_image(network, pore_shape, throat_shape, max_dim=200):
             delta = op.topotools.get_spacing(network).mean() / 2
         except AttributeError:
             delta = network.spacing.mean() / 2
-
-    # Shift everything to avoid out-of-bounds
-    extra_clearance = int(max_dim * 0.05)
-
-    # Transform points to satisfy origin at (0, 0, 0)
-    xyz0 = xyz.min(axis=0) - delta
-    xyz += -xyz0
-    res = (xyz.ptp(axis=0).max() + 2 * delta) / max_dim
-    shape = np.rint((xyz.max(axis=0) + delta) / res).astype(int) + 2 * extra_clearance
-
-    # Transforming from real coords to matrix coords
-    xyz = np.rint(xyz / res).astype(int) + extra_clearance
-    pore_radi = np.rint(network["pore.diameter"] * 0.5 / res).astype(int)
-    throat_radi = np.rint(network["throat.diameter"] * 0.5 / res).astype(int)
-
-    im_pores = np.zeros(shape, dtype=np.uint8)
-    im_throats = np.zeros_like(im_pores)
-
-    if pore_shape == "cube":
-        pore_elem = cube
-        rp = pore_radi * 2 + 1  # +1 since num_voxel must be odd
-        rp_max = int(2 * round(delta / res)) + 1
-    if pore_shape == "sphere":
-        pore_elem = ball
-        rp = pore_radi
-        rp_max = int(round(delta / res))
-    if throat_shape == "cuboid":
-        raise Exception("Not yet implemented, try 'cylinder'.")
-
-    # Generating voxels for pores
-    for i, pore in enumerate(tqdm(network.Ps)):
-        elem = pore_elem(rp[i])
-        try:
-            im_pores = overlay(im1=im_pores, im2=elem, c=xyz[i])
-        except ValueError:
-            elem = pore_elem(rp_max)
-            im_pores = overlay(im1=im_pores, im2=elem, c=xyz[i])
-    # Get rid of pore overlaps
-    im_pores[im_pores > 0] = 1
-
-    # Generating voxels for throats
-    for i, throat in enumerate(tqdm(network.Ts)):
-        try:
-            im_throats = insert_cylinder(
-                im_throats, r=throat_radi[i], xyz0=xyz[cn[i, 0]], xyz1=xyz[cn[i, 1]])
-        except ValueError:
-            im_throats = insert_cylinder(
-                im_throats, r=rp_max, xyz0=xyz[cn[i, 0]], xyz1=xyz[cn[i, 1]])
-    # Get rid of throat overlaps
-    im_throats[im_throats > 0] = 1
-
-    # Subtract pore-throat overlap from throats
-    im_throats = (im_throats.astype(bool) * ~im_pores.astype(bool)).astype(np.uint8)
-    im = im_pores * 1 + im_throats * 2
-
-    return im[extra_clearance:-extra_clearance,
-              extra_clearance:-extra_clearance,
-              extra_clearance:-extra_clearance]
+    xyz = network["pore.coords"]
+    xyz = xyz - (xyz.min(axis=0) - delta)
+    return xyz, delta
 
 
 def generate_voxel_image(network, pore_shape="sphere", throat_shape="cylinder",
@@ -782,13 +1016,15 @@ def generate_voxel_image(network, pore_shape="sphere", throat_shape="cylinder",
         return _generate_voxel_image(
             network, pore_shape, throat_shape, max_dim=max_dim)
     max_dim = 200
-    # If max_dim is not provided, find best max_dim that predicts porosity
+    # If max_dim is not provided, find best max_dim that predicts porosity.
+    # The network bounds are found once and reused at each resolution.
+    bounds = _voxel_image_bounds(network)
     err = 100
     eps_old = 200
     while err > rtol:
         im = _generate_voxel_image(
-            network, pore_shape, throat_shape, max_dim=max_dim)
-        eps = im.astype(bool).sum() / np.prod(im.shape)
+            network, pore_shape, throat_shape, max_dim=max_dim, bounds=bounds)
+        eps = np.count_nonzero(im) / im.size
         err = abs(1 - eps / eps_old)
         eps_old = eps
         max_dim = int(max_dim * 1.25)
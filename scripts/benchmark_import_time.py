@@ -0,0 +1,44 @@
+# %% Measures the time needed to import openpnm, using python -X importtime
+import re
+import sys
+import subprocess
+
+
+def import_time(stmt, n_top=15):
+    r"""
+    Runs ``stmt`` in a fresh interpreter and returns the total import time
+    along with the slowest modules (by cumulative time) in seconds
+    """
+    out = subprocess.run([sys.executable, '-X', 'importtime', '-c', stmt],
+                         capture_output=True, text=True).stderr
+    times, total = {}, 0
+    for line in out.splitlines():
+        m = re.match(r'import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)', line)
+        if m:
+            t = int(m.group(2))/1e6
+            times[m.group(4)] = t
+            if len(m.group(3)) == 1:  # Top level imports include the rest
+                total += t
+    top = sorted(times.items(), key=lambda x: x[1], reverse=True)[:n_top]
+    return total, top
+
+
+heavy = ['numba', 'pandas', 'matplotlib', 'scipy.stats', 'h5py', 'pypardiso',
+         'pyamg']
+
+
+# %% Time a bare import, as well as creating a network and running an algorithm
+cases = {
+    'import openpnm': 'import openpnm',
+    'create a network': 'import openpnm as op; op.network.Cubic([3, 3, 3])',
+    'import algorithms': 'import openpnm as op; op.algorithms.StokesFlow',
+}
+for name, stmt in cases.items():
+    total, top = import_time(stmt)
+    print(f'{name}: {total:.3f} s')
+    for mod, t in top:
+        print(f'    {mod:<50s} {t:.3f}')
+    check = stmt + '; import sys; print([m for m in %r if m in sys.modules])'
+    loaded = subprocess.run([sys.executable, '-c', check % heavy],
+                            capture_output=True, text=True).stdout.strip()
+    print(f'    heavy dependencies loaded: {loaded}')
@@ -42,13 +42,20 @@ class IPTest:
         alg.run()
         assert alg["throat.invasion_sequence"].max() == alg.Nt
 
-    # def test_multiple_calls_to_run(self):
-    #     alg = op.algorithms.InvasionPercolation(network=self.net, phase=self.water)
-    #     alg.set_inlet_BC(pores=self.net.pores("top"))
-    #     alg.run(n_steps=10)
-    #     assert alg['pore.invasion_sequence'].max() == 10
-    #     alg.run(n_steps=10)
-    #     assert alg['pore.invasion_sequence'].max() == 20
+    def test_multiple_calls_to_run(self):
+        alg = op.algorithms.InvasionPercolation(network=self.net, phase=self.water)
+        alg.set_inlet_BC(pores=self.net.pores("top"))
+        alg.run(n_steps=10)
+        assert alg['throat.invasion_sequence'].max() == 10
+        alg.run(n_steps=10)
+        assert alg['throat.invasion_sequence'].max() == 20
+        alg.run()
+        ref = op.algorithms.InvasionPercolation(network=self.net, phase=self.water)
+        ref.set_inlet_BC(pores=self.net.pores("top"))
+        ref.run()
+        for k in ['pore.invasion_sequence', 'throat.invasion_sequence',
+                  'pore.invasion_pressure', 'throat.invasion_pressure']:
+            assert np.all(alg[k] == ref[k])
 
     def test_results(self):
         alg = op.algorithms.InvasionPercolation(network=self.net, phase=self.water)
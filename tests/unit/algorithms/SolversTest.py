@@ -1,3 +1,4 @@
+import pytest
 import numpy as np
 import numpy.testing as nt
 import openpnm as op
@@ -43,6 +44,42 @@ class SolversTest:
         x = self.alg['pore.x']
         nt.assert_allclose(x.mean(), 0.624134, rtol=1e-5)
 
+    def test_stencil_laplacian(self):
+        import scipy.sparse.csgraph as spgr
+        for c in [6, 14, 18, 20, 26]:
+            net = op.network.Cubic(shape=[3, 4, 5], connectivity=c)
+            g = np.random.rand(net.Nt)
+            am = net.create_adjacency_matrix(weights=g, fmt='coo')
+            L = spgr.laplacian(am).astype(float)
+            A = op.solvers.StencilLaplacian(g, **net.lattice)
+            x = np.random.rand(net.Np)
+            nt.assert_allclose(A @ x, L @ x)
+            nt.assert_allclose(A.tocsr().toarray(), L.toarray(), atol=1e-12)
+        im = np.random.rand(4, 5, 6) > 0.3
+        net = op.network.CubicTemplate(template=im)
+        g = np.random.rand(net.Nt)
+        L = spgr.laplacian(net.create_adjacency_matrix(weights=g, fmt='coo'))
+        A = op.solvers.StencilLaplacian(g, **net.lattice)
+        x = np.random.rand(net.Np)
+        nt.assert_allclose(A @ x, L @ x)
+        with pytest.raises(Exception):
+            op.solvers.StencilLaplacian(g[:-1], **net.lattice)
+
+    def test_scipy_cg_matrix_free(self):
+        alg = op.algorithms.Transport(network=self.net, phase=self.phase)
+        alg.settings._update({'quantity': 'pore.x',
+                              'conductance': 'throat.conductance',
+                              'matrix_free': True})
+        alg.set_value_BC(pores=self.net.pores('front'), values=1)
+        alg.set_value_BC(pores=self.net.pores('bottom'), values=0, mode='overwrite')
+        alg.run(solver=op.solvers.ScipyCG())
+        assert isinstance(alg.A, op.solvers.StencilLaplacian)
+        x = alg['pore.x']
+        nt.assert_allclose(x.mean(), 0.624134, rtol=1e-5)
+        # Direct solvers use the assembled matrix
+        alg.run(solver=op.solvers.ScipySpsolve())
+        nt.assert_allclose(alg['pore.x'], x, rtol=1e-5)
+
 
 if __name__ == '__main__':
     t = SolversTest()
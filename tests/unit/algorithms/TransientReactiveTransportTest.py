@@ -1,3 +1,4 @@
+import os
 import numpy as np
 import numpy.testing as nt
 import openpnm as op
@@ -77,6 +78,28 @@ class TransientReactiveTransportTest:
             self.alg.set_source(propname='pore.reaction',
                                 pores=self.net.pores('left'))
 
+    def test_run_with_checkpoints_and_resume(self, tmpdir):
+        quantity = self.alg.settings['quantity']
+        self.alg.run(x0=0, tspan=(0, 1), saveat=0.1)
+        desired = self.alg.soln[quantity].copy()
+        path = tmpdir.join('checkpoints')
+        self.alg.run(x0=0, tspan=(0, 1), saveat=0.1, checkpoint=path)
+        files = sorted(os.listdir(path))
+        assert len(files) == 10
+        nt.assert_allclose(self.alg.soln[quantity], desired, rtol=1e-4)
+        # Simulate an interrupted run by removing the latest checkpoints
+        for f in files[5:]:
+            os.remove(path.join(f))
+        ws = op.Workspace()
+        proj = ws.load_checkpoint(path)
+        alg = proj[self.alg.name]
+        assert alg.soln[quantity].t[-1] == 0.5
+        alg.run(x0=0, tspan=(0, 1), saveat=0.1, checkpoint=path)
+        nt.assert_array_equal(alg.soln[quantity].t, np.arange(0, 1.1, 0.1))
+        nt.assert_allclose(alg.soln[quantity], desired, rtol=1e-4)
+        assert len(os.listdir(path)) == 10
+        ws.close_project(proj)
+
     def test_ensure_settings_are_valid(self):
         alg = op.algorithms.TransientReactiveTransport(network=self.net,
                                                        phase=self.phase)
@@ -95,6 +118,7 @@ class TransientReactiveTransportTest:
 
 
 if __name__ == '__main__':
+    import py
 
     t = TransientReactiveTransportTest()
     t.setup_class()
@@ -102,4 +126,7 @@ if __name__ == '__main__':
     for item in t.__dir__():
         if item.startswith('test'):
             print(f'Running test: {item}')
-            t.__getattribute__(item)()
+            try:
+                t.__getattribute__(item)()
+            except TypeError:
+                t.__getattribute__(item)(tmpdir=py.path.local())
@@ -146,6 +146,98 @@ class Base2Test:
         assert g['pore.dict3.item1@left'].sum() == 3
         assert g['pore.dict3.item1@right'].sum() == 3
 
+    def test_write_versions(self):
+        pn = op.network.Cubic(shape=[3, 3, 1])
+        assert pn._get_version('pore.foo') == 0
+        pn['pore.foo'] = 1.0
+        v1 = pn._get_version('pore.foo')
+        assert v1 > 0
+        pn['pore.foo'][0] = 2.0  # In-place writes cannot be detected
+        assert pn._get_version('pore.foo') == v1
+        pn['pore.foo'] = 2.0
+        v2 = pn._get_version('pore.foo')
+        assert v2 > v1
+        pn['pore.foo@left'] = 3.0
+        assert pn._get_version('pore.foo') > v2
+        pn.update({'throat.bar': np.ones(pn.Nt)})
+        assert pn._get_version('throat.bar') > v2
+
+    def test_cached_counts_and_ranges(self):
+        pn = op.network.Cubic(shape=[3, 3, 1])
+        air = op.phase.Phase(network=pn)
+        assert air.Np == 9
+        assert pn.Ps is pn.Ps
+        assert not pn.Ps.flags.writeable
+        with pytest.raises(ValueError):
+            pn.Ps[0] = 1
+        # Resizing the arrays updates the counts and ranges
+        op.topotools.extend(pn, coords=[[5, 5, 5]], conns=[[0, 9]])
+        assert air.Np == 10
+        assert air.Nt == pn.Nt == 13
+        assert np.all(pn.Ps == np.arange(10))
+        op.topotools.trim(pn, pores=[9])
+        assert air.Np == pn.Ps.size == 9
+        assert air.Ts.size == 12
+
+    def test_label_queries(self):
+        pn = op.network.Cubic(shape=[4, 4, 1])
+        pn['pore.a1'] = pn.Ps < 8
+        pn['pore.a2'] = pn.Ps % 2 == 0
+        a1, a2 = pn['pore.a1'], pn['pore.a2']
+        assert np.all(pn.pores('a*', mode='or') == np.where(a1 | a2)[0])
+        assert np.all(pn.pores('a*', mode='and') == np.where(a1 & a2)[0])
+        assert np.all(pn.pores('a*', mode='xor') == np.where(a1 ^ a2)[0])
+        assert np.all(pn.pores('a*', mode='nor') == np.where(~(a1 | a2))[0])
+        assert np.all(pn.pores('a*', mode='xnor') == np.where(a1 & a2)[0])
+        assert np.all(pn.pores('a*', mode='nand') == np.where(a1 ^ a2)[0])
+        assert pn.num_pores(['a1', 'a2'], mode='and') == 4
+        # The cached wildcard expansion is updated when labels are added
+        pn['pore.a3'] = True
+        assert pn.num_pores('a*', mode='and') == 4
+        pn['pore.a3'] = 1.0  # No longer a label
+        assert pn.num_pores('a*', mode='xor') == 8
+        with pytest.raises(Exception):
+            pn.pores('a1', mode='foo')
+
+    def test_get_conduit_data_out(self):
+        pn = op.network.Cubic(shape=[4, 4, 1])
+        pn['pore.diameter'] = np.random.rand(pn.Np)
+        pn['throat.diameter'] = np.random.rand(pn.Nt)
+        a = pn.get_conduit_data('diameter')
+        P1, T, P2 = a.T
+        assert np.all(P1 == pn['pore.diameter'][pn.conns[:, 0]])
+        assert np.all(T == pn['throat.diameter'])
+        assert np.all(P2 == pn['pore.diameter'][pn.conns[:, 1]])
+        # Reusing the returned array writes the new values into it
+        pn['pore.diameter'] = 2.0
+        b = pn.get_conduit_data('diameter', out=a)
+        assert b is a
+        assert np.all(P1 == 2.0) and np.all(P2 == 2.0)
+        with pytest.raises(Exception):
+            pn.get_conduit_data('diameter', out=np.zeros((pn.Nt, 2)))
+        # The conduit pores follow changes to the topology
+        op.topotools.trim(pn, throats=[0])
+        c = pn.get_conduit_data('diameter')
+        assert c.shape == (pn.Nt, 3)
+
+    def test_get_conduit_data_int_and_bool(self):
+        pn = op.network.Cubic(shape=[4, 4, 1])
+        pn['pore.num'] = np.arange(pn.Np)
+        pn['throat.num'] = np.arange(pn.Nt)
+        a = pn.get_conduit_data('num')
+        assert a.dtype == int
+        assert np.all(a[:, 0] == pn.conns[:, 0])
+        assert np.all(a[:, 1] == pn.Ts)
+        assert np.all(a[:, 2] == pn.conns[:, 1])
+        pn['pore.flag'] = pn.Ps < 4
+        b = pn.get_conduit_data('flag')
+        assert np.all(b[:, 0] == (pn.conns[:, 0] < 4))
+        assert np.all(np.isnan(b[:, 1]))
+        pn['throat.flag'] = pn.Ts < 4
+        c = pn.get_conduit_data('flag')
+        assert c.dtype == bool
+        assert np.all(c[:, 1] == (pn.Ts < 4))
+
 
 if __name__ == '__main__':
 
@@ -0,0 +1,87 @@
+import os
+import pytest
+import numpy as np
+import openpnm as op
+
+
+pa = pytest.importorskip('pyarrow')
+
+
+class ArrowTest:
+
+    def setup_class(self):
+        ws = op.Workspace()
+        ws.settings['local_data'] = True
+        self.net = op.network.Cubic(shape=[2, 2, 2])
+        self.net['pore.boo'] = 1
+        self.net['throat.boo'] = 1
+        self.net['throat.triple'] = np.random.rand(self.net.Nt, 3)
+        self.net['pore.tensor'] = np.random.rand(self.net.Np, 2, 2)
+        self.phase_1 = op.phase.Phase(network=self.net)
+        self.phase_1['pore.bar'] = 2
+        self.phase_1['throat.bar'] = 2
+
+    def teardown_class(self):
+        ws = op.Workspace()
+        ws.clear()
+
+    def test_project_to_arrow(self):
+        tables = op.io.project_to_arrow(self.net.project)
+        assert tables['pore'].num_rows == self.net.Np
+        assert tables['throat'].num_rows == self.net.Nt
+        n = self.net.name
+        col = tables['pore'].column(n + '.pore.coords')
+        assert pa.types.is_fixed_size_list(col.type)
+        assert col.type.list_size == 3
+        assert self.phase_1.name + '.pore.bar' in tables['pore'].column_names
+        assert self.phase_1.name + '.throat.bar' in tables['throat'].column_names
+
+    def test_network_from_arrow(self):
+        tables = op.io.project_to_arrow(self.net.project)
+        net = op.io.network_from_arrow(tables)
+        assert net.Np == self.net.Np
+        assert net.Nt == self.net.Nt
+        assert np.all(net.coords == self.net.coords)
+        assert np.all(net.conns == self.net.conns)
+        assert np.all(net['throat.triple'] == self.net['throat.triple'])
+        assert net['pore.tensor'].shape == (self.net.Np, 2, 2)
+        assert np.all(net['pore.tensor'] == self.net['pore.tensor'])
+        assert net['pore.left'].dtype == bool
+        assert np.all(net['pore.left'] == self.net['pore.left'])
+        assert 'pore.bar' not in net.keys()
+
+    def test_network_parquet_round_trip(self, tmpdir):
+        fname = tmpdir.join(self.net.name)
+        op.io.network_to_parquet(self.net, filename=fname)
+        assert os.path.isfile(fname + '_pore.parquet')
+        assert os.path.isfile(fname + '_throat.parquet')
+        net = op.io.network_from_parquet(fname)
+        assert net.name == self.net.name
+        assert np.all(net.conns == self.net.conns)
+        assert np.all(net['pore.boo'] == self.net['pore.boo'])
+        assert np.all(net['throat.boo'] == self.net['throat.boo'])
+        assert net['pore.tensor'].shape == (self.net.Np, 2, 2)
+        assert np.all(net['pore.tensor'] == self.net['pore.tensor'])
+
+    def test_project_to_parquet(self, tmpdir):
+        fname = tmpdir.join(self.net.project.name)
+        op.io.project_to_parquet(self.net.project, filename=fname)
+        assert os.path.isfile(fname + '_pore.parquet')
+        assert os.path.isfile(fname + '_throat.parquet')
+        net = op.io.network_from_parquet(fname + '_pore.parquet')
+        assert net.Nt == self.net.Nt
+
+
+if __name__ == '__main__':
+    import py
+    # All the tests in this file can be run with 'playing' this file
+    t = ArrowTest()
+    self = t  # For interacting with the tests at the command line
+    t.setup_class()
+    for item in t.__dir__():
+        if item.startswith('test'):
+            print(f'Running test: {item}')
+            try:
+                t.__getattribute__(item)()
+            except TypeError:
+                t.__getattribute__(item)(tmpdir=py.path.local())
@@ -1,3 +1,4 @@
+import numpy as np
 import openpnm as op
 
 
@@ -7,6 +8,50 @@ class DictTest:
         ws = op.Workspace()
         ws.settings['local_data'] = True
         self.net = op.network.Cubic(shape=[2, 2, 2])
+        self.phase = op.phase.Phase(network=self.net)
+        self.phase['throat.bar'] = 2.0
+
+    def test_project_to_dict(self):
+        d = op.io.project_to_dict(self.net.project)
+        assert set(d.keys()) == {self.net.name, self.phase.name}
+        assert d[self.net.name]['pore.coords'] is self.net['pore.coords']
+        d = op.io.project_to_dict(self.net.project, flatten=True,
+                                  categorize_by=['object', 'data'])
+        assert 'network | properties | pore.coords' in d.keys()
+        assert 'phase | labels | throat.all' in d.keys()
+
+    def test_iter_project(self):
+        proj = self.net.project
+        d = dict(op.io.iter_project(proj, categorize_by=['name'], delim='.'))
+        assert d['net.pore.coords'] is self.net['pore.coords']
+        assert d[self.phase.name + '.throat.bar'] is self.phase['throat.bar']
+        d = dict(op.io.iter_project(proj, element='throat'))
+        assert all([k.split(' | ')[1].startswith('throat') for k in d])
+        d = dict(op.io.iter_project(proj, objects=[self.phase.name],
+                                    categorize_by=[]))
+        assert sorted(d.keys()) == sorted(self.phase.keys())
+        d = dict(op.io.iter_project(proj, dtype=bool))
+        assert all([v.dtype == bool for v in d.values()])
+        d = dict(op.io.iter_project(proj, dtype=np.number))
+        assert all([v.dtype != bool for v in d.values()])
+
+    def test_iter_project_transient(self):
+        pn = op.network.Cubic(shape=[3, 1, 1])
+        phase = op.phase.Phase(network=pn)
+        phase['throat.diffusive_conductance'] = 1.0
+        pn['pore.volume'] = 1.0
+        alg = op.algorithms.TransientFickianDiffusion(network=pn, phase=phase)
+        alg.set_value_BC(pores=pn.pores('left'), values=1)
+        alg.run(x0=0, tspan=(0, 1), saveat=0.5)
+        proj = pn.project
+        d = dict(op.io.iter_project(proj, objects=alg, categorize_by=[]))
+        assert list(d.keys()) == ['pore.concentration#0',
+                                  'pore.concentration#5e-1',
+                                  'pore.concentration#1']
+        soln = alg.soln['pore.concentration']
+        assert np.shares_memory(d['pore.concentration#1'], soln)
+        d = dict(op.io.iter_project(proj, objects=alg, element='throat'))
+        assert len(d) == 0
 
     def teardown_class(self):
         ws = op.Workspace()
@@ -1,4 +1,5 @@
 import openpnm as op
+import numpy as np
 import os
 from pathlib import Path
 
@@ -35,6 +36,24 @@ class PerGeosTest:
         assert network.Np == 225
         assert network.Nt == 301
 
+    def test_load_PerGeos_data(self, tmpdir):
+        path = Path(os.path.realpath(__file__),
+                    '../../../fixtures/PerGeos/simplePNM.am')
+        network = op.io.network_from_pergeos(path)
+        assert np.allclose(network['pore.coords'][0],
+                           [3.09991675e6, 1.505000625e6, 3.05498475e6])
+        assert np.all(network['throat.conns'] == [[0, 2], [0, 1], [1, 2]])
+        assert np.allclose(network['throat.ChannelLength'],
+                           [4.766702734375e4, 5.021435156250e4, 7.100543750e4])
+
+    def test_save_and_load_PerGeos(self, tmpdir):
+        net = op.network.Cubic(shape=[3, 3, 3])
+        fname = tmpdir.join(net.project.name)
+        op.io.network_to_pergeos(net, filename=fname)
+        network = op.io.network_from_pergeos(fname + '.am')
+        assert np.allclose(network.coords, net.coords)
+        assert np.all(network.conns == net.conns)
+
     def test_save_PerGeos(self, tmpdir):
         net = op.network.Cubic(shape=[5, 5, 5])
         fname = tmpdir.join(net.project.name)
@@ -1,3 +1,4 @@
+import pytest
 from numpy import array
 from numpy.testing import assert_allclose
 import openpnm as op
@@ -215,6 +216,28 @@ class ConduitHydraulicSizeFactorsTest:
             assert_allclose(v, S_desired[k], rtol=1e-5)
         self.net["pore.diameter"][0] = 1.2
 
+    def test_spheres_and_cylinders_compiled(self):
+        ws = op.Workspace()
+        S_desired = mods.spheres_and_cylinders(self.net)
+        D_desired = gm.diffusive_size_factors.spheres_and_cylinders(self.net)
+        L_desired = gm.conduit_lengths.spheres_and_cylinders(self.net)
+        ws.settings.compiled_models = True
+        try:
+            assert_allclose(mods.spheres_and_cylinders(self.net), S_desired)
+            assert_allclose(
+                gm.diffusive_size_factors.spheres_and_cylinders(self.net),
+                D_desired)
+            assert_allclose(
+                gm.conduit_lengths.spheres_and_cylinders(self.net),
+                L_desired)
+            # Incompatible data with model assumptions
+            self.net["pore.diameter"][1] = 0.3
+            with pytest.raises(Exception):
+                mods.spheres_and_cylinders(self.net)
+        finally:
+            self.net["pore.diameter"][1] = 0.9
+            ws.settings.compiled_models = False
+
 
 if __name__ == '__main__':
 
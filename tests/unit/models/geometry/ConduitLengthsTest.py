@@ -169,6 +169,24 @@ class ConduitLengthsTest:
         assert_allclose(L_actual, L_desired)
         self.net["pore.diameter"][0] = 0.5
 
+    def test_shared_during_regeneration(self):
+        net = op.network.Cubic(shape=[4, 4, 1])
+        net.add_model_collection(
+            op.models.collections.geometry.spheres_and_cylinders)
+        net.regenerate_models()
+        L = net['throat.length'].copy()
+        S = net['throat.hydraulic_size_factors'].copy()
+        net.regenerate_models(exclude=['pore.seed'])
+        assert_allclose(net['throat.length'], L)
+        assert_allclose(net['throat.hydraulic_size_factors'], S)
+        # The size factors use the lengths computed with the new diameters
+        net['pore.seed'] = net['pore.seed']*0.5
+        net.regenerate_models(exclude=['pore.seed'])
+        assert np.all(net['throat.length'] > L)
+        assert_allclose(net['throat.hydraulic_size_factors'],
+                        gm.hydraulic_size_factors.spheres_and_cylinders(net))
+        assert net._model_cache is None
+
 
 if __name__ == '__main__':
 
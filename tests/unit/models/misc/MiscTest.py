@@ -1,3 +1,4 @@
+import pytest
 import numpy as np
 import openpnm as op
 import openpnm.models.misc as mods
@@ -210,6 +211,17 @@ class MiscTest:
                                               0.48484848, 0.54545455,
                                               0.57575758, 0.63636364]))
 
+    def test_neighbor_throats_does_not_modify_prop(self):
+        net = op.network.Cubic(shape=[2, 2, 2])
+        net['throat.values'] = np.linspace(0, 1, net.Nt)
+        net['throat.values'][0] = np.nan
+        f = mods.from_neighbor_throats
+        for mode in ['min', 'max', 'mean']:
+            _ = f(net, prop='throat.values', ignore_nans=True, mode=mode)
+            assert np.isnan(net['throat.values'][0])
+        with pytest.raises(Exception):
+            _ = f(net, prop='throat.values', mode='foo')
+
     def test_from_neighbor_pores_min(self):
         del self.net['throat.seed']
         del self.net.models['throat.seed']
@@ -246,6 +258,29 @@ class MiscTest:
         tseed = np.mean(self.net['pore.seed'][P12], axis=1)
         assert_array_almost_equal_nulp(self.net['throat.seed'], tseed)
 
+    def test_from_neighbor_pores_int_and_bool(self):
+        net = op.network.Cubic(shape=[4, 1, 1])
+        net['pore.int'] = np.array([1, 3, 2, 5])
+        f = mods.from_neighbor_pores
+        vals = f(net, prop='pore.int', mode='min')
+        assert vals.dtype == net['pore.int'].dtype
+        assert np.all(vals == [1, 2, 2])
+        vals = f(net, prop='pore.int', mode='max')
+        assert vals.dtype == net['pore.int'].dtype
+        assert np.all(vals == [3, 3, 5])
+        vals = f(net, prop='pore.int', mode='mean')
+        assert np.allclose(vals, [2.0, 2.5, 3.5])
+        # Labels are returned as labels
+        net['throat.left'] = f(net, prop='pore.left', mode='max')
+        assert net['throat.left'].dtype == bool
+        assert np.all(net['throat.left'] == [True, False, False])
+        assert np.all(net.throats('left') == [0])
+        vals = f(net, prop='pore.left', mode='min')
+        assert vals.dtype == bool
+        assert not np.any(vals)
+        vals = f(net, prop='pore.left', mode='mean')
+        assert np.allclose(vals, [0.5, 0.0, 0.0])
+
     # def test_from_neighbors_multi_geom(self):
     #     net = op.network.Cubic(shape=[5, 5, 5])
     #     net.add_boundary_pores()
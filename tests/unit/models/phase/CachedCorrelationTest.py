@@ -0,0 +1,88 @@
+import numpy as np
+import openpnm as op
+from numpy.testing import assert_allclose
+
+
+f = op.models.phase.viscosity.water_correlation
+
+
+def g(phase, T='pore.temperature', scale='pore.scale'):
+    try:
+        return phase[T]*phase[scale]
+    except KeyError:
+        return phase[T]
+
+
+class CachedCorrelationTest:
+
+    def setup_class(self):
+        self.net = op.network.Cubic(shape=[5, 5, 5])
+        self.phase = op.phase.Water(network=self.net)
+
+    def test_cached_correlation_uniform(self):
+        self.phase['pore.temperature'] = 300.0
+        self.phase.add_model(propname='pore.mu',
+                             model=op.models.phase.misc.cached_correlation,
+                             func=f)
+        assert_allclose(self.phase['pore.mu'], f(self.phase), rtol=0)
+        self.phase['pore.temperature'] = 310.0
+        self.phase.regenerate_models()
+        assert_allclose(self.phase['pore.mu'], f(self.phase), rtol=0)
+
+    def test_cached_correlation_reuses_results(self):
+        np.random.seed(0)
+        T = np.random.rand(self.net.Np)*50 + 290
+        self.phase['pore.temperature'] = T
+        self.phase.add_model(propname='pore.mu',
+                             model=op.models.phase.misc.cached_correlation,
+                             func=f)
+        assert_allclose(self.phase['pore.mu'], f(self.phase), rtol=0)
+        self.phase['pore.mu'] = 0.0
+        self.phase.run_model('pore.mu')
+        assert_allclose(self.phase['pore.mu'], f(self.phase), rtol=0)
+        # Adding salinity changes both the keys and the result
+        self.phase['pore.salinity'] = 20.0
+        self.phase.run_model('pore.mu')
+        assert_allclose(self.phase['pore.mu'], f(self.phase), rtol=0)
+        del self.phase['pore.salinity']
+
+    def test_cached_correlation_table(self):
+        np.random.seed(0)
+        T = np.random.rand(self.net.Np)*50 + 290
+        self.phase['pore.temperature'] = T
+        self.phase.add_model(propname='pore.mu',
+                             model=op.models.phase.misc.cached_correlation,
+                             func=f,
+                             T_range=[273.15, 373.15])
+        assert_allclose(self.phase['pore.mu'], f(self.phase), rtol=1e-5)
+        # Temperatures outside the table are evaluated directly
+        self.phase['pore.temperature'] = T + 100
+        self.phase.run_model('pore.mu')
+        assert_allclose(self.phase['pore.mu'], f(self.phase), rtol=0)
+
+    def test_cached_correlation_missing_key(self):
+        self.phase['pore.temperature'] = 280.0
+        self.phase.add_model(propname='pore.foo',
+                             model=op.models.phase.misc.cached_correlation,
+                             func=g)
+        assert_allclose(self.phase['pore.foo'], 280.0)
+        # Adding the missing key must invalidate the cached result
+        self.phase['pore.scale'] = 2.0
+        self.phase.run_model('pore.foo')
+        assert_allclose(self.phase['pore.foo'], 560.0)
+        del self.phase['pore.scale']
+        self.phase.run_model('pore.foo')
+        assert_allclose(self.phase['pore.foo'], 280.0)
+        del self.phase.models['pore.foo@all']
+        del self.phase['pore.foo']
+
+
+if __name__ == '__main__':
+
+    t = CachedCorrelationTest()
+    self = t
+    t.setup_class()
+    for item in t.__dir__():
+        if item.startswith('test'):
+            print('running test: '+item)
+            t.__getattribute__(item)()
@@ -37,6 +37,20 @@ class HydraulicConductanceTest:
         del self.net["throat.hydraulic_size_factors"]
         # del self.phase['throat.g_hydraulic_conductance']
 
+    def test_generic_hydraulic_compiled(self):
+        self.net['throat.hydraulic_size_factors'] = self.size_factors
+        self.phase['pore.viscosity'] = np.linspace(1e-5, 2e-5, self.net.Np)
+        mod = op.models.physics.hydraulic_conductance.generic_hydraulic
+        desired = mod(self.phase)
+        ws = op.Workspace()
+        ws.settings.compiled_models = True
+        try:
+            assert_allclose(mod(self.phase), desired)
+        finally:
+            ws.settings.compiled_models = False
+            self.phase['pore.viscosity'] = 1e-5
+            del self.net["throat.hydraulic_size_factors"]
+
     def test_hagen_poiseuille(self):
         self.net['throat.hydraulic_size_factors'] = self.size_factors
         mod = op.models.physics.hydraulic_conductance.hagen_poiseuille
@@ -120,13 +120,48 @@ class CubicTest:
             with pytest.raises(Exception):
                 _ = op.network.Cubic(shape=[3, 4, 5], connectivity=x)
 
+    def test_lattice(self):
+        net = op.network.Cubic(shape=[3, 4])
+        assert net.lattice['shape'] == [3, 4, 1]
+        assert net.lattice['connectivity'] == 6
+        im = np.ones([3, 4, 5], dtype=bool)
+        im[0, 0, 0] = False
+        net = op.network.CubicTemplate(template=im)
+        assert net.lattice['mask'].sum() == net.Np
+        # Altering the topology invalidates the lattice
+        op.topotools.trim(network=net, throats=[0])
+        assert net.lattice is None
+        net = op.network.Cubic(shape=[3, 4, 5])
+        net.add_boundary_pores(labels=['left'])
+        assert net.lattice is None
+        assert op.network.Network(conns=net.conns).lattice is None
+
+    def test_memmap(self, tmpdir):
+        for shape in [[3, 4, 5], [3, 4]]:
+            net1 = op.network.Cubic(shape=shape, connectivity=26)
+            net2 = op.network.Cubic(shape=shape, connectivity=26,
+                                    memmap_dir=str(tmpdir))
+            assert sorted(net1.keys()) == sorted(net2.keys())
+            for k in net1.keys():
+                assert isinstance(net2[k], np.memmap)
+                assert np.all(net1[k] == net2[k])
+        # Properties written later are also memory-mapped
+        net2['pore.diameter'] = 1.0
+        net2['throat.diameter'] = np.arange(net2.Nt)
+        assert isinstance(net2['pore.diameter'], np.memmap)
+        assert isinstance(net2['throat.diameter'], np.memmap)
+        assert net2['throat.diameter'][-1] == net2.Nt - 1
 
-if __name__ == '__main__':
 
+if __name__ == '__main__':
+    import py
     t = CubicTest()
     t.setup_class()
     self = t
     for item in t.__dir__():
         if item.startswith('test'):
             print(f'Running test: {item}')
-            t.__getattribute__(item)()
+            try:
+                t.__getattribute__(item)()
+            except TypeError:
+                t.__getattribute__(item)(tmpdir=py.path.local())
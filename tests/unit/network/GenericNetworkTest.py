@@ -106,6 +106,17 @@ class NetworkTest:
         a = self.net.find_neighbor_throats(pores=Pind)
         assert np.all(a == [0, 1, 900, 901, 1800, 1801])
 
+    def test_find_neighbor_throats_matches_skgraph(self):
+        from openpnm._skgraph.queries import find_neighbor_edges
+        g = {'edge.conns': self.net.conns, 'node.coords': self.net.coords}
+        for mode in ['or', 'xor', 'xnor', 'and']:
+            for Ps in [[0, 1], [0, 11, 11], [5]]:
+                a = self.net.find_neighbor_throats(pores=Ps, mode=mode)
+                b = find_neighbor_edges(g, inds=Ps, logic=mode)
+                assert np.all(a == b)
+        a = self.net.find_neighbor_throats(pores=[0, 1], mode='and')
+        assert np.all(a == [0])
+
     def test_find_neighbor_throats_numeric_union(self):
         a = self.net.find_neighbor_throats(pores=[0, 2], mode='union')
         assert np.all(a == [0, 1, 2, 900, 902, 1800, 1802])
@@ -180,6 +191,44 @@ class NetworkTest:
         assert np.size(a) == 17
         assert np.all(np.in1d([0, 1], a))
 
+    def test_spatial_index(self):
+        net = op.network.Cubic(shape=[4, 4, 4])
+        index = net.spatial_index
+        assert net.spatial_index is index
+        indptr, indices = index.query_radius(net.coords[[0, 63]], r=1)
+        assert np.all(np.diff(indptr) == 4)
+        assert np.all(indices[:4] == [0, 1, 4, 16])
+        d, i = index.query_knn(net.coords[[0]] + 0.1, k=2)
+        assert i[0, 0] == 0
+        indptr, indices = index.query_box([[0, 0, 0], [1, 1, 1]],
+                                          [[1, 1, 1], [2.5, 1.5, 1.5]])
+        assert np.all(indices[indptr[0]:indptr[1]] == [0])
+        assert np.all(indices[indptr[1]:indptr[2]] == [21, 37])
+        # Boxes of very different sizes are each searched correctly
+        lo = np.vstack((net.coords[:10] - 0.1, [[-1, -1, -1]]))
+        hi = np.vstack((net.coords[:10] + 0.1, [[9, 9, 9]]))
+        indptr, indices = index.query_box(lo, hi)
+        assert np.all(indices[:indptr[10]] == np.arange(10))
+        assert np.all(indices[indptr[10]:] == net.Ps)
+        indptr, indices = index.query_box(np.zeros((0, 3)), np.zeros((0, 3)))
+        assert indptr.tolist() == [0] and indices.size == 0
+        assert index.query_pairs(r=1).shape == (net.Nt, 2)
+        # Writing new coordinates rebuilds the index
+        net['pore.coords'] = net.coords*2
+        assert net.spatial_index is not index
+        assert net.find_nearby_pores(pores=0, r=1)[0].size == 0
+
+    def test_get_neighbor_lists(self):
+        net = op.network.Cubic(shape=[3, 3, 1])
+        indptr, indices = net.get_neighbor_lists(element='pore')
+        assert np.all(indices[indptr[4]:indptr[5]] == [1, 3, 5, 7])
+        assert net.get_neighbor_lists(element='pore')[1] is indices
+        indptr, indices = net.get_neighbor_lists(element='throat')
+        Ts = net.find_neighbor_throats(pores=4, flatten=False)[0]
+        assert np.all(indices[indptr[4]:indptr[5]] == Ts)
+        Ps = net.find_neighbor_pores(pores=[0, 1], mode='xnor')
+        assert np.all(Ps == [4])
+
     def test_get_incidence_matrix(self):
         net = op.network.Demo([4, 4, 1])
         assert net._im == {}
@@ -202,6 +251,31 @@ class NetworkTest:
         assert len(am.keys()) == 48
         assert len(net._am) == 2
 
+    def test_matrices_updated_with_topology(self):
+        net = op.network.Cubic(shape=[3, 3, 3])
+        am, im = net.am, net.im
+        op.topotools.extend(network=net, conns=[[0, 26]])
+        assert net.am is not am
+        assert net.am.nnz == am.nnz + 2
+        assert net.im.shape == (27, net.Nt)
+        net['throat.conns'] = net.conns[:-1]
+        assert net.am.nnz == am.nnz
+        assert np.all(net.num_neighbors(pores=[0, 26]) == [3, 3])
+
+    def test_create_adjacency_matrix_csr(self):
+        net = op.network.Cubic(shape=[4, 3, 2], connectivity=26)
+        w = np.random.rand(net.Nt, 2)
+        for weights in [None, w[:, 0], w, w.flatten(order='F')]:
+            for triu in [False, True]:
+                if (triu is True) and (np.size(weights) == 2*net.Nt):
+                    continue
+                a = net.create_adjacency_matrix(weights=weights, fmt='csr',
+                                                triu=triu)
+                b = net.create_adjacency_matrix(weights=weights, fmt='coo',
+                                                triu=triu).tocsr()
+                assert a.dtype == b.dtype
+                assert (a != b).nnz == 0
+
 
 if __name__ == '__main__':
 
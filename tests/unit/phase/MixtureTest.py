@@ -135,6 +135,44 @@ class MixtureTest:
         assert not np.all(mu3 == mu4)
         assert not np.all(mu2 == mu4)
 
+    def test_get_mix_vals_after_changes(self):
+        net = op.network.Demo()
+        ch4 = op.phase.StandardGas(network=net, species='ch4')
+        co2 = op.phase.StandardGas(network=net, species='co2')
+        mix = op.phase.GasMixture(network=net, components=[ch4, co2])
+
+        def mixed():
+            x1 = mix['pore.mole_fraction.' + ch4.name]
+            x2 = mix['pore.mole_fraction.' + co2.name]
+            return x1*ch4['pore.viscosity'] + x2*co2['pore.viscosity']
+
+        mix.y(ch4.name, 0.5)
+        mix.y(co2.name, 0.5)
+        mu1 = mix.get_mix_vals('pore.viscosity')
+        np.testing.assert_allclose(mu1, mixed())
+        with pytest.raises(Exception, match='Unrecognized mode'):
+            mix.get_mix_vals('pore.viscosity', mode='foo')
+        with pytest.raises(Exception, match='Unrecognized mode'):
+            op.models.phase.mixtures.mixing_rule(
+                mix, prop='pore.viscosity', mode='foo')
+        # Changing a mole fraction or a component property is seen
+        mix.y(ch4.name, np.linspace(0, 1, net.Np))
+        mix.y(co2.name, np.linspace(1, 0, net.Np))
+        np.testing.assert_allclose(mix.get_mix_vals('pore.viscosity'), mixed())
+        co2['pore.temperature'] = 350.0
+        co2.regenerate_models()
+        np.testing.assert_allclose(mix.get_mix_vals('pore.viscosity'), mixed())
+        # In-place writes are seen too
+        mix['pore.mole_fraction.' + ch4.name][:] = 0.25
+        mix['pore.mole_fraction.' + co2.name][:] = 0.75
+        np.testing.assert_allclose(mix.get_mix_vals('pore.viscosity'), mixed())
+        co2['pore.viscosity'][:] = 5e-5
+        np.testing.assert_allclose(mix.get_mix_vals('pore.viscosity'), mixed())
+        # As is removing a component
+        mix.remove_comp(co2)
+        mu2 = mix.get_mix_vals('pore.viscosity')
+        np.testing.assert_allclose(mu2, 0.25*ch4['pore.viscosity'])
+
     def test_regenerate_components(self):
         net = op.network.Demo()
         o2 = op.phase.StandardGas(network=net, species='o2', name='pure_O2')
@@ -251,6 +251,55 @@ class MultiPhaseTest:
         # Check if K_global is correctly populated after models were added
         assert_allclose(m.K, [1., 1/0.7, 1., 1.1, 1])
 
+    def test_interleave_data_after_changes(self):
+        net = op.network.Cubic([6, 1, 1])
+        water = op.phase.Water(network=net)
+        oil = op.phase.Water(network=net)
+        water['pore.foo'] = 1.0
+        oil['pore.foo'] = 2.0
+        m = op.contrib.MultiPhase(network=net, phases=[water, oil])
+        m.set_occupancy(water, pores=[0, 1, 2])
+        m.set_occupancy(oil, pores=[3, 4])
+        assert_allclose(m['pore.foo'], [1, 1, 1, 2, 2, 0])
+        # Changes to the occupancy or the phases are seen
+        m.set_occupancy(oil, pores=[5])
+        assert_allclose(m['pore.foo'], [1, 1, 1, 2, 2, 2])
+        water['pore.foo'] = 3.0
+        assert_allclose(m['pore.foo'], [3, 3, 3, 2, 2, 2])
+        # Partial occupancy is weighted
+        m.set_occupancy(water, pores=[5], values=0.5)
+        m.set_occupancy(oil, pores=[5], values=0.5)
+        assert_allclose(m['pore.foo'], [3, 3, 3, 2, 2, 2.5])
+        # Including those written in-place
+        oil['pore.foo'][:] = 5.0
+        m['pore.occupancy.' + water.name][:2] = 0
+        m['pore.occupancy.' + oil.name][:2] = 1
+        assert_allclose(m['pore.foo'], [5, 5, 3, 5, 5, 4])
+        # Invalid values are not hidden by a zero occupancy
+        water['pore.bar'] = np.nan
+        oil['pore.bar'] = 1.0
+        assert np.all(np.isnan(m['pore.bar']))
+
+    def test_partition_coef_global_after_occupancy_change(self):
+        net = op.network.Cubic([6, 1, 1])
+        water = op.phase.Water(network=net)
+        oil = op.phase.Water(network=net)
+        m = op.contrib.MultiPhase(network=net, phases=[water, oil])
+        m.set_occupancy(water, pores=[0, 1, 2])
+        m.set_occupancy(oil, pores=[3, 4, 5])
+        m.set_binary_partition_coef([water, oil], model=constant, value=0.5)
+        assert_allclose(m.K, [1, 1, 0.5, 1, 1])
+        # Move the interface one pore to the right
+        m.set_occupancy(water, pores=[3], values=1)
+        m.set_occupancy(oil, pores=[3], values=0)
+        assert_allclose(m.K, [1, 1, 1, 0.5, 1])
+        assert_allclose(m["throat.partition_coef.global"], m.K)
+        # In-place changes to the occupancy and coefficients are also seen
+        m['pore.occupancy.' + water.name][4] = 1
+        m['pore.occupancy.' + oil.name][4] = 0
+        m['throat.partition_coef.' + water.name + ':' + oil.name][:] = 0.25
+        assert_allclose(m.K, [1, 1, 1, 1, 0.25])
+
 
 if __name__ == '__main__':
 
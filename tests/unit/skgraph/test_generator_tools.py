@@ -5,6 +5,7 @@ import matplotlib.pyplot as plt
 from openpnm._skgraph import generators as gen
 from openpnm._skgraph import tools
 from numpy.testing import assert_allclose
+from scipy.spatial import Voronoi
 
 
 class SKGRGeneratorToolsTest:
@@ -68,6 +69,20 @@ class SKGRGeneratorToolsTest:
         pt = gen.tools.get_centroid(pts, mode='fast')
         assert_allclose(pt, [0.5, 0.5, 0.25], rtol=1e-12)
 
+    def test_lloyd_relaxation(self):
+        np.random.seed(0)
+        for shape in ([1, 1, 1], [1, 1, 0]):
+            pts = gen.tools.generate_base_points(20, shape, reflect=True)
+            mask = ~np.all(pts == 0, axis=0)
+            vor = Voronoi(pts[:, mask])
+            for mode in ['rigorous', 'fast']:
+                new = gen.tools.lloyd_relaxation(vor, mode=mode)
+                for i in range(20):
+                    region = vor.regions[vor.point_region[i]]
+                    pt = gen.tools.get_centroid(vor.vertices[region],
+                                                mode=mode)
+                    assert_allclose(new[i, mask], pt, rtol=1e-8)
+
     def test_parse_points(self):
         pts = gen.tools.parse_points(shape=[1, 1, 1], points=10)
         assert pts.shape == (10, 3)
@@ -150,6 +150,27 @@ class SKGRGeneratorsTest:
         assert net['node.coords'].shape[0] == 125
         assert net['edge.conns'].shape[0] == 601
 
+    def test_voronoi_delaunay_dual_tiled(self):
+        for shape in ([1, 1, 1], [2, 1, 0]):
+            np.random.seed(0)
+            points = gen.tools.generate_base_points(200, shape, reflect=False)
+            net1, _, _ = gen.voronoi_delaunay_dual(points=points, shape=shape)
+            net2, vor, tri = gen.voronoi_delaunay_dual(points=points,
+                                                       shape=shape,
+                                                       tiles=3,
+                                                       processes=1)
+            assert vor is None and tri is None
+            for k in ['node.coords', 'edge.conns']:
+                assert net1[k].shape == net2[k].shape
+            assert np.all(net2['node.delaunay'] == net1['node.delaunay'])
+            # Delaunay nodes and their connections are numbered the same
+            Ps = np.where(net1['node.delaunay'])[0]
+            assert np.allclose(net1['node.coords'][Ps],
+                               net2['node.coords'][Ps])
+            c1 = net1['edge.conns'][np.all(np.isin(net1['edge.conns'], Ps), 1)]
+            c2 = net2['edge.conns'][np.all(np.isin(net2['edge.conns'], Ps), 1)]
+            assert np.all(c1 == c2)
+
     def test_cubic_template(self):
         im = np.ones([50, 50], dtype=bool)
         im[25:30, 25:40] = False
@@ -38,8 +38,10 @@ class SKGRQueriesTest:
         assert np.all(c == [0, 1, 2])
         c = queries.find_neighbor_edges(network=g, inds=[0, 2, 4], logic='xnor')
         assert np.all(c == [3, 5])
-        with pytest.raises(Exception):
-            _ = queries.find_neighbor_edges(network=g, inds=[0, 2, 4], logic='and')
+        c = queries.find_neighbor_edges(network=g, inds=[0, 2, 4], logic='and')
+        assert np.all(c == [])
+        c = queries.find_neighbor_edges(network=g, inds=[0, 1], logic='and')
+        assert np.all(c == [0])
 
     def test_find_neighbor_edges_directed(self):
         g = cubic(shape=[3, 2, 1])
@@ -52,8 +54,13 @@ class SKGRQueriesTest:
         assert np.all(c == [2, 3, 4, 5])
         c = queries.find_neighbor_edges(network=g, inds=[0, 1, 4], logic='xnor')
         assert np.all(c == [0, 1])
-        with pytest.raises(Exception):
-            _ = queries.find_neighbor_edges(network=g, inds=[0, 2, 4], logic='and')
+        c = queries.find_neighbor_edges(network=g, inds=[0, 2, 4], logic='and')
+        assert np.all(c == [])
+        c = queries.find_neighbor_edges(network=g, inds=[0, 1], logic='and')
+        assert np.all(c == [0, 1])
+        c = queries.find_neighbor_edges(network=g, inds=[0, 1], flatten=False)
+        assert np.all(c[0] == [0, 1, 3])
+        assert np.all(c[1] == [0, 1, 4])
 
     def test_find_neighbor_nodes_undirected(self):
         g = cubic(shape=[3, 2, 1])
@@ -226,6 +233,39 @@ class SKGRQueriesTest:
         assert p['edge_paths'][0] == []
         assert p['edge_paths'][1] == [0]
 
+    def test_neighbors_from_csr(self):
+        indptr = np.array([0, 2, 5, 6, 6])
+        indices = np.array([1, 2, 0, 2, 3, 1])
+        c = queries.neighbors_from_csr(indptr, indices, [0, 1], logic='or')
+        assert np.all(c == [0, 1, 2, 3])
+        c = queries.neighbors_from_csr(indptr, indices, [0, 1], logic='xor')
+        assert np.all(c == [0, 1, 3])
+        c = queries.neighbors_from_csr(indptr, indices, [0, 1], logic='and')
+        assert np.all(c == [2])
+        c = queries.neighbors_from_csr(indptr, indices, [0, 1], logic='or',
+                                       exclude=[0, 1])
+        assert np.all(c == [2, 3])
+        c = queries.neighbors_from_csr(indptr, indices, [0, 3], logic='or',
+                                       flatten=False)
+        assert np.all(c[0] == [1, 2])
+        assert c[1].size == 0
+        with pytest.raises(Exception):
+            _ = queries.neighbors_from_csr(indptr, indices, [0], logic='foo')
+
+    def test_segment_reduce(self):
+        indptr = np.array([0, 2, 2, 5])
+        vals = np.array([1.0, 3.0, 2.0, np.nan, 4.0])
+        assert_allclose(queries.segment_reduce(indptr, vals, mode='min'),
+                        [1, np.inf, 2])
+        assert_allclose(queries.segment_reduce(indptr, vals, mode='max'),
+                        [3, -np.inf, 4])
+        assert_allclose(queries.segment_reduce(indptr, vals, mode='sum'),
+                        [4, 0, 6])
+        assert_allclose(queries.segment_reduce(indptr, vals, mode='mean'),
+                        [2, np.nan, 3])
+        r = queries.segment_reduce(indptr, vals, mode='sum', ignore_nans=False)
+        assert np.isnan(r[2])
+
 
 if __name__ == '__main__':
     t = SKGRQueriesTest()
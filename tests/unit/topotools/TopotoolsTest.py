@@ -162,6 +162,28 @@ class TopotoolsTest:
         assert 'pore.test1' not in net2
         assert 'pore.test2' not in net2
 
+    def test_ensemble(self):
+        pn = op.network.Cubic(shape=[4, 4, 1])
+        pn['pore.test'] = np.arange(pn.Np)
+        pn['throat.vals'] = np.ones((pn.Nt, 2))
+        pn.add_model_collection(
+            op.models.collections.geometry.spheres_and_cylinders)
+        ens = op.topotools.ensemble(pn, n=5)
+        assert ens.Np == 5*pn.Np
+        assert ens.Nt == 5*pn.Nt
+        assert ens.project is not pn.project
+        assert np.all(ens['pore.test'].reshape(5, -1) == pn['pore.test'])
+        assert ens['throat.vals'].shape == (ens.Nt, 2)
+        assert ens.num_pores('left') == 5*pn.num_pores('left')
+        assert np.all(ens.conns[pn.Nt:2*pn.Nt] == pn.conns + pn.Np)
+        # Each realization draws its own seeds
+        ens.regenerate_models()
+        D = ens['pore.diameter'].reshape(5, -1)
+        assert not np.all(D[0] == D[1])
+        # The realizations are disconnected but each touches the BCs
+        assert not op.topotools.is_fully_connected(ens)
+        assert op.topotools.is_fully_connected(ens, ens.pores('left'))
+
     def test_merge_networks_with_active_geometries(self):
         pn = op.network.Cubic(shape=[3, 3, 3], name='net_01')
         pn2 = op.network.Cubic(shape=[3, 3, 3], name='net_02')
@@ -179,6 +201,51 @@ class TopotoolsTest:
         topotools.merge_pores(testnet, to_merge)
         assert testnet.Np == 998
 
+    def test_edit_matches_immediate_edits(self):
+        def edits(net):
+            topotools.connect_pores(net, pores1=[0, 1], pores2=[55])
+            topotools.add_boundary_pores(net, pores=net.pores('left'),
+                                         offset=[-0.5, 0, 0])
+            topotools.clone_pores(net, pores=[5, 6], labels='copy')
+            topotools.trim(net, pores=[10, 11])
+            topotools.trim(net, throats=[0])
+        net1 = op.network.Cubic(shape=[5, 5, 5])
+        net1['pore.values'] = np.arange(net1.Np, dtype=float)
+        net2 = op.network.Cubic(shape=[5, 5, 5])
+        net2['pore.values'] = np.arange(net2.Np, dtype=float)
+        # Trimming renumbers pores so apply the deletions last
+        edits(net1)
+        with topotools.edit(net2) as e:
+            edits(net2)
+            assert net2.Np == 125
+            assert e.Np == 125 + 25 + 2
+        assert net1.Np == net2.Np
+        assert np.all(net1.conns == net2.conns)
+        assert np.allclose(net1.coords, net2.coords)
+        assert set(net1.keys()) == set(net2.keys())
+        for k in net1.keys():
+            assert np.array_equal(net1[k], net2[k], equal_nan=True)
+
+    def test_edit_discards_edits_on_error(self):
+        net = op.network.Cubic(shape=[3, 3, 3])
+        with pytest.raises(Exception):
+            with topotools.edit(net):
+                topotools.trim(net, pores=[0])
+                raise Exception('Abort')
+        assert net.Np == 27
+        assert net._edit_session is None
+
+    def test_edit_trim_pending_pores(self):
+        net = op.network.Cubic(shape=[3, 3, 3])
+        with topotools.edit(net) as e:
+            Ps, Ts = e.extend(coords=[[5, 5, 5], [6, 6, 6]], conns=[[0, 27]])
+            e.trim(pores=Ps[1:])
+            with pytest.raises(Exception):
+                e.trim(pores=[30])
+        assert net.Np == 28
+        assert net.Nt == 55
+        assert np.all(net.conns[-1] == [0, 27])
+
     def test_connect_pores(self):
         testnet = op.network.Cubic(shape=[10, 10, 10])
         Nt_old = testnet.Nt
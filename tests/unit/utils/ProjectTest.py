@@ -319,6 +319,91 @@ class ProjectTest:
         b = self.proj[a.name]
         assert a is b
 
+    def test_getitem_after_rename(self):
+        pn = op.network.Cubic(shape=[2, 2, 2])
+        air = op.phase.Phase(network=pn, name='air')
+        proj = pn.project
+        air.name = 'gas'
+        assert proj['gas'] is air
+        with pytest.raises(KeyError):
+            _ = proj['air']
+
+    def test_project_back_references(self):
+        pn = op.network.Cubic(shape=[2, 2, 2])
+        air = op.phase.Phase(network=pn)
+        proj = pn.project
+        assert air.project is proj
+        assert air.network is pn
+        # Slicing a project creates a new one which must not take ownership
+        _ = proj[::-1]
+        assert air.project is proj
+        proj2 = proj.copy()
+        assert proj2.network is not pn
+        assert proj2.network.project is proj2
+        assert proj2[air.name].network is proj2.network
+        mod = pn.models['pore.coordination_number@all']
+        assert mod.target is pn
+        assert mod.name == 'pore.coordination_number@all'
+
+    def test_checkpoint(self, tmpdir):
+        pn = op.network.Cubic(shape=[3, 3, 3])
+        air = op.phase.Phase(network=pn)
+        proj = pn.project
+        path = tmpdir.join('checkpoints')
+        f1 = proj.checkpoint(path)
+        air['pore.foo'] = 1.0
+        pn['pore.coords'] = pn.coords*2
+        f2 = proj.checkpoint(path)
+        assert os.path.getsize(f2) < os.path.getsize(f1)
+        new = self.ws.load_checkpoint(path)
+        assert new is not proj
+        assert new.names == proj.names
+        assert np.all(new.network.coords == pn.coords)
+        assert np.all(new[air.name]['pore.foo'] == 1.0)
+        assert new[air.name].network is new.network
+        # Continue checkpointing the restored project in the same folder
+        new[air.name]['pore.foo'] = 2.0
+        new.checkpoint(path)
+        assert len(os.listdir(path)) == 3
+        newer = self.ws.load_checkpoint(path)
+        assert np.all(newer[air.name]['pore.foo'] == 2.0)
+        # A full checkpoint replaces all previous ones
+        newer.checkpoint(path, full=True)
+        assert len(os.listdir(path)) == 1
+
+    def test_checkpoint_size_tracks_changed_arrays(self, tmpdir):
+        pn = op.network.Cubic(shape=[20, 20, 20])
+        pn.add_model_collection(
+            op.models.collections.geometry.spheres_and_cylinders)
+        pn.regenerate_models()
+        phase = op.phase.Phase(network=pn)
+        phase['pore.diffusivity'] = 1e-9
+        phase.add_model_collection(op.models.collections.physics.basic)
+        phase.regenerate_models()
+        fd = op.algorithms.FickianDiffusion(network=pn, phase=phase)
+        fd.set_value_BC(pn.pores('left'), 1.0)
+        fd.set_value_BC(pn.pores('right'), 0.0)
+        fd.run()
+        # Build some of the derived data held on the objects
+        pn.find_neighbor_pores(pores=[0])
+        pn.get_conduit_data('diameter')
+        proj = pn.project
+        path = tmpdir.join('checkpoints')
+        proj.checkpoint(path)
+        # Nothing changed, so only the settings and models are written
+        f1 = proj.checkpoint(path)
+        assert os.path.getsize(f1) < pn.Np*8
+        # Only the changed array is written, not the solution or the matrices
+        phase['pore.foo'] = np.random.rand(pn.Np)
+        f2 = proj.checkpoint(path)
+        size = os.path.getsize(f2) - os.path.getsize(f1)
+        assert phase['pore.foo'].nbytes <= size < 1.1*phase['pore.foo'].nbytes
+        new = self.ws.load_checkpoint(path)
+        x = new[fd.name].soln['pore.concentration']
+        assert np.allclose(x, fd.soln['pore.concentration'])
+        new[fd.name].run()
+        assert np.allclose(new[fd.name].x, fd.x)
+
     # def test_save_and_load_object(self):
     #     proj = self.proj
     #     name = proj.network.name
@@ -376,10 +461,15 @@ class ProjectTest:
 
 if __name__ == '__main__':
 
+    import py
+
     t = ProjectTest()
     self = t
     t.setup_class()
     for item in t.__dir__():
         if item.startswith('test'):
             print('running test: '+item)
-            t.__getattribute__(item)()
+            try:
+                t.__getattribute__(item)()
+            except TypeError:
+                t.__getattribute__(item)(tmpdir=py.path.local())
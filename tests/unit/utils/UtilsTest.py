@@ -94,6 +94,37 @@ class UtilsTest:
         assert not op.utils.is_valid_propname("throat.")
         assert not op.utils.is_valid_propname("pore.foo..bar")
 
+    def test_lazy_import(self):
+        import os
+        import sys
+        import subprocess
+        code = ("import sys, openpnm as op; op.network.Cubic([3, 3, 3]); "
+                "print([m for m in ['numba', 'pandas', 'matplotlib'] "
+                "if m in sys.modules])")
+        root = os.path.dirname(os.path.dirname(op.__file__))
+        out = subprocess.run([sys.executable, '-c', code], cwd=root,
+                             capture_output=True, text=True)
+        assert out.stdout.strip() == '[]'
+        assert 'visualization' in dir(op)
+        assert op.visualization.plot_connections is not None
+
+    def test_lazy_import_each_subpackage_cold(self):
+        import os
+        import sys
+        import subprocess
+        root = os.path.dirname(os.path.dirname(op.__file__))
+        for name in op._submodules:
+            for code in [f"import openpnm as op; op.{name}",
+                         f"import openpnm.{name}"]:
+                out = subprocess.run([sys.executable, '-c', code], cwd=root,
+                                     capture_output=True, text=True)
+                assert out.returncode == 0, out.stderr
+        code = ("import openpnm as op; op.integrators.ScipyRK45; "
+                "from openpnm.contrib import MultiPhase")
+        out = subprocess.run([sys.executable, '-c', code], cwd=root,
+                             capture_output=True, text=True)
+        assert out.returncode == 0, out.stderr
+
 
 if __name__ == '__main__':
 
@@ -75,6 +75,24 @@ class PlotToolsTest:
                                                max_dim=500)
         assert im.shape[0] == 500
 
+    def test_generate_voxel_image_labels(self):
+        pn = op.network.Cubic(shape=[3, 3, 3], spacing=1.0)
+        pn['pore.diameter'] = 0.5
+        pn['throat.diameter'] = 0.2
+        coords = pn.coords.copy()
+        im = op.visualization.generate_voxel_image(network=pn, max_dim=90)
+        assert im.shape == (90, 90, 90)
+        # Pore centers are at x = 15, 45, 75 and throats are in between
+        assert np.all(im[[15, 45, 75], 15, 15] == 1)
+        assert np.all(im[[30, 60], 15, 15] == 2)
+        assert np.all(im[[0, 89], 15, 15] == 0)
+        assert np.all(im[:, 0, 0] == 0)
+        assert np.all(im[30, 30, :] == 0)
+        assert np.all(pn.coords == coords)
+        im = op.visualization.generate_voxel_image(network=pn, max_dim=90,
+                                                   pore_shape='cube')
+        assert im[15 + 7, 15 + 7, 15 + 7] == 1
+
     def test_plot_connections_color_by(self):
         pn = op.network.Cubic(shape=[5, 5, 1])
         np.random.seed(10)
@@ -105,6 +123,63 @@ class PlotToolsTest:
         color_calc[:, 3] = 1.0
         assert_allclose(color_calc, colors_im, rtol=1e-5)
 
+    def test_plot_connections_max_elements(self):
+        pn = op.network.Cubic(shape=[20, 20, 1])
+        lc = op.visualization.plot_connections(pn, max_elements=100,
+                                               color_by=pn.Ts*1.0)
+        segs = lc.get_segments()
+        assert 0 < len(segs) <= 100
+        assert len(lc.get_color()) == len(segs)
+        lc = op.visualization.plot_connections(pn, max_elements=None)
+        assert len(lc.get_segments()) == pn.Nt
+        # Every throat is drawn by default
+        lc = op.visualization.plot_connections(pn)
+        assert len(lc.get_segments()) == pn.Nt
+        plt.close('all')
+
+    def test_plot_connections_max_elements_color_scale(self):
+        pn = op.network.Cubic(shape=[20, 20, 1])
+        color_by = pn.Ts*1.0
+        lc = op.visualization.plot_connections(pn, max_elements=100,
+                                               color_by=color_by)
+        # Find the throat drawn by each segment from its midpoint
+        mids = pn['pore.coords'][pn.conns].mean(axis=1)[:, :2]
+        lookup = {tuple(m): i for i, m in enumerate(np.round(mids, 6))}
+        segs = np.array(lc.get_segments()).mean(axis=1)
+        Ts = [lookup[tuple(m)] for m in np.round(segs, 6)]
+        # The colors are scaled by all the throats, not only those drawn
+        color_calc = cm.get_cmap(name='jet')(color_by[Ts] / color_by.max())
+        assert_allclose(lc.get_color(), color_calc, rtol=1e-5)
+        plt.close('all')
+
+    def test_plot_coordinates_max_elements(self):
+        pn = op.network.Cubic(shape=[20, 20, 1])
+        sc = op.visualization.plot_coordinates(pn, max_elements=100,
+                                               size_by=np.ones(pn.Np))
+        xy = sc.get_offsets()
+        assert 0 < len(xy) <= 100
+        # The subsample should still cover the whole network
+        assert np.ptp(xy[:, 0]) > 15
+        assert np.ptp(xy[:, 1]) > 15
+        # Every pore is drawn by default
+        sc = op.visualization.plot_coordinates(pn)
+        assert len(sc.get_offsets()) == pn.Np
+        plt.close('all')
+
+    def test_rasterize_network(self):
+        pn = op.network.Cubic(shape=[5, 5, 1])
+        im, extent = op.visualization.rasterize_network(pn, shape=(9, 9))
+        assert im.shape == (9, 9)
+        assert extent == [0.5, 4.5, 0.5, 4.5]
+        # Pores are on even pixels and each throat covers the pixel between
+        assert im[1, 0] == 1
+        assert im[1, 1] == 0
+        assert im[4, 4] == 4
+        im, extent = op.visualization.rasterize_network(pn, pores=pn.Ps,
+                                                        shape=(9, 9))
+        assert im.sum() == pn.Np
+        assert np.all(im[::2, ::2] == 1)
+
 
 if __name__ == '__main__':
 